@@ -31,7 +31,7 @@ fi
 
 echo "Generating manual..."
 cd "$GENERATOR_DIR"
-uv run generate.py
+uv run generate.py "$@"
 
 echo "Done! Manuals generated in $GENERATOR_DIR/output/"
 
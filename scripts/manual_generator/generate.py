@@ -1,17 +1,17 @@
 import os
 import sys
-import markdown
-from jinja2 import Environment, FileSystemLoader
+import time
 import shutil
+import functools
+import ctypes.util
+import hashlib
+import html
+import re
+import unicodedata
 from pathlib import Path
 
-# Optional PDF support
-try:
-    from weasyprint import HTML
-    HAS_WEASYPRINT = True
-except (ImportError, OSError):
-    HAS_WEASYPRINT = False
-    print("Note: WeasyPrint not available, skipping PDF generation.")
+# markdown, jinja2 and weasyprint are imported inside the functions that use
+# them so importing this module (e.g. to reuse the paths) does not pay for them.
 
 # Paths
 BASE_DIR = Path(__file__).parent
@@ -27,53 +27,145 @@ SPEC_FILES = [
     DOCS_DIR / "specs" / "main.md",
 ]
 
-def generate_manual():
-    # Ensure output directory exists
-    if OUTPUT_DIR.exists():
-        shutil.rmtree(OUTPUT_DIR)
-    OUTPUT_DIR.mkdir()
+@functools.lru_cache(maxsize=None)
+def _jinja_env():
+    """The Jinja2 environment, built once per process.
 
-    # Read and combine all spec files
+    The bytecode cache (in the system temp dir) lets later runs skip parsing
+    and compiling the template. Within a process, auto_reload makes
+    get_template() recheck the source on each call, so template edits are
+    picked up by long-running builds too.
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+
+def _manual_template():
+    """The compiled manual.html template, reloaded if its source changed."""
+    return _jinja_env().get_template("manual.html")
+
+def _build_hash(md_content, pdf):
+    """Hash of everything that feeds the build: the combined markdown, this
+    script, the templates and static files, the public assets (by path,
+    size and mtime, to avoid reading every image) and whether a PDF is built."""
+    digest = hashlib.sha256(md_content.encode("utf-8"))
+    digest.update(b"pdf" if pdf else b"html")
+    digest.update(Path(__file__).read_bytes())
+    for source_dir in (TEMPLATE_DIR, STATIC_DIR):
+        for path in sorted(source_dir.rglob("*")):
+            if path.is_file():
+                digest.update(str(path.relative_to(source_dir)).encode("utf-8"))
+                digest.update(path.read_bytes())
+    if PUBLIC_DIR.exists():
+        for path in sorted(PUBLIC_DIR.rglob("*")):
+            if path.is_file():
+                st = path.stat()
+                digest.update(f"{path.relative_to(PUBLIC_DIR)}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()
+
+_HEADING_RE = re.compile(r"<h([1-6])>(.*?)</h\1>", re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+def _heading_slug(text):
+    """Heading id as the markdown toc extension's default slugify makes it."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = re.sub(r"[^\w\s-]", "", text).strip().lower()
+    return re.sub(r"[-\s]+", "-", text)
+
+def _add_heading_ids(html_content):
+    """Give every heading a toc-style id (repeats get _1, _2, ...) so the
+    spec's in-document links resolve."""
+    used = set()
+
+    def add_id(match):
+        level, inner = match.groups()
+        base = slug = _heading_slug(html.unescape(_TAG_RE.sub("", inner)))
+        n = 1
+        while slug in used:
+            slug = f"{base}_{n}"
+            n += 1
+        used.add(slug)
+        return f'<h{level} id="{slug}">{inner}</h{level}>'
+
+    return _HEADING_RE.sub(add_id, html_content)
+
+def _markdown_to_html(md_content):
+    """Convert the spec to HTML.
+
+    Uses cmarkgfm (GitHub's C cmark) when it is installed, with heading ids
+    added afterwards; otherwise the pure-Python markdown package with the
+    tables, fenced_code and toc extensions.
+    """
+    try:
+        import cmarkgfm
+        from cmarkgfm.cmark import Options
+    except ImportError:
+        import markdown
+        return markdown.markdown(
+            md_content,
+            extensions=['tables', 'fenced_code', 'toc']
+        )
+
+    html_content = cmarkgfm.markdown_to_html_with_extensions(
+        md_content, options=Options.CMARK_OPT_UNSAFE, extensions=["table"]
+    )
+    return _add_heading_ids(html_content)
+
+def _link_or_copy(src, dst):
+    """copytree copy_function: hardlink the file, falling back to a copy where
+    links are not possible (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def _mirror_tree(src, dst):
+    """Replace dst with a hardlinked mirror of src."""
+    if dst.exists():
+        shutil.rmtree(dst)
+    shutil.copytree(src, dst, copy_function=_link_or_copy)
+
+def _read_specs():
+    """Read and combine all spec files, with page breaks between them."""
     md_content_parts = []
     for spec_file in SPEC_FILES:
         if not spec_file.exists():
             print(f"Warning: Spec file not found at {spec_file}, skipping...")
             continue
         
-        with open(spec_file, "r", encoding="utf-8") as f:
-            content = f.read()
-            md_content_parts.append(content)
-            print(f"Loaded: {spec_file.name}")
+        md_content_parts.append(spec_file.read_text(encoding="utf-8"))
+        print(f"Loaded: {spec_file.name}")
     
     if not md_content_parts:
         print("Error: No spec files found!")
         sys.exit(1)
     
-    # Combine with page breaks between sections
-    md_content = "\n\n---\n\n".join(md_content_parts)
+    return "\n\n---\n\n".join(md_content_parts)
 
+def build_html(md_content):
+    """HTML phase: convert the spec, link the assets into OUTPUT_DIR and
+    write manual.html. Returns the rendered HTML."""
     # Convert Markdown to HTML
-    # Using extensions for tables, etc.
-    html_content = markdown.markdown(
-        md_content,
-        extensions=['tables', 'fenced_code', 'toc']
-    )
+    html_content = _markdown_to_html(md_content)
 
-    # Prepare Jinja2 environment
-    env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
-    template = env.get_template("manual.html")
+    # Prepare Jinja2 template
+    template = _manual_template()
 
     # Image handling: 
     # WeasyPrint needs file:// paths or absolute paths for local images if not served.
     # We will copy images to output folder for the HTML version, 
     # and provide absolute paths for WeasyPrint if needed.
     
-    # Copy public assets to output
+    # Link public assets into output (nothing writes to them, so hardlinks
+    # save copying every image)
     if PUBLIC_DIR.exists():
-        shutil.copytree(PUBLIC_DIR, OUTPUT_DIR / "images")
+        _mirror_tree(PUBLIC_DIR, OUTPUT_DIR / "images")
 
-    # Copy static assets (css)
-    shutil.copytree(STATIC_DIR, OUTPUT_DIR / "static")
+    # Link static assets (css)
+    _mirror_tree(STATIC_DIR, OUTPUT_DIR / "static")
 
     # Data for template
     context = {
@@ -87,24 +179,135 @@ def generate_manual():
     # Render HTML
     rendered_html = template.render(context)
     html_output_path = OUTPUT_DIR / "manual.html"
+    html_output_path.write_text(rendered_html, encoding="utf-8")
+
+    print(f"Generated HTML at {html_output_path}")
+    return rendered_html
+
+def build_pdf(rendered_html, HTML):
+    """PDF phase: render the manual HTML to manual.pdf with WeasyPrint's
+    HTML class."""
+    # WeasyPrint (>= 61) subsets embedded fonts through HarfBuzz when
+    # libharfbuzz-subset is installed, otherwise through fontTools.
+    if ctypes.util.find_library("harfbuzz-subset") is None:
+        print("Note: libharfbuzz-subset not found, font subsetting will use the slower fontTools path.")
+
+    pdf_output_path = OUTPUT_DIR / "manual.pdf"
     
-    with open(html_output_path, "w", encoding="utf-8") as f:
-        f.write(rendered_html)
+    # WeasyPrint needs a base_url to find relative resources (images, css)
+    # relative to the HTML file location.
+    HTML(string=rendered_html, base_url=str(OUTPUT_DIR)).write_pdf(pdf_output_path)
     
-    print(f"Generated HTML at {html_output_path}")
+    print(f"Generated PDF at {pdf_output_path}")
 
-    # Generate PDF (if WeasyPrint is available)
-    if HAS_WEASYPRINT:
-        pdf_output_path = OUTPUT_DIR / "manual.pdf"
-        
-        # WeasyPrint needs a base_url to find relative resources (images, css)
-        # relative to the HTML file location.
-        HTML(string=rendered_html, base_url=str(OUTPUT_DIR)).write_pdf(pdf_output_path)
-        
-        print(f"Generated PDF at {pdf_output_path}")
+def _load_weasyprint():
+    """WeasyPrint's HTML class, or None when WeasyPrint or its system
+    libraries are not available. Only called when a PDF is wanted, since the
+    import (cairo, pango, fontconfig) is the slowest part of start-up."""
+    try:
+        from weasyprint import HTML
+    except (ImportError, OSError):
+        return None
+    return HTML
+
+def generate_manual(pdf=True):
+    # Optional PDF support
+    HTML = _load_weasyprint() if pdf else None
+    if pdf and HTML is None:
+        print("Note: WeasyPrint not available, skipping PDF generation.")
+
+    md_content = _read_specs()
+
+    # Skip the build when nothing has changed since the last one
+    build_hash = _build_hash(md_content, pdf=HTML is not None)
+    hash_path = OUTPUT_DIR / ".build_hash"
+    outputs = [OUTPUT_DIR / "manual.html"]
+    if HTML is not None:
+        outputs.append(OUTPUT_DIR / "manual.pdf")
+    if (hash_path.exists() and hash_path.read_text(encoding="utf-8") == build_hash
+            and all(path.exists() for path in outputs)):
+        print(f"Manual is up to date in {OUTPUT_DIR}")
+        return
+
+    # Ensure output directory exists; the outputs are overwritten in place and
+    # the stale hash is dropped until this build completes
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    if hash_path.exists():
+        hash_path.unlink()
+
+    rendered_html = build_html(md_content)
+
+    # Generate PDF (if wanted and WeasyPrint is available). A PDF from an
+    # earlier build no longer matches the HTML, so it is removed when skipped.
+    if HTML is not None:
+        build_pdf(rendered_html, HTML)
     else:
-        print("PDF generation skipped (install WeasyPrint + system libraries for PDF support)")
+        (OUTPUT_DIR / "manual.pdf").unlink(missing_ok=True)
+        if pdf:
+            print("PDF generation skipped (install WeasyPrint + system libraries for PDF support)")
+        else:
+            print("PDF generation skipped (--no-pdf)")
 
-if __name__ == "__main__":
-    generate_manual()
+    hash_path.write_text(build_hash, encoding="utf-8")
 
+def _input_stamp():
+    """Modification times of every build input, to notice edits in watch mode.
+
+    This script is left out: the running watcher keeps its old code, so
+    edits to it need a restart rather than a rebuild.
+    """
+    paths = list(SPEC_FILES)
+    for source_dir in (TEMPLATE_DIR, STATIC_DIR, PUBLIC_DIR):
+        if source_dir.exists():
+            paths.extend(sorted(source_dir.rglob("*")))
+    return tuple((str(path), path.stat().st_mtime_ns) for path in paths if path.exists())
+
+def watch_manual(pdf=True, interval=1.0):
+    """Rebuild whenever an input changes. The process stays alive between
+    builds, so markdown, Jinja2 and WeasyPrint (cairo/pango) are imported
+    only once; the template is recompiled only when it is edited."""
+    stamp = None
+    try:
+        while True:
+            try:
+                current = _input_stamp()
+            except OSError:
+                # An input vanished mid-scan; look again on the next tick
+                current = stamp
+            if current != stamp:
+                stamp = current
+                # A broken template or spec mid-edit (or a spec briefly
+                # missing during an atomic save) must not end the watch
+                try:
+                    generate_manual(pdf)
+                except (Exception, SystemExit) as e:
+                    print(f"Build failed: {e!r}")
+                print("Watching for changes (Ctrl-C to stop)...")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the HTML/PDF manual from the markdown spec")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and rebuild whenever the spec, templates or assets change"
+    )
+    parser.add_argument(
+        "--no-pdf",
+        dest="pdf",
+        action="store_false",
+        help="Only build the HTML manual (skips loading WeasyPrint)"
+    )
+    args = parser.parse_args()
+
+    if args.watch:
+        watch_manual(args.pdf)
+    else:
+        generate_manual(args.pdf)
+
+if __name__ == "__main__":
+    main()
@@ -22,15 +22,19 @@ Output:
 import subprocess
 import csv
 import io
-import json
-import argparse
 import math
+import functools
+import itertools
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
 from typing import Optional
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
+# json/orjson and argparse are imported where they are used, so importing
+# this module for its metrics helpers does not pay for them.
+
 
 # =============================================================================
 # Data Types
@@ -62,7 +66,10 @@ class Pattern:
     length: int
     steps: list[Step]
 
-    @property
+    # Derived views are computed on first use and kept: patterns are cached
+    # and shared between the seed tests, sweeps and report, each of which
+    # reads the masks again.
+    @functools.cached_property
     def v1_mask(self) -> int:
         """Bitmask of V1 hits."""
         mask = 0
@@ -71,7 +78,7 @@ class Pattern:
                 mask |= (1 << s.step)
         return mask
 
-    @property
+    @functools.cached_property
     def v2_mask(self) -> int:
         """Bitmask of V2 hits."""
         mask = 0
@@ -80,7 +87,7 @@ class Pattern:
                 mask |= (1 << s.step)
         return mask
 
-    @property
+    @functools.cached_property
     def aux_mask(self) -> int:
         """Bitmask of AUX hits."""
         mask = 0
@@ -91,15 +98,15 @@ class Pattern:
 
     @property
     def v1_hits(self) -> int:
-        return sum(1 for s in self.steps if s.v1)
+        return popcount(self.v1_mask)
 
     @property
     def v2_hits(self) -> int:
-        return sum(1 for s in self.steps if s.v2)
+        return popcount(self.v2_mask)
 
     @property
     def aux_hits(self) -> int:
-        return sum(1 for s in self.steps if s.aux)
+        return popcount(self.aux_mask)
 
 
 @dataclass
@@ -305,21 +312,24 @@ def compute_regularity(hits: list[bool], pattern_length: int = 32) -> float:
     if len(hit_positions) < 2:
         return 0.5  # Neutral for sparse patterns
 
-    # Compute inter-onset intervals (including wrap-around)
-    gaps = []
-    for i in range(len(hit_positions)):
-        next_idx = (i + 1) % len(hit_positions)
-        if next_idx == 0:
-            gap = (pattern_length - hit_positions[i]) + hit_positions[0]
+    # Inter-onset intervals (including wrap-around), with their mean and
+    # variance accumulated in one pass (Welford)
+    num_hits = len(hit_positions)
+    mean_gap = 0.0
+    m2 = 0.0
+    for i, pos in enumerate(hit_positions):
+        if i + 1 < num_hits:
+            gap = hit_positions[i + 1] - pos
         else:
-            gap = hit_positions[next_idx] - hit_positions[i]
-        gaps.append(gap)
+            gap = (pattern_length - pos) + hit_positions[0]
+        delta = gap - mean_gap
+        mean_gap += delta / (i + 1)
+        m2 += delta * (gap - mean_gap)
 
-    mean_gap = sum(gaps) / len(gaps)
     if mean_gap == 0:
         return 1.0
 
-    variance = sum((g - mean_gap) ** 2 for g in gaps) / len(gaps)
+    variance = m2 / num_hits
     std_dev = variance ** 0.5
     cv = std_dev / mean_gap  # Coefficient of variation
 
@@ -539,6 +549,26 @@ class ExpressivenessReport:
 # Pattern Generation
 # =============================================================================
 
+# run_pattern_viz's parameters after the binary path, with their defaults
+PATTERN_DEFAULTS = {
+    "energy": 0.5,
+    "shape": 0.3,
+    "axis_x": 0.5,
+    "axis_y": 0.5,
+    "drift": 0.0,
+    "accent": 0.5,
+    "seed": 0xDEADBEEF,
+    "length": 32,
+}
+
+
+# Patterns already generated, keyed on run_pattern_viz's arguments in order.
+# pattern_viz is deterministic, and the sweeps revisit points the seed tests
+# already cover (e.g. the ENERGY sweep at SHAPE=0.30, DRIFT=0), so a repeated
+# parameter set is never rerun.
+_pattern_cache: dict[tuple, Pattern] = {}
+
+
 def run_pattern_viz(
     pattern_viz_path: Path,
     energy: float = 0.5,
@@ -550,9 +580,32 @@ def run_pattern_viz(
     seed: int = 0xDEADBEEF,
     length: int = 32,
 ) -> Pattern:
-    """Run pattern_viz and parse CSV output."""
-    cmd = [
-        str(pattern_viz_path),
+    """Run pattern_viz and parse CSV output (cached per parameter set)."""
+    key = (pattern_viz_path, energy, shape, axis_x, axis_y, drift, accent, seed, length)
+    pattern = _pattern_cache.get(key)
+    if pattern is None:
+        pattern = _pattern_cache[key] = _generate_patterns([key])[0]
+    return pattern
+
+
+def run_pattern_viz_batch(pattern_viz_path: Path, param_sets: list[dict]) -> list[Pattern]:
+    """run_pattern_viz for several parameter sets (run_pattern_viz keyword
+    arguments), generating every uncached one in a single pattern_viz process."""
+    keys = []
+    for params in param_sets:
+        kwargs = {**PATTERN_DEFAULTS, **params}
+        keys.append((pattern_viz_path, *(kwargs[name] for name in PATTERN_DEFAULTS)))
+
+    missing = [key for key in dict.fromkeys(keys) if key not in _pattern_cache]
+    if missing:
+        _pattern_cache.update(zip(missing, _generate_patterns(missing)))
+    return [_pattern_cache[key] for key in keys]
+
+
+def _pattern_viz_options(key: tuple) -> list[str]:
+    """pattern_viz per-pattern options for a run_pattern_viz argument tuple."""
+    _, energy, shape, axis_x, axis_y, drift, accent, seed, length = key
+    return [
         f"--energy={energy:.2f}",
         f"--shape={shape:.2f}",
         f"--axis-x={axis_x:.2f}",
@@ -561,16 +614,36 @@ def run_pattern_viz(
         f"--accent={accent:.2f}",
         f"--seed={seed}",
         f"--length={length}",
-        "--format=csv",
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+def _generate_patterns(keys: list[tuple]) -> list[Pattern]:
+    """Generate one Pattern per run_pattern_viz argument tuple.
+
+    All keys must share a pattern_viz path. Several keys go through a single
+    ``pattern_viz --batch`` process, one line of options per pattern; each
+    pattern's CSV rows start again at step 0.
+    """
+    pattern_viz_path = str(keys[0][0])
+    if len(keys) == 1:
+        cmd = [pattern_viz_path, *_pattern_viz_options(keys[0]), "--format=csv"]
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    else:
+        batch = "".join(" ".join(_pattern_viz_options(key)) + "\n" for key in keys)
+        result = subprocess.run(
+            [pattern_viz_path, "--batch", "--format=csv"],
+            input=batch, capture_output=True, text=True, check=True,
+        )
     reader = csv.DictReader(io.StringIO(result.stdout))
 
-    steps = []
+    step_lists = []
     for row in reader:
+        step = int(row["step"])
+        if step == 0:
+            steps = []
+            step_lists.append(steps)
         steps.append(Step(
-            step=int(row["step"]),
+            step=step,
             v1=row["v1"] == "1",
             v2=row["v2"] == "1",
             aux=row["aux"] == "1",
@@ -580,23 +653,93 @@ def run_pattern_viz(
             metric=float(row["metric"]),
         ))
 
-    return Pattern(
-        energy=energy,
-        shape=shape,
-        axis_x=axis_x,
-        axis_y=axis_y,
-        drift=drift,
-        accent=accent,
-        seed=seed,
-        length=length,
-        steps=steps,
-    )
+    if len(step_lists) != len(keys):
+        raise RuntimeError(f"pattern_viz returned {len(step_lists)} patterns for {len(keys)} requests")
+    return [
+        Pattern(
+            energy=energy,
+            shape=shape,
+            axis_x=axis_x,
+            axis_y=axis_y,
+            drift=drift,
+            accent=accent,
+            seed=seed,
+            length=length,
+            steps=steps,
+        )
+        for (_, energy, shape, axis_x, axis_y, drift, accent, seed, length), steps
+        in zip(keys, step_lists)
+    ]
 
 
 # =============================================================================
 # Metrics Computation
 # =============================================================================
 
+# Number of set bits in a hit mask. int.bit_count() (Python 3.10+) is a single
+# popcount; older interpreters count '1's in the binary string instead.
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+else:
+    def popcount(mask: int) -> int:
+        return bin(mask).count("1")
+
+QUARTER_NOTE_MASK = 0x11111111  # Steps 0,4,8,12,16,20,24,28
+OFFBEAT_MASK = 0xAAAAAAAA       # Odd steps
+
+
+@functools.lru_cache(maxsize=4096)
+def v1_rhythm_metrics(v1_mask: int) -> tuple:
+    """Rhythmic analysis of a V1 hit mask.
+
+    Returns (quarter_note_hits, offbeat_hits, syncopation_ratio, gaps,
+    max_gap, min_gap, avg_gap, gap_variance, regularity_score). Depends only
+    on the mask, so converged patterns across seeds and sweeps share a result.
+    """
+    if not v1_mask:
+        return (0, 0, 0.0, (), 0, 32, 0.0, 0.0, 0.0)
+
+    # Quarter note and offbeat hits are counted straight off the mask
+    quarter_note_hits = popcount(v1_mask & QUARTER_NOTE_MASK)
+    offbeat_hits = popcount(v1_mask & OFFBEAT_MASK)
+    syncopation_ratio = offbeat_hits / popcount(v1_mask)
+
+    # Gap analysis: walk the set bits lowest-first, keeping the gap mean,
+    # variance (Welford) and extremes in the same pass
+    gaps = []
+    mean_gap = 0.0
+    m2 = 0.0
+    max_gap = 0
+    min_gap = 32
+    prev = -1
+    bits = v1_mask
+    while bits:
+        lsb = bits & -bits
+        pos = lsb.bit_length() - 1
+        if prev >= 0:
+            gap = pos - prev
+            gaps.append(gap)
+            delta = gap - mean_gap
+            mean_gap += delta / len(gaps)
+            m2 += delta * (gap - mean_gap)
+            if gap > max_gap:
+                max_gap = gap
+            if gap < min_gap:
+                min_gap = gap
+        prev = pos
+        bits ^= lsb
+
+    if not gaps:
+        return (quarter_note_hits, offbeat_hits, syncopation_ratio,
+                (), 0, 32, 0.0, 0.0, 0.0)
+
+    gap_variance = m2 / len(gaps)
+    std_dev = gap_variance ** 0.5
+    regularity_score = max(0.0, 1.0 - std_dev / 8.0)
+    return (quarter_note_hits, offbeat_hits, syncopation_ratio, tuple(gaps),
+            max_gap, min_gap, mean_gap, gap_variance, regularity_score)
+
+
 def compute_metrics(pattern: Pattern) -> PatternMetrics:
     """Compute all metrics for a pattern."""
     m = PatternMetrics()
@@ -608,28 +751,10 @@ def compute_metrics(pattern: Pattern) -> PatternMetrics:
     m.v2_mask = pattern.v2_mask
     m.aux_mask = pattern.aux_mask
 
-    # Get V1 hit positions
-    v1_positions = [s.step for s in pattern.steps if s.v1]
-
-    if v1_positions:
-        # Quarter note analysis (0,4,8,12,16,20,24,28)
-        quarter_notes = {0, 4, 8, 12, 16, 20, 24, 28}
-        m.quarter_note_hits = len([p for p in v1_positions if p in quarter_notes])
-
-        # Offbeat analysis (odd steps)
-        m.offbeat_hits = len([p for p in v1_positions if p % 2 == 1])
-        m.syncopation_ratio = m.offbeat_hits / len(v1_positions) if v1_positions else 0.0
-
-        # Gap analysis
-        if len(v1_positions) > 1:
-            m.gaps = [v1_positions[i+1] - v1_positions[i]
-                      for i in range(len(v1_positions)-1)]
-            m.max_gap = max(m.gaps)
-            m.min_gap = min(m.gaps)
-            m.avg_gap = sum(m.gaps) / len(m.gaps)
-            m.gap_variance = sum((g - m.avg_gap) ** 2 for g in m.gaps) / len(m.gaps)
-            std_dev = m.gap_variance ** 0.5
-            m.regularity_score = max(0.0, 1.0 - std_dev / 8.0)
+    (m.quarter_note_hits, m.offbeat_hits, m.syncopation_ratio, gaps,
+     m.max_gap, m.min_gap, m.avg_gap, m.gap_variance,
+     m.regularity_score) = v1_rhythm_metrics(m.v1_mask)
+    m.gaps = list(gaps)
 
     # Velocity analysis (V1)
     v1_vels = [s.v1_vel for s in pattern.steps if s.v1 and s.v1_vel > 0]
@@ -650,6 +775,15 @@ def compute_metrics(pattern: Pattern) -> PatternMetrics:
 # Expressiveness Tests
 # =============================================================================
 
+# Diverse seed values for the seed variation tests. pattern_viz derives all
+# of its randomness from the seed by hashing, so there is no generator state
+# to carry between patterns; the seeds themselves are the only per-test setup.
+VARIATION_SEEDS = (
+    0xDEADBEEF, 0xCAFEBABE, 0x12345678, 0xABCD1234,
+    0x87654321, 0xFEEDFACE, 0xC0FFEE42, 0xBEEFCAFE,
+)
+
+
 def test_seed_variation(
     pattern_viz: Path,
     energy: float,
@@ -658,22 +792,13 @@ def test_seed_variation(
     num_seeds: int = 8,
 ) -> SeedVariationResult:
     """Test pattern variation across different seeds at fixed parameters."""
-    # Use diverse seed values
-    seeds = [
-        0xDEADBEEF, 0xCAFEBABE, 0x12345678, 0xABCD1234,
-        0x87654321, 0xFEEDFACE, 0xC0FFEE42, 0xBEEFCAFE,
-    ][:num_seeds]
-
-    patterns = []
-    for seed in seeds:
-        pattern = run_pattern_viz(
-            pattern_viz,
-            energy=energy,
-            shape=shape,
-            drift=drift,
-            seed=seed,
-        )
-        patterns.append(pattern)
+    seeds = list(VARIATION_SEEDS[:num_seeds])
+
+    # All seeds go through one pattern_viz process
+    patterns = run_pattern_viz_batch(
+        pattern_viz,
+        [{"energy": energy, "shape": shape, "drift": drift, "seed": seed} for seed in seeds],
+    )
 
     # Count unique masks
     v1_masks = {p.v1_mask for p in patterns}
@@ -711,32 +836,10 @@ def sweep_parameter(
     seed: int = 0xDEADBEEF,
 ) -> SweepResult:
     """Sweep a parameter and collect patterns/metrics."""
-    patterns = []
-    metrics = []
-
-    for val in values:
-        kwargs = {
-            "pattern_viz_path": pattern_viz,
-            "energy": base_energy,
-            "shape": base_shape,
-            "drift": base_drift,
-            "seed": seed,
-        }
-
-        if param_name == "energy":
-            kwargs["energy"] = val
-        elif param_name == "shape":
-            kwargs["shape"] = val
-        elif param_name == "drift":
-            kwargs["drift"] = val
-        elif param_name == "axis_x":
-            kwargs["axis_x"] = val
-        elif param_name == "axis_y":
-            kwargs["axis_y"] = val
-
-        pattern = run_pattern_viz(**kwargs)
-        patterns.append(pattern)
-        metrics.append(compute_metrics(pattern))
+    # The whole sweep goes through one pattern_viz process
+    base = {"energy": base_energy, "shape": base_shape, "drift": base_drift, "seed": seed}
+    patterns = run_pattern_viz_batch(pattern_viz, [{**base, param_name: val} for val in values])
+    metrics = [compute_metrics(pattern) for pattern in patterns]
 
     return SweepResult(
         param_name=param_name,
@@ -765,6 +868,13 @@ def find_low_variation_zones(seed_tests: list[SeedVariationResult]) -> list[dict
     return zones
 
 
+@functools.lru_cache(maxsize=512)
+def format_hex32(value: int) -> str:
+    """Mask or seed as 0xXXXXXXXX. The same few masks and the eight test
+    seeds recur across every convergence entry, so the strings are cached."""
+    return f"0x{value:08X}"
+
+
 def find_convergence_patterns(seed_tests: list[SeedVariationResult]) -> list[dict]:
     """Find specific patterns where multiple seeds converge."""
     convergences = []
@@ -781,8 +891,8 @@ def find_convergence_patterns(seed_tests: list[SeedVariationResult]) -> list[dic
                         "energy": test.energy,
                         "shape": test.shape,
                         "drift": test.drift,
-                        "v2_mask": f"0x{mask:08X}",
-                        "seeds": [f"0x{s:08X}" for s in seeds],
+                        "v2_mask": format_hex32(mask),
+                        "seeds": [format_hex32(s) for s in seeds],
                         "count": len(seeds),
                     })
     return convergences
@@ -794,35 +904,42 @@ def find_convergence_patterns(seed_tests: list[SeedVariationResult]) -> list[dic
 
 def generate_markdown_report(report: ExpressivenessReport) -> str:
     """Generate a detailed markdown report."""
-    lines = []
-    lines.append("# Expressiveness Evaluation Report")
-    lines.append("")
-    lines.append("This report evaluates pattern expressiveness across parameter sweeps.")
-    lines.append("")
+    lines = [
+        "# Expressiveness Evaluation Report",
+        "",
+        "This report evaluates pattern expressiveness across parameter sweeps.",
+        "",
+    ]
 
     # Executive Summary
-    lines.append("## Executive Summary")
-    lines.append("")
-    lines.append(f"- **Overall Seed Variation Score**: {report.overall_seed_variation:.1%}")
-    lines.append(f"- **V1 (Anchor) Expressiveness**: {report.v1_expressiveness:.1%}")
-    lines.append(f"- **V2 (Shimmer) Expressiveness**: {report.v2_expressiveness:.1%}")
-    lines.append(f"- **AUX Expressiveness**: {report.aux_expressiveness:.1%}")
-    lines.append("")
+    lines.extend((
+        "## Executive Summary",
+        "",
+        f"- **Overall Seed Variation Score**: {report.overall_seed_variation:.1%}",
+        f"- **V1 (Anchor) Expressiveness**: {report.v1_expressiveness:.1%}",
+        f"- **V2 (Shimmer) Expressiveness**: {report.v2_expressiveness:.1%}",
+        f"- **AUX Expressiveness**: {report.aux_expressiveness:.1%}",
+        "",
+    ))
 
     # Pass/Fail
     v2_pass = report.v2_expressiveness >= 0.5
     lines.append(f"**V2 Variation Test**: {'PASS' if v2_pass else 'FAIL'}")
     if not v2_pass:
-        lines.append("")
-        lines.append("> CRITICAL: Shimmer (V2) patterns do not vary sufficiently across seeds.")
-        lines.append("> This means the reseed gesture feels 'broken' to users.")
+        lines.extend((
+            "",
+            "> CRITICAL: Shimmer (V2) patterns do not vary sufficiently across seeds.",
+            "> This means the reseed gesture feels 'broken' to users.",
+        ))
     lines.append("")
 
     # Seed Variation Details
-    lines.append("## Seed Variation Tests")
-    lines.append("")
-    lines.append("| Energy | Shape | Drift | V1 Unique | V2 Unique | AUX Unique | V2 Score |")
-    lines.append("|--------|-------|-------|-----------|-----------|------------|----------|")
+    lines.extend((
+        "## Seed Variation Tests",
+        "",
+        "| Energy | Shape | Drift | V1 Unique | V2 Unique | AUX Unique | V2 Score |",
+        "|--------|-------|-------|-----------|-----------|------------|----------|",
+    ))
 
     for test in report.seed_variation_tests:
         status = "OK" if test.v2_variation_score >= 0.5 else "LOW"
@@ -837,25 +954,31 @@ def generate_markdown_report(report: ExpressivenessReport) -> str:
 
     # Low Variation Zones
     if report.low_variation_zones:
-        lines.append("## Low Variation Zones (Problem Areas)")
-        lines.append("")
-        lines.append("These parameter regions have insufficient seed variation:")
-        lines.append("")
+        lines.extend((
+            "## Low Variation Zones (Problem Areas)",
+            "",
+            "These parameter regions have insufficient seed variation:",
+            "",
+        ))
         for zone in report.low_variation_zones:
-            lines.append(f"### {zone['severity']}: E={zone['energy']:.2f} S={zone['shape']:.2f} D={zone['drift']:.2f}")
-            lines.append("")
-            lines.append(f"- V1 Score: {zone['v1_score']:.0%}")
-            lines.append(f"- V2 Score: {zone['v2_score']:.0%}")
-            lines.append(f"- AUX Score: {zone['aux_score']:.0%}")
-            lines.append(f"- Issue: {zone['issue']}")
-            lines.append("")
+            lines.extend((
+                f"### {zone['severity']}: E={zone['energy']:.2f} S={zone['shape']:.2f} D={zone['drift']:.2f}",
+                "",
+                f"- V1 Score: {zone['v1_score']:.0%}",
+                f"- V2 Score: {zone['v2_score']:.0%}",
+                f"- AUX Score: {zone['aux_score']:.0%}",
+                f"- Issue: {zone['issue']}",
+                "",
+            ))
 
     # Convergence Patterns
     if report.convergence_patterns:
-        lines.append("## Convergence Patterns (Identical Outputs)")
-        lines.append("")
-        lines.append("These specific patterns are produced by multiple seeds:")
-        lines.append("")
+        lines.extend((
+            "## Convergence Patterns (Identical Outputs)",
+            "",
+            "These specific patterns are produced by multiple seeds:",
+            "",
+        ))
         for conv in report.convergence_patterns[:10]:  # Limit to 10
             lines.append(f"- **{conv['v2_mask']}** produced by {conv['count']} seeds at "
                         f"E={conv['energy']:.2f} S={conv['shape']:.2f} D={conv['drift']:.2f}")
@@ -863,21 +986,25 @@ def generate_markdown_report(report: ExpressivenessReport) -> str:
         lines.append("")
 
     # Pentagon of Musicality Analysis
-    lines.append("## Pentagon of Musicality Analysis")
-    lines.append("")
-    lines.append("Five orthogonal metrics measuring pattern musicality:")
-    lines.append("- **Syncopation**: Tension from metric displacement (LHL model)")
-    lines.append("- **Density**: Activity level (hits per step)")
-    lines.append("- **Velocity Range**: Dynamic contrast")
-    lines.append("- **Voice Separation**: Voice independence (1 - overlap)")
-    lines.append("- **Regularity**: Temporal predictability (1 - CV of gaps)")
-    lines.append("")
+    lines.extend((
+        "## Pentagon of Musicality Analysis",
+        "",
+        "Five orthogonal metrics measuring pattern musicality:",
+        "- **Syncopation**: Tension from metric displacement (LHL model)",
+        "- **Density**: Activity level (hits per step)",
+        "- **Velocity Range**: Dynamic contrast",
+        "- **Voice Separation**: Voice independence (1 - overlap)",
+        "- **Regularity**: Temporal predictability (1 - CV of gaps)",
+        "",
+    ))
 
     if report.shape_sweep:
-        lines.append("### Pentagon Metrics vs SHAPE")
-        lines.append("")
-        lines.append("| SHAPE | Zone | Sync | Dens | VelRng | VoiceSep | Reg | Composite |")
-        lines.append("|-------|------|------|------|--------|----------|-----|-----------|")
+        lines.extend((
+            "### Pentagon Metrics vs SHAPE",
+            "",
+            "| SHAPE | Zone | Sync | Dens | VelRng | VoiceSep | Reg | Composite |",
+            "|-------|------|------|------|--------|----------|-----|-----------|",
+        ))
         for i, val in enumerate(report.shape_sweep.param_values):
             p = report.shape_sweep.patterns[i]
             pm = compute_pentagon_metrics(p, p.shape, p.energy, p.accent)
@@ -889,10 +1016,12 @@ def generate_markdown_report(report: ExpressivenessReport) -> str:
 
     # Parameter Sweep Analysis
     if report.shape_sweep:
-        lines.append("## SHAPE Parameter Sweep")
-        lines.append("")
-        lines.append("| SHAPE | V1 Hits | V2 Hits | Regularity | Syncopation |")
-        lines.append("|-------|---------|---------|------------|-------------|")
+        lines.extend((
+            "## SHAPE Parameter Sweep",
+            "",
+            "| SHAPE | V1 Hits | V2 Hits | Regularity | Syncopation |",
+            "|-------|---------|---------|------------|-------------|",
+        ))
         for i, val in enumerate(report.shape_sweep.param_values):
             m = report.shape_sweep.metrics[i]
             lines.append(f"| {val:.2f} | {m.v1_hits} | {m.v2_hits} | "
@@ -900,93 +1029,114 @@ def generate_markdown_report(report: ExpressivenessReport) -> str:
         lines.append("")
 
     if report.energy_sweep:
-        lines.append("## ENERGY Parameter Sweep")
-        lines.append("")
-        lines.append("| ENERGY | V1 Hits | V2 Hits | V1 Mask | V2 Mask |")
-        lines.append("|--------|---------|---------|---------|---------|")
+        lines.extend((
+            "## ENERGY Parameter Sweep",
+            "",
+            "| ENERGY | V1 Hits | V2 Hits | V1 Mask | V2 Mask |",
+            "|--------|---------|---------|---------|---------|",
+        ))
         for i, val in enumerate(report.energy_sweep.param_values):
             m = report.energy_sweep.metrics[i]
             lines.append(f"| {val:.2f} | {m.v1_hits} | {m.v2_hits} | "
-                        f"0x{m.v1_mask:08X} | 0x{m.v2_mask:08X} |")
+                        f"{format_hex32(m.v1_mask)} | {format_hex32(m.v2_mask)} |")
         lines.append("")
 
     # Recommendations
     lines.append("## Recommendations")
     lines.append("")
     if report.v2_expressiveness < 0.5:
-        lines.append("### Priority 1: Fix V2 (Shimmer) Variation")
-        lines.append("")
-        lines.append("The shimmer voice does not vary enough with different seeds. Recommended fixes:")
-        lines.append("")
-        lines.append("1. **Inject seed into even-spacing placement** (Low risk)")
-        lines.append("   - Add seed-based micro-jitter to `PlaceEvenlySpaced()`")
-        lines.append("   - Preserves overall structure while adding variation")
-        lines.append("")
-        lines.append("2. **Raise default DRIFT from 0.0 to 0.25** (Medium risk)")
-        lines.append("   - Enables seed-sensitive weighted placement")
-        lines.append("   - Matches user expectation that reseed changes pattern")
-        lines.append("")
-        lines.append("3. **Use Gumbel selection within gaps** (Structural fix)")
-        lines.append("   - Apply same selection mechanism to shimmer as anchor")
-        lines.append("   - Most comprehensive solution")
-        lines.append("")
+        lines.extend((
+            "### Priority 1: Fix V2 (Shimmer) Variation",
+            "",
+            "The shimmer voice does not vary enough with different seeds. Recommended fixes:",
+            "",
+            "1. **Inject seed into even-spacing placement** (Low risk)",
+            "   - Add seed-based micro-jitter to `PlaceEvenlySpaced()`",
+            "   - Preserves overall structure while adding variation",
+            "",
+            "2. **Raise default DRIFT from 0.0 to 0.25** (Medium risk)",
+            "   - Enables seed-sensitive weighted placement",
+            "   - Matches user expectation that reseed changes pattern",
+            "",
+            "3. **Use Gumbel selection within gaps** (Structural fix)",
+            "   - Apply same selection mechanism to shimmer as anchor",
+            "   - Most comprehensive solution",
+            "",
+        ))
     else:
-        lines.append("No critical issues found. Pattern expressiveness is adequate.")
-        lines.append("")
-        lines.append("Consider monitoring these metrics after future changes:")
-        lines.append("- V2 variation score should stay above 50%")
-        lines.append("- Syncopation should increase with SHAPE")
-        lines.append("- Hit counts should scale with ENERGY")
+        lines.extend((
+            "No critical issues found. Pattern expressiveness is adequate.",
+            "",
+            "Consider monitoring these metrics after future changes:",
+            "- V2 variation score should stay above 50%",
+            "- Syncopation should increase with SHAPE",
+            "- Hit counts should scale with ENERGY",
+        ))
 
-    lines.append("")
-    lines.append("---")
-    lines.append("*Generated by evaluate-expressiveness.py*")
+    lines.extend((
+        "",
+        "---",
+        "*Generated by evaluate-expressiveness.py*",
+    ))
 
     return "\n".join(lines)
 
 
+def dump_json(data) -> bytes:
+    """Serialize data as 2-space indented JSON (orjson if installed)."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2).encode("utf-8")
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
 def print_console_summary(report: ExpressivenessReport):
-    """Print a concise console summary."""
-    print("=" * 60)
-    print("EXPRESSIVENESS EVALUATION SUMMARY")
-    print("=" * 60)
-    print()
+    """Print a concise console summary (in a single write)."""
+    lines = []
+    lines.append("=" * 60)
+    lines.append("EXPRESSIVENESS EVALUATION SUMMARY")
+    lines.append("=" * 60)
+    lines.append("")
 
     # Overall scores
-    print(f"Overall Seed Variation: {report.overall_seed_variation:.0%}")
-    print(f"  V1 (Anchor):  {report.v1_expressiveness:.0%}")
-    print(f"  V2 (Shimmer): {report.v2_expressiveness:.0%}")
-    print(f"  AUX:          {report.aux_expressiveness:.0%}")
-    print()
+    lines.append(f"Overall Seed Variation: {report.overall_seed_variation:.0%}")
+    lines.append(f"  V1 (Anchor):  {report.v1_expressiveness:.0%}")
+    lines.append(f"  V2 (Shimmer): {report.v2_expressiveness:.0%}")
+    lines.append(f"  AUX:          {report.aux_expressiveness:.0%}")
+    lines.append("")
 
     # Pass/Fail
     v2_pass = report.v2_expressiveness >= 0.5
     v1_pass = report.v1_expressiveness >= 0.5
 
     if v2_pass and v1_pass:
-        print("[PASS] Expressiveness is adequate")
+        lines.append("[PASS] Expressiveness is adequate")
     else:
-        print("[FAIL] Expressiveness issues detected:")
+        lines.append("[FAIL] Expressiveness issues detected:")
         if not v2_pass:
-            print("       - V2 (Shimmer) variation is too low")
+            lines.append("       - V2 (Shimmer) variation is too low")
         if not v1_pass:
-            print("       - V1 (Anchor) variation is too low")
-    print()
+            lines.append("       - V1 (Anchor) variation is too low")
+    lines.append("")
 
     # Problem zones
     if report.low_variation_zones:
-        print("LOW VARIATION ZONES:")
+        lines.append("LOW VARIATION ZONES:")
         for zone in report.low_variation_zones[:5]:
-            print(f"  [{zone['severity']}] E={zone['energy']:.2f} S={zone['shape']:.2f} D={zone['drift']:.2f}")
-            print(f"           V2 score: {zone['v2_score']:.0%}")
-    print()
+            lines.append(f"  [{zone['severity']}] E={zone['energy']:.2f} S={zone['shape']:.2f} D={zone['drift']:.2f}")
+            lines.append(f"           V2 score: {zone['v2_score']:.0%}")
+    lines.append("")
 
     # Convergence patterns
     if report.convergence_patterns:
-        print(f"CONVERGENCE PATTERNS: {len(report.convergence_patterns)} found")
+        lines.append(f"CONVERGENCE PATTERNS: {len(report.convergence_patterns)} found")
         for conv in report.convergence_patterns[:3]:
-            print(f"  {conv['v2_mask']}: {conv['count']} seeds produce same pattern")
-    print()
+            lines.append(f"  {conv['v2_mask']}: {conv['count']} seeds produce same pattern")
+    lines.append("")
+
+    print("\n".join(lines))
 
 
 # =============================================================================
@@ -994,6 +1144,8 @@ def print_console_summary(report: ExpressivenessReport):
 # =============================================================================
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Evaluate pattern expressiveness across parameter space"
     )
@@ -1019,6 +1171,12 @@ def main():
         action="store_true",
         help="Run quick evaluation (fewer parameter combinations)"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Seed variation tests to run in parallel (default: based on CPU count)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -1052,24 +1210,26 @@ def main():
         shape_values = [0.0, 0.15, 0.30, 0.50, 0.70, 0.85, 1.0]
         drift_values = [0.0, 0.25, 0.5, 0.75]
 
-    total_tests = len(energy_values) * len(shape_values) * len(drift_values)
-    test_num = 0
-
-    for energy in energy_values:
-        for shape in shape_values:
-            for drift in drift_values:
-                test_num += 1
-                if args.verbose:
-                    print(f"  [{test_num}/{total_tests}] E={energy:.2f} S={shape:.2f} D={drift:.2f}")
-
-                result = test_seed_variation(
-                    args.pattern_viz,
-                    energy=energy,
-                    shape=shape,
-                    drift=drift,
-                    num_seeds=8 if not args.quick else 4,
-                )
-                report.seed_variation_tests.append(result)
+    grid = list(itertools.product(energy_values, shape_values, drift_values))
+    num_seeds = 8 if not args.quick else 4
+
+    def run_test(point):
+        energy, shape, drift = point
+        return test_seed_variation(
+            args.pattern_viz,
+            energy=energy,
+            shape=shape,
+            drift=drift,
+            num_seeds=num_seeds,
+        )
+
+    # Tests are independent and spend their time waiting on pattern_viz, so
+    # they run on a thread pool; results come back in grid order
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        for test_num, result in enumerate(pool.map(run_test, grid), 1):
+            if args.verbose:
+                print(f"  [{test_num}/{len(grid)}] E={result.energy:.2f} S={result.shape:.2f} D={result.drift:.2f}")
+            report.seed_variation_tests.append(result)
 
     print(f"  Completed {len(report.seed_variation_tests)} seed variation tests")
     print()
@@ -1120,10 +1280,13 @@ def main():
     report.low_variation_zones = find_low_variation_zones(report.seed_variation_tests)
     report.convergence_patterns = find_convergence_patterns(report.seed_variation_tests)
 
-    # Compute overall scores (average across all seed tests)
-    v1_scores = [t.v1_variation_score for t in report.seed_variation_tests]
-    v2_scores = [t.v2_variation_score for t in report.seed_variation_tests]
-    aux_scores = [t.aux_variation_score for t in report.seed_variation_tests]
+    # Compute overall scores (average across all seed tests), gathering all
+    # three voices in a single pass over the tests
+    v1_scores, v2_scores, aux_scores = [], [], []
+    for t in report.seed_variation_tests:
+        v1_scores.append(t.v1_variation_score)
+        v2_scores.append(t.v2_variation_score)
+        aux_scores.append(t.aux_variation_score)
 
     report.v1_expressiveness = sum(v1_scores) / len(v1_scores) if v1_scores else 0.0
     report.v2_expressiveness = sum(v2_scores) / len(v2_scores) if v2_scores else 0.0
@@ -1144,7 +1307,7 @@ def main():
     # Markdown report
     markdown = generate_markdown_report(report)
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(markdown)
+    args.output.write_text(markdown, encoding="utf-8")
     print(f"Report written to: {args.output}")
 
     # JSON output (optional)
@@ -1172,7 +1335,7 @@ def main():
                 for t in report.seed_variation_tests
             ],
         }
-        args.json.write_text(json.dumps(json_data, indent=2))
+        args.json.write_bytes(dump_json(json_data))
         print(f"JSON data written to: {args.json}")
 
     # Exit code based on pass/fail
@@ -13,27 +13,64 @@ Usage:
 """
 
 import subprocess
-import csv
 import io
-import argparse
+import itertools
+import bisect
+import functools
+import html
+import inspect
 import math
+import operator
+import os
+import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Sequence, TextIO
+
+
+# pattern_viz prints velocities with two decimals, so storing them as integer
+# hundredths is lossless (q / 100 is the same float the CSV text parses to)
+VELOCITY_SCALE = 100
+
+
+def quantize_velocity(vel: float) -> int:
+    """Quantize a 0.0-1.0 velocity to integer hundredths."""
+    return round(vel * VELOCITY_SCALE)
 
 
 @dataclass
 class Step:
-    """Single step in a pattern."""
+    """Single step in a pattern.
+
+    Velocities are stored quantized (see VELOCITY_SCALE) as small ints, which
+    CPython shares rather than allocating a float per step, and dequantized
+    on access through the v1_vel/v2_vel/aux_vel properties.
+    """
+    __slots__ = ("step", "v1", "v2", "aux", "v1_vel_q", "v2_vel_q", "aux_vel_q", "metric")
+
     step: int
     v1: bool
     v2: bool
     aux: bool
-    v1_vel: float
-    v2_vel: float
-    aux_vel: float
+    v1_vel_q: int
+    v2_vel_q: int
+    aux_vel_q: int
     metric: float
 
+    @property
+    def v1_vel(self) -> float:
+        return self.v1_vel_q / VELOCITY_SCALE
+
+    @property
+    def v2_vel(self) -> float:
+        return self.v2_vel_q / VELOCITY_SCALE
+
+    @property
+    def aux_vel(self) -> float:
+        return self.aux_vel_q / VELOCITY_SCALE
+
 
 @dataclass
 class Pattern:
@@ -50,17 +87,75 @@ class Pattern:
     name: Optional[str] = None  # Optional display name for presets
     description: Optional[str] = None  # Optional description
 
+    # Struct-of-arrays view of the steps, filled once at construction:
+    # packed hit masks (bit i = step i) and step-indexed velocities
+    v1_mask: int = field(init=False, repr=False, compare=False, default=0)
+    v2_mask: int = field(init=False, repr=False, compare=False, default=0)
+    aux_mask: int = field(init=False, repr=False, compare=False, default=0)
+    v1_vels: tuple[float, ...] = field(init=False, repr=False, compare=False, default=())
+    v2_vels: tuple[float, ...] = field(init=False, repr=False, compare=False, default=())
+    aux_vels: tuple[float, ...] = field(init=False, repr=False, compare=False, default=())
+    # compute_pentagon_metrics result, memoized per instance (None = not yet)
+    _pentagon_metrics: Optional["PentagonMetrics"] = field(init=False, repr=False, compare=False, default=None)
+
+    def __post_init__(self):
+        self.rebuild_arrays()
+
+    def rebuild_arrays(self) -> None:
+        """Refresh the cached masks and velocity arrays from steps.
+
+        Called at construction; call it again after mutating steps in place.
+        """
+        num_steps = max(self.length, max((s.step + 1 for s in self.steps), default=0))
+        v1_vels = [0.0] * num_steps
+        v2_vels = [0.0] * num_steps
+        aux_vels = [0.0] * num_steps
+        v1_mask = v2_mask = aux_mask = 0
+        for s in self.steps:
+            bit = 1 << s.step
+            if s.v1:
+                v1_mask |= bit
+            if s.v2:
+                v2_mask |= bit
+            if s.aux:
+                aux_mask |= bit
+            v1_vels[s.step] = s.v1_vel
+            v2_vels[s.step] = s.v2_vel
+            aux_vels[s.step] = s.aux_vel
+        self.v1_mask, self.v2_mask, self.aux_mask = v1_mask, v2_mask, aux_mask
+        self.v1_vels, self.v2_vels, self.aux_vels = tuple(v1_vels), tuple(v2_vels), tuple(aux_vels)
+        self._pentagon_metrics = None
+
+    @property
+    def masks(self) -> tuple[int, int, int]:
+        """Packed (v1, v2, aux) hit masks."""
+        return self.v1_mask, self.v2_mask, self.aux_mask
+
+    @property
+    def pentagon_key(self) -> tuple:
+        """Everything compute_pentagon_metrics depends on, as a hashable key."""
+        return (
+            self.v1_mask, self.v2_mask, self.aux_mask,
+            self.v1_vels, self.v2_vels, self.aux_vels,
+            self.shape, self.energy, self.accent, self.length,
+        )
+
     @property
     def v1_hits(self) -> int:
-        return sum(1 for s in self.steps if s.v1)
+        return popcount(self.v1_mask)
 
     @property
     def v2_hits(self) -> int:
-        return sum(1 for s in self.steps if s.v2)
+        return popcount(self.v2_mask)
 
     @property
     def aux_hits(self) -> int:
-        return sum(1 for s in self.steps if s.aux)
+        return popcount(self.aux_mask)
+
+
+# Patterns already generated, keyed on run_pattern_viz's arguments in order
+# (pattern_viz is deterministic, so a repeated parameter set is never rerun)
+_pattern_cache: dict[tuple, Pattern] = {}
 
 
 def run_pattern_viz(
@@ -76,9 +171,23 @@ def run_pattern_viz(
     name: Optional[str] = None,
     description: Optional[str] = None,
 ) -> Pattern:
-    """Run pattern_viz and parse CSV output."""
-    cmd = [
-        str(pattern_viz_path),
+    """Run pattern_viz and parse CSV output.
+
+    pattern_viz is deterministic, so a parameter set that several sweeps
+    share (e.g. a sweep midpoint that reappears in a matrix section) is only
+    run once and the parsed Pattern is reused.
+    """
+    key = (pattern_viz_path, energy, shape, axis_x, axis_y, drift, accent, seed, length, name, description)
+    pattern = _pattern_cache.get(key)
+    if pattern is None:
+        pattern = _pattern_cache[key] = _generate_patterns([key])[0]
+    return pattern
+
+
+def _pattern_viz_options(key: tuple) -> list[str]:
+    """pattern_viz per-pattern options for a run_pattern_viz argument tuple."""
+    _, energy, shape, axis_x, axis_y, drift, accent, seed, length, _, _ = key
+    return [
         f"--energy={energy:.2f}",
         f"--shape={shape:.2f}",
         f"--axis-x={axis_x:.2f}",
@@ -87,38 +196,130 @@ def run_pattern_viz(
         f"--accent={accent:.2f}",
         f"--seed={seed}",
         f"--length={length}",
-        "--format=csv",
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    reader = csv.DictReader(io.StringIO(result.stdout))
 
-    steps = []
-    for row in reader:
+def _parse_velocity_q(text: bytes) -> int:
+    """Integer hundredths for a pattern_viz CSV velocity field.
+
+    PrintPatternCSV (tools/pattern_viz.cpp) writes velocities with
+    std::fixed and std::setprecision(2), e.g. "0.85", so dropping the point
+    yields the hundredths directly; same value as
+    quantize_velocity(float(text)) without the float round trip. Any other
+    shape (say "1.0") goes through quantize_velocity instead of being
+    misread.
+    """
+    if len(text) == 4 and text[1:2] == b".":
+        return int(text.replace(b".", b""))
+    return quantize_velocity(float(text))
+
+
+def _parse_pattern_csv(output: bytes) -> list[list[Step]]:
+    """Split pattern_viz CSV output into one step list per pattern.
+
+    The CSV is plain ASCII with no quoting, so the raw bytes are split
+    directly rather than decoded and run through the csv module. Each
+    pattern's rows start again at step 0.
+    """
+    header, *rows = output.splitlines()
+    columns = header.split(b",")
+    i_step, i_v1, i_v2, i_aux, i_v1_vel, i_v2_vel, i_aux_vel, i_metric = (
+        columns.index(name)
+        for name in (b"step", b"v1", b"v2", b"aux", b"v1_vel", b"v2_vel", b"aux_vel", b"metric")
+    )
+
+    patterns = []
+    for row in rows:
+        if not row:
+            continue
+        fields = row.split(b",")
+        step = int(fields[i_step])
+        if step == 0:
+            steps = []
+            patterns.append(steps)
         steps.append(Step(
-            step=int(row["step"]),
-            v1=row["v1"] == "1",
-            v2=row["v2"] == "1",
-            aux=row["aux"] == "1",
-            v1_vel=float(row["v1_vel"]),
-            v2_vel=float(row["v2_vel"]),
-            aux_vel=float(row["aux_vel"]),
-            metric=float(row["metric"]),
+            step=step,
+            v1=fields[i_v1] == b"1",
+            v2=fields[i_v2] == b"1",
+            aux=fields[i_aux] == b"1",
+            v1_vel_q=_parse_velocity_q(fields[i_v1_vel]),
+            v2_vel_q=_parse_velocity_q(fields[i_v2_vel]),
+            aux_vel_q=_parse_velocity_q(fields[i_aux_vel]),
+            metric=float(fields[i_metric]),
         ))
+    return patterns
 
-    return Pattern(
-        energy=energy,
-        shape=shape,
-        axis_x=axis_x,
-        axis_y=axis_y,
-        drift=drift,
-        accent=accent,
-        seed=seed,
-        length=length,
-        steps=steps,
-        name=name,
-        description=description,
-    )
+
+def _generate_patterns(keys: Sequence[tuple]) -> list[Pattern]:
+    """Generate one Pattern per run_pattern_viz argument tuple.
+
+    All keys must share a pattern_viz path. Several keys go through a single
+    ``pattern_viz --batch`` process, one line of options per pattern.
+    """
+    pattern_viz_path = str(keys[0][0])
+    if len(keys) == 1:
+        output = subprocess.run(
+            [pattern_viz_path, *_pattern_viz_options(keys[0]), "--format=csv"],
+            stdout=subprocess.PIPE, check=True,
+        ).stdout
+    else:
+        batch = "".join(" ".join(_pattern_viz_options(key)) + "\n" for key in keys)
+        output = subprocess.run(
+            [pattern_viz_path, "--batch", "--format=csv"],
+            input=batch.encode(), stdout=subprocess.PIPE, check=True,
+        ).stdout
+
+    step_lists = _parse_pattern_csv(output)
+    if len(step_lists) != len(keys):
+        raise RuntimeError(f"pattern_viz returned {len(step_lists)} patterns for {len(keys)} requests")
+    return [
+        Pattern(
+            energy=energy,
+            shape=shape,
+            axis_x=axis_x,
+            axis_y=axis_y,
+            drift=drift,
+            accent=accent,
+            seed=seed,
+            length=length,
+            steps=steps,
+            name=name,
+            description=description,
+        )
+        for (_, energy, shape, axis_x, axis_y, drift, accent, seed, length, name, description), steps
+        in zip(keys, step_lists)
+    ]
+
+
+_RUN_PATTERN_VIZ_SIGNATURE = inspect.signature(run_pattern_viz)
+
+
+def run_pattern_viz_many(
+    pattern_viz_path: Path,
+    param_sets: Iterable[dict],
+    max_workers: Optional[int] = None,
+) -> list[Pattern]:
+    """Run pattern_viz for each set of run_pattern_viz keyword arguments.
+
+    Parameter sets that are not cached yet are split across at most
+    ``max_workers`` ``pattern_viz --batch`` processes, which run side by side
+    on a thread pool, so a whole sweep costs a handful of process starts.
+    Patterns come back in the order of ``param_sets``.
+    """
+    keys = []
+    for params in param_sets:
+        bound = _RUN_PATTERN_VIZ_SIGNATURE.bind(pattern_viz_path, **params)
+        bound.apply_defaults()
+        keys.append(tuple(bound.arguments.values()))
+
+    missing = [key for key in dict.fromkeys(keys) if key not in _pattern_cache]
+    if missing:
+        workers = min(len(missing), max_workers or os.cpu_count() or 1)
+        chunks = [missing[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for chunk, patterns in zip(chunks, pool.map(_generate_patterns, chunks)):
+                _pattern_cache.update(zip(chunk, patterns))
+    return [_pattern_cache[key] for key in keys]
 
 
 # Color scheme (Ableton-inspired dark theme)
@@ -165,7 +366,7 @@ METRIC_WEIGHTS_32 = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class PentagonMetrics:
     """Pentagon of Musicality - 5 orthogonal metrics."""
     raw_syncopation: float = 0.0
@@ -182,77 +383,92 @@ class PentagonMetrics:
     shape_zone: str = "stable"
 
 
-def compute_pentagon_syncopation(hits: list[bool], pattern_length: int = 32) -> float:
-    """Compute LHL syncopation score."""
-    weights = METRIC_WEIGHTS_32[:pattern_length]
-    syncopation_tension = 0.0
-    max_possible_tension = 0.0
+# Number of set bits in a hit mask. int.bit_count() (Python 3.10+) is a single
+# popcount; older interpreters count '1's in the binary string instead.
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+else:
+    def popcount(mask: int) -> int:
+        return bin(mask).count("1")
+
 
-    for i in range(pattern_length):
-        if hits[i]:
+# Rising metric-weight transitions per pattern length: (step bit, next step bit,
+# weight gain). Only steps followed by a stronger position can syncopate.
+_SYNC_RISES: dict[int, tuple[tuple[int, int, float], ...]] = {}
+
+
+def _sync_rises(pattern_length: int) -> tuple[tuple[int, int, float], ...]:
+    rises = _SYNC_RISES.get(pattern_length)
+    if rises is None:
+        weights = METRIC_WEIGHTS_32[:pattern_length]
+        rises = []
+        for i in range(pattern_length):
             next_pos = (i + 1) % pattern_length
             weight_diff = weights[next_pos] - weights[i]
-            if weight_diff > 0 and not hits[next_pos]:
+            if weight_diff > 0:
+                rises.append((1 << i, 1 << next_pos, weight_diff))
+        rises = _SYNC_RISES[pattern_length] = tuple(rises)
+    return rises
+
+
+def compute_pentagon_raw_metrics(
+    v1_mask: int, v2_mask: int, aux_mask: int,
+    v1_vels: Sequence[float], v2_vels: Sequence[float], aux_vels: Sequence[float],
+    pattern_length: int = 32,
+) -> tuple[float, float, float, float, float]:
+    """Compute the five raw Pentagon metrics from packed hit masks.
+
+    Returns (syncopation, density, velocity_range, voice_separation,
+    regularity). All five are computed in one call so the masks are loaded
+    once and the union of active steps is shared.
+    """
+    # Active steps (any voice) feed both density and voice separation
+    length_mask = (1 << pattern_length) - 1
+    total_active = popcount((v1_mask | v2_mask | aux_mask) & length_mask)
+
+    # Syncopation: LHL tension from V1 hits followed by a stronger, empty step
+    syncopation_tension = 0.0
+    max_possible_tension = 0.0
+    for bit, next_bit, weight_diff in _sync_rises(pattern_length):
+        if v1_mask & bit:
+            if not v1_mask & next_bit:
                 syncopation_tension += weight_diff
-            max_possible_tension += max(0, weights[(i + 1) % pattern_length] - weights[i])
-
-    return min(1.0, syncopation_tension / max_possible_tension) if max_possible_tension > 0 else 0.0
-
-
-def compute_pentagon_density(v1_hits: list[bool], v2_hits: list[bool], aux_hits: list[bool], pattern_length: int = 32) -> float:
-    """Compute pattern density as fraction of active steps."""
-    active_steps = sum(1 for i in range(pattern_length) if v1_hits[i] or v2_hits[i] or aux_hits[i])
-    return active_steps / pattern_length
-
-
-def compute_pentagon_velocity_range(v1_hits: list[bool], v2_hits: list[bool], aux_hits: list[bool],
-                                    v1_vels: list[float], v2_vels: list[float], aux_vels: list[float]) -> float:
-    """Compute velocity range across all voices."""
-    all_velocities = []
-    for i in range(len(v1_hits)):
-        if v1_hits[i] and v1_vels[i] > 0:
-            all_velocities.append(v1_vels[i])
-        if v2_hits[i] and v2_vels[i] > 0:
-            all_velocities.append(v2_vels[i])
-        if aux_hits[i] and aux_vels[i] > 0:
-            all_velocities.append(aux_vels[i])
-    return max(all_velocities) - min(all_velocities) if len(all_velocities) >= 2 else 0.0
-
-
-def compute_pentagon_voice_separation(v1_hits: list[bool], v2_hits: list[bool], aux_hits: list[bool], pattern_length: int = 32) -> float:
-    """Compute voice separation as inverse of overlap."""
-    overlap_count = 0
-    total_active = 0
-    for i in range(pattern_length):
-        voices_active = v1_hits[i] + v2_hits[i] + aux_hits[i]
-        if voices_active > 0:
-            total_active += 1
-        if voices_active >= 2:
-            overlap_count += 1
-    return 1.0 - (overlap_count / total_active) if total_active > 0 else 0.5
-
-
-def compute_pentagon_regularity(hits: list[bool], pattern_length: int = 32) -> float:
-    """Compute regularity as inverse of gap variance (CV)."""
-    hit_positions = [i for i, h in enumerate(hits) if h]
-    if len(hit_positions) < 2:
-        return 0.5
-
-    gaps = []
-    for i in range(len(hit_positions)):
-        next_idx = (i + 1) % len(hit_positions)
-        if next_idx == 0:
-            gap = (pattern_length - hit_positions[i]) + hit_positions[0]
+            max_possible_tension += weight_diff
+    raw_sync = min(1.0, syncopation_tension / max_possible_tension) if max_possible_tension > 0 else 0.0
+
+    # Density: fraction of steps where any voice is active
+    raw_dens = total_active / pattern_length
+
+    # Velocity range across all voices
+    all_velocities = [
+        vel
+        for mask, vels in ((v1_mask, v1_vels), (v2_mask, v2_vels), (aux_mask, aux_vels))
+        for i, vel in enumerate(vels)
+        if (mask >> i) & 1 and vel > 0
+    ]
+    raw_vel = max(all_velocities) - min(all_velocities) if len(all_velocities) >= 2 else 0.0
+
+    # Voice separation: inverse of the fraction of active steps with 2+ voices
+    overlap = ((v1_mask & v2_mask) | (v1_mask & aux_mask) | (v2_mask & aux_mask)) & length_mask
+    raw_sep = 1.0 - (popcount(overlap) / total_active) if total_active > 0 else 0.5
+
+    # Regularity: inverse of V1 inter-onset gap variance (CV)
+    raw_reg = 0.5
+    hit_positions = _mask_steps(v1_mask & length_mask)
+    if len(hit_positions) >= 2:
+        # Circular inter-onset intervals: the last gap wraps to the first hit
+        next_positions = (*hit_positions[1:], hit_positions[0] + pattern_length)
+        gaps = [b - a for a, b in zip(hit_positions, next_positions)]
+
+        mean_gap = sum(gaps) / len(gaps)
+        if mean_gap == 0:
+            raw_reg = 1.0
         else:
-            gap = hit_positions[next_idx] - hit_positions[i]
-        gaps.append(gap)
+            variance = sum((g - mean_gap) ** 2 for g in gaps) / len(gaps)
+            cv = math.sqrt(variance) / mean_gap
+            raw_reg = max(0.0, 1.0 - min(1.0, cv))
 
-    mean_gap = sum(gaps) / len(gaps)
-    if mean_gap == 0:
-        return 1.0
-    variance = sum((g - mean_gap) ** 2 for g in gaps) / len(gaps)
-    cv = (variance ** 0.5) / mean_gap
-    return max(0.0, 1.0 - min(1.0, cv))
+    return raw_sync, raw_dens, raw_vel, raw_sep, raw_reg
 
 
 def score_pentagon_metric(raw: float, target_center: float, width: float) -> float:
@@ -261,73 +477,98 @@ def score_pentagon_metric(raw: float, target_center: float, width: float) -> flo
     return max(0.0, 1.0 - (distance / width) ** 2)
 
 
+# Pentagon scoring targets (TIGHTENED v2), as (center, width) per zone.
+# SHAPE zones: 0 = stable (< 0.3), 1 = syncopated (< 0.7), 2 = wild
+PENTAGON_ZONES = ("stable", "syncopated", "wild")
+# Upper bounds of the piecewise-constant zone/bucket lookups; bisect_right
+# maps a knob value to its table index (a value on a bound goes to the next one)
+_SHAPE_ZONE_BOUNDS = (0.3, 0.7)
+_ACCENT_BUCKET_BOUNDS = (0.3, 0.7)
+# Syncopation: Stable: 0.00-0.22, Syncopated: 0.22-0.48, Wild: 0.42-0.75
+_SYNC_TARGETS = ((0.11, 0.14), (0.35, 0.16), (0.58, 0.20))
+# VoiceSep: Stable: 0.62-0.88, Syncopated: 0.52-0.78, Wild: 0.32-0.68
+_SEP_TARGETS = ((0.75, 0.16), (0.65, 0.16), (0.50, 0.22))
+# Regularity: Stable: 0.72-1.00, Syncopated: 0.42-0.68, Wild: 0.12-0.48
+_REG_TARGETS = ((0.86, 0.18), (0.55, 0.16), (0.30, 0.22))
+# Density band (min, max) per zone; ENERGY picks the target within it
+# Stable: 0.15-0.32, Syncopated: 0.25-0.48, Wild: 0.32-0.65
+_DENS_BASE = ((0.15, 0.32), (0.25, 0.48), (0.32, 0.65))
+# Velocity range per ACCENT bucket (< 0.3, < 0.7, else)
+# Low: 0.12-0.38, Med: 0.32-0.58, High: 0.25-0.72
+_VEL_TARGETS = ((0.25, 0.16), (0.45, 0.16), (0.48, 0.28))
+
+
 def compute_pentagon_metrics(pattern: "Pattern") -> PentagonMetrics:
-    """Compute full Pentagon of Musicality analysis."""
-    v1_hits = [s.v1 for s in pattern.steps]
-    v2_hits = [s.v2 for s in pattern.steps]
-    aux_hits = [s.aux for s in pattern.steps]
-    v1_vels = [s.v1_vel for s in pattern.steps]
-    v2_vels = [s.v2_vel for s in pattern.steps]
-    aux_vels = [s.aux_vel for s in pattern.steps]
-    pattern_length = pattern.length
-    shape = pattern.shape
-    energy = pattern.energy
-    accent = pattern.accent
+    """Compute full Pentagon of Musicality analysis.
 
+    Results are cached on the pattern's content (Pattern.pentagon_key), so
+    identical patterns are only scored once, and memoized on the pattern
+    itself, so repeated calls for the same pattern skip rebuilding and
+    hashing the key. The returned PentagonMetrics is shared and immutable.
+    """
+    metrics = pattern._pentagon_metrics
+    if metrics is None:
+        metrics = pattern._pentagon_metrics = _compute_pentagon_metrics(*pattern.pentagon_key)
+    return metrics
+
+
+def compute_pentagon_metrics_batch(patterns: Iterable["Pattern"]) -> list[PentagonMetrics]:
+    """Compute Pentagon metrics for many patterns in one call.
+
+    Same results as calling compute_pentagon_metrics per pattern. The batch
+    is grouped by content key first, so each distinct pattern goes through
+    the cached kernel exactly once however large the batch is (the LRU cache
+    alone would start evicting past its maxsize), and the shared results are
+    fanned back out in input order. Patterns that already carry their
+    metrics are not keyed at all.
+    """
+    patterns = list(patterns)
+    pending = [p for p in patterns if p._pentagon_metrics is None]
+    if pending:
+        keys = [p.pentagon_key for p in pending]
+        kernel = _compute_pentagon_metrics
+        by_key = {key: kernel(*key) for key in dict.fromkeys(keys)}
+        for p, key in zip(pending, keys):
+            p._pentagon_metrics = by_key[key]
+    return [p._pentagon_metrics for p in patterns]
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_pentagon_metrics(
+    v1_mask: int, v2_mask: int, aux_mask: int,
+    v1_vels: tuple[float, ...], v2_vels: tuple[float, ...], aux_vels: tuple[float, ...],
+    shape: float, energy: float, accent: float, pattern_length: int,
+) -> PentagonMetrics:
     # Raw metrics
-    raw_sync = compute_pentagon_syncopation(v1_hits, pattern_length)
-    raw_dens = compute_pentagon_density(v1_hits, v2_hits, aux_hits, pattern_length)
-    raw_vel = compute_pentagon_velocity_range(v1_hits, v2_hits, aux_hits, v1_vels, v2_vels, aux_vels)
-    raw_sep = compute_pentagon_voice_separation(v1_hits, v2_hits, aux_hits, pattern_length)
-    raw_reg = compute_pentagon_regularity(v1_hits, pattern_length)
-
-    # SHAPE-zone scoring targets (TIGHTENED v2)
-    # Syncopation: Stable: 0.00-0.22, Syncopated: 0.22-0.48, Wild: 0.42-0.75
-    # VoiceSep: Stable: 0.62-0.88, Syncopated: 0.52-0.78, Wild: 0.32-0.68
-    # Regularity: Stable: 0.72-1.00, Syncopated: 0.42-0.68, Wild: 0.12-0.48
-    if shape < 0.3:
-        sync_target, sync_width = 0.11, 0.14
-        sep_target, sep_width = 0.75, 0.16
-        reg_target, reg_width = 0.86, 0.18
-        zone = "stable"
-    elif shape < 0.7:
-        sync_target, sync_width = 0.35, 0.16
-        sep_target, sep_width = 0.65, 0.16
-        reg_target, reg_width = 0.55, 0.16
-        zone = "syncopated"
-    else:
-        sync_target, sync_width = 0.58, 0.20
-        sep_target, sep_width = 0.50, 0.22
-        reg_target, reg_width = 0.30, 0.22
-        zone = "wild"
-
-    # ENERGY-based density target (TIGHTENED v2)
-    # Stable: 0.15-0.32, Syncopated: 0.25-0.48, Wild: 0.32-0.65
-    if shape < 0.3:
-        base_min, base_max = 0.15, 0.32
-    elif shape < 0.7:
-        base_min, base_max = 0.25, 0.48
-    else:
-        base_min, base_max = 0.32, 0.65
+    raw_sync, raw_dens, raw_vel, raw_sep, raw_reg = compute_pentagon_raw_metrics(
+        v1_mask, v2_mask, aux_mask, v1_vels, v2_vels, aux_vels, pattern_length,
+    )
+
+    # Zone tables are indexed by SHAPE zone and ACCENT bucket
+    zone_idx = bisect.bisect_right(_SHAPE_ZONE_BOUNDS, shape)
+    accent_idx = bisect.bisect_right(_ACCENT_BUCKET_BOUNDS, accent)
+    zone = PENTAGON_ZONES[zone_idx]
+    sync_target, sync_width = _SYNC_TARGETS[zone_idx]
+    sep_target, sep_width = _SEP_TARGETS[zone_idx]
+    reg_target, reg_width = _REG_TARGETS[zone_idx]
+
+    # ENERGY-based density target within the zone's density band
+    base_min, base_max = _DENS_BASE[zone_idx]
     zone_range = base_max - base_min
     dens_target = base_min + energy * zone_range
     dens_width = zone_range / 2.2
 
-    # ACCENT-based velocity target (TIGHTENED v2)
-    # Low: 0.12-0.38, Med: 0.32-0.58, High: 0.25-0.72
-    if accent < 0.3:
-        vel_target, vel_width = 0.25, 0.16
-    elif accent < 0.7:
-        vel_target, vel_width = 0.45, 0.16
-    else:
-        vel_target, vel_width = 0.48, 0.28
+    vel_target, vel_width = _VEL_TARGETS[accent_idx]
 
-    # Compute scores
-    s_sync = score_pentagon_metric(raw_sync, sync_target, sync_width)
-    s_dens = score_pentagon_metric(raw_dens, dens_target, dens_width)
-    s_vel = score_pentagon_metric(raw_vel, vel_target, vel_width)
-    s_sep = score_pentagon_metric(raw_sep, sep_target, sep_width)
-    s_reg = score_pentagon_metric(raw_reg, reg_target, reg_width)
+    # Compute all five parabolic scores in one pass (same curve as
+    # score_pentagon_metric, without five separate calls)
+    raws = (raw_sync, raw_dens, raw_vel, raw_sep, raw_reg)
+    centers = (sync_target, dens_target, vel_target, sep_target, reg_target)
+    widths = (sync_width, dens_width, vel_width, sep_width, reg_width)
+    s_sync, s_dens, s_vel, s_sep, s_reg = [
+        max(0.0, 1.0 - ((raw - center) / width) ** 2)
+        for raw, center, width in zip(raws, centers, widths)
+    ]
 
     # Composite (weighted sum)
     composite = 0.25 * s_sync + 0.15 * s_dens + 0.20 * s_vel + 0.20 * s_sep + 0.20 * s_reg
@@ -392,14 +633,22 @@ PENTAGON_METRICS = {
 }
 
 
+# The 5 pentagon axes at 72-degree intervals, starting from top, and their
+# unit vectors
+_PENT_ANGLES = tuple(math.radians(-90 + i * 72) for i in range(5))
+_PENT_COS = tuple(math.cos(angle) for angle in _PENT_ANGLES)
+_PENT_SIN = tuple(math.sin(angle) for angle in _PENT_ANGLES)
+
+
+@functools.lru_cache(maxsize=512)
 def generate_pentagon_svg(metrics: PentagonMetrics, size: int = 120, show_values: bool = True) -> str:
-    """Generate SVG radar chart for Pentagon of Musicality."""
+    """Generate SVG radar chart for Pentagon of Musicality.
+
+    Cached: PentagonMetrics is immutable, so identical metrics share one SVG.
+    """
     cx, cy = size / 2, size / 2
     r = size / 2 - 20  # Radius for max score
 
-    # 5 axes at 72-degree intervals, starting from top
-    angles = [math.radians(-90 + i * 72) for i in range(5)]
-
     # Metric keys in display order
     metric_keys = ["syncopation", "density", "velocity_range", "voice_separation", "regularity"]
     labels = [PENTAGON_METRICS[k]["short"] for k in metric_keys]
@@ -429,25 +678,27 @@ def generate_pentagon_svg(metrics: PentagonMetrics, size: int = 120, show_values
             f'<circle cx="{cx}" cy="{cy}" r="{r * pct}" fill="none" stroke="#333333" stroke-width="1" opacity="0.5"/>'
         )
 
+    # Range status for all five axes in one pass over the pre-parsed targets
+    range_status = [
+        (target, *_check_bounds(raw_val, lo, hi), _alignment_in_bounds(raw_val, lo, hi))
+        for raw_val, (target, lo, hi) in zip(raw_values, _zone_target_ranges(metrics.shape_zone))
+    ]
+
     # Draw axis lines and labels with color-coded range status
-    for i, (angle, label, raw_val, score_val) in enumerate(zip(angles, labels, raw_values, score_values)):
-        key = metric_keys[i]
+    for key, cos_a, sin_a, label, raw_val, (target, in_range, distance, status_text, alignment) in zip(
+        metric_keys, _PENT_COS, _PENT_SIN, labels, raw_values, range_status
+    ):
         meta = PENTAGON_METRICS[key]
-        target = meta["target_by_zone"].get(metrics.shape_zone, "0.0-1.0")
 
-        # Check if in range
-        in_range, distance, status_text = check_in_range(raw_val, target)
-        alignment = compute_alignment_score(raw_val, target)
-
-        x_end = cx + r * math.cos(angle)
-        y_end = cy + r * math.sin(angle)
+        x_end = cx + r * cos_a
+        y_end = cy + r * sin_a
         svg_parts.append(
             f'<line x1="{cx}" y1="{cy}" x2="{x_end}" y2="{y_end}" stroke="#444444" stroke-width="1"/>'
         )
 
         # Label position (slightly beyond the axis)
-        lx = cx + (r + 14) * math.cos(angle)
-        ly = cy + (r + 14) * math.sin(angle)
+        lx = cx + (r + 14) * cos_a
+        ly = cy + (r + 14) * sin_a
 
         # Color based on range status: green=in, orange=close, red=far
         if in_range:
@@ -475,31 +726,27 @@ def generate_pentagon_svg(metrics: PentagonMetrics, size: int = 120, show_values
         )
 
     # Draw raw values polygon (dim)
-    raw_points = []
-    for i, (angle, val) in enumerate(zip(angles, raw_values)):
-        px = cx + r * val * math.cos(angle)
-        py = cy + r * val * math.sin(angle)
-        raw_points.append(f"{px},{py}")
+    raw_points = [
+        f"{cx + r * val * cos_a},{cy + r * val * sin_a}"
+        for val, cos_a, sin_a in zip(raw_values, _PENT_COS, _PENT_SIN)
+    ]
     svg_parts.append(
         f'<polygon points="{" ".join(raw_points)}" fill="#4ecdc4" fill-opacity="0.15" '
         f'stroke="#4ecdc4" stroke-width="1" stroke-opacity="0.4"/>'
     )
 
     # Draw scored values polygon (bright)
-    score_points = []
-    for i, (angle, val) in enumerate(zip(angles, score_values)):
-        px = cx + r * val * math.cos(angle)
-        py = cy + r * val * math.sin(angle)
-        score_points.append(f"{px},{py}")
+    score_vertices = [
+        (cx + r * val * cos_a, cy + r * val * sin_a)
+        for val, cos_a, sin_a in zip(score_values, _PENT_COS, _PENT_SIN)
+    ]
     svg_parts.append(
-        f'<polygon points="{" ".join(score_points)}" fill="#ff6b35" fill-opacity="0.3" '
+        f'<polygon points="{" ".join(f"{px},{py}" for px, py in score_vertices)}" fill="#ff6b35" fill-opacity="0.3" '
         f'stroke="#ff6b35" stroke-width="2"/>'
     )
 
     # Draw dots at scored vertices
-    for i, (angle, val) in enumerate(zip(angles, score_values)):
-        px = cx + r * val * math.cos(angle)
-        py = cy + r * val * math.sin(angle)
+    for px, py in score_vertices:
         svg_parts.append(f'<circle cx="{px}" cy="{py}" r="3" fill="#ff6b35"/>')
 
     # Composite score in center
@@ -592,6 +839,7 @@ def generate_knob_svg(
     return svg
 
 
+@functools.lru_cache(maxsize=512)
 def generate_knob_panel_svg(
     shape: float,
     energy: float,
@@ -602,7 +850,11 @@ def generate_knob_panel_svg(
     seed: Optional[int] = None,
     highlight_param: Optional[str] = None,
 ) -> str:
-    """Generate a panel with two 2x2 grids of knobs matching hardware layout."""
+    """Generate a panel with two 2x2 grids of knobs matching hardware layout.
+
+    Cached: the panel is a pure function of its arguments, and the same knob
+    settings recur across sweeps.
+    """
     knob_size = 44
     knob_spacing = 4
     grid_spacing = 24  # Space between the two 2x2 grids
@@ -693,83 +945,136 @@ def generate_knob_panel_svg(
     return '\n'.join(svg_parts)
 
 
-def generate_pattern_svg(pattern: Pattern, show_velocity: bool = True) -> str:
-    """Generate SVG for a single pattern."""
+# Per-step SVG fragments for generate_pattern_svg, with the layout constants
+# baked in so only positions, colors and opacities are formatted per step
+_GRID_DOWNBEAT = ('<rect x="{}" y="0" width="%d" height="{}" fill="%s"/>' % (STEP_WIDTH, COLORS["downbeat"])).format
+_GRID_LINE = '<line x1="{0}" y1="0" x2="{0}" y2="{1}" stroke="{2}" stroke-width="1"/>'.format
+_NOTE_HIT = (
+    '<rect x="{}" y="{}" width="%d" height="%d" rx="3" fill="{}" opacity="{:.2f}"/>'
+    % (STEP_WIDTH - 4, STEP_HEIGHT - 4)
+).format
+_NOTE_EMPTY = (
+    '<rect x="{}" y="{}" width="%d" height="4" rx="2" fill="{}" opacity="0.3"/>'
+    % (STEP_WIDTH - 12)
+).format
+_VELOCITY_BAR_WIDTH = (STEP_WIDTH - 6) / 3
+_VELOCITY_BAR = (
+    '<rect x="{}" y="{}" width="%s" height="{}" fill="{}" opacity="0.8"/>' % _VELOCITY_BAR_WIDTH
+).format
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_grid(num_steps: int) -> str:
+    """Beat grid of a pattern SVG: downbeats every 4 steps get a highlight
+    and a stronger line. Newline-terminated."""
+    grid_height = 3 * STEP_HEIGHT + 2 * VOICE_GAP
+    parts = []
+    for step in range(num_steps):
+        x = LABEL_WIDTH + step * STEP_WIDTH
+        if step % 4 == 0:
+            parts.append(_GRID_DOWNBEAT(x, grid_height))
+            parts.append(_GRID_LINE(x, grid_height, COLORS["grid_line_strong"]))
+        else:
+            parts.append(_GRID_LINE(x, grid_height, COLORS["grid_line"]))
+    parts.append("")
+    return "\n".join(parts)
+
+
+def pattern_grid_defs(lengths: Iterable[int]) -> str:
+    """Hidden SVG defining one shared beat grid per pattern length.
+
+    Put it once in a page, then render patterns with
+    ``generate_pattern_svg(..., shared_grid=True)``: each one references its
+    grid with a single <use> instead of repeating the grid's elements.
+    """
+    parts = ['<svg width="0" height="0" style="position: absolute;" aria-hidden="true"><defs>']
+    for num_steps in sorted(set(lengths)):
+        parts.append(f'<g id="pattern-grid-{num_steps}">\n{_pattern_grid(num_steps)}</g>')
+    parts.append('</defs></svg>')
+    return "\n".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_svg_frame(num_steps: int, show_velocity: bool, shared_grid: bool = False) -> str:
+    """SVG header and beat grid for generate_pattern_svg.
+
+    Depends only on the pattern length, so it is built once per length and
+    reused for every pattern instead of re-emitting the grid per render.
+    With ``shared_grid`` the grid is a <use> of the page's pattern_grid_defs.
+    """
+    grid_width = num_steps * STEP_WIDTH
+    grid_height = 3 * STEP_HEIGHT + 2 * VOICE_GAP
+    total_height = grid_height + VELOCITY_HEIGHT + 8 if show_velocity else grid_height
+    total_width = LABEL_WIDTH + grid_width
+
+    grid = f'<use href="#pattern-grid-{num_steps}"/>\n' if shared_grid else _pattern_grid(num_steps)
+    return (
+        f'<svg width="{total_width}" height="{total_height}" '
+        f'xmlns="http://www.w3.org/2000/svg" style="font-family: -apple-system, BlinkMacSystemFont, sans-serif; font-size: 11px;">\n'
+        f'<rect width="100%" height="100%" fill="{COLORS["grid_bg"]}"/>\n'
+        f'{grid}'
+    )
+
+
+def generate_pattern_svg(
+    pattern: Pattern,
+    show_velocity: bool = True,
+    out: Optional[TextIO] = None,
+    shared_grid: bool = False,
+) -> Optional[str]:
+    """Generate SVG for a single pattern.
+
+    If ``out`` is given, the SVG is written straight into it (e.g. the page
+    buffer) and None is returned; otherwise it is returned as a string.
+    ``shared_grid`` draws the beat grid as a reference to pattern_grid_defs,
+    which the surrounding page must include.
+    """
     num_steps = pattern.length
     num_voices = 3
 
     # Calculate dimensions
     grid_width = num_steps * STEP_WIDTH
     grid_height = num_voices * STEP_HEIGHT + (num_voices - 1) * VOICE_GAP
-
-    if show_velocity:
-        total_height = grid_height + VELOCITY_HEIGHT + 8
-    else:
-        total_height = grid_height
-
     total_width = LABEL_WIDTH + grid_width
 
-    svg_parts = [
-        f'<svg width="{total_width}" height="{total_height}" '
-        f'xmlns="http://www.w3.org/2000/svg" style="font-family: -apple-system, BlinkMacSystemFont, sans-serif; font-size: 11px;">',
-        f'<rect width="100%" height="100%" fill="{COLORS["grid_bg"]}"/>',
-    ]
-
-    # Draw grid background with beat markers
-    for step in range(num_steps):
-        x = LABEL_WIDTH + step * STEP_WIDTH
-        # Highlight downbeats (every 4 steps)
-        if step % 4 == 0:
-            svg_parts.append(
-                f'<rect x="{x}" y="0" width="{STEP_WIDTH}" height="{grid_height}" '
-                f'fill="{COLORS["downbeat"]}"/>'
-            )
-        # Draw vertical grid lines
-        line_color = COLORS["grid_line_strong"] if step % 4 == 0 else COLORS["grid_line"]
-        svg_parts.append(
-            f'<line x1="{x}" y1="0" x2="{x}" y2="{grid_height}" '
-            f'stroke="{line_color}" stroke-width="1"/>'
-        )
+    buf = io.StringIO() if out is None else out
+    write = buf.write
+    write(_pattern_svg_frame(num_steps, show_velocity, shared_grid))
 
     # Voice labels and rows
     voices = [
-        ("V1", "Anchor", COLORS["v1"], COLORS["v1_dim"], lambda s: s.v1, lambda s: s.v1_vel),
-        ("V2", "Shimmer", COLORS["v2"], COLORS["v2_dim"], lambda s: s.v2, lambda s: s.v2_vel),
-        ("AUX", "Aux", COLORS["aux"], COLORS["aux_dim"], lambda s: s.aux, lambda s: s.aux_vel),
+        ("V1", COLORS["v1"], COLORS["v1_dim"], pattern.v1_mask, pattern.v1_vels),
+        ("V2", COLORS["v2"], COLORS["v2_dim"], pattern.v2_mask, pattern.v2_vels),
+        ("AUX", COLORS["aux"], COLORS["aux_dim"], pattern.aux_mask, pattern.aux_vels),
     ]
+    step_indices = [s.step for s in pattern.steps]
 
-    for voice_idx, (short_name, full_name, color, dim_color, hit_fn, vel_fn) in enumerate(voices):
+    for voice_idx, (short_name, color, dim_color, mask, vels) in enumerate(voices):
         y = voice_idx * (STEP_HEIGHT + VOICE_GAP)
 
         # Voice label
-        svg_parts.append(
+        write(
             f'<text x="{LABEL_WIDTH - 8}" y="{y + STEP_HEIGHT / 2 + 4}" '
-            f'fill="{color}" text-anchor="end" font-weight="500">{short_name}</text>'
+            f'fill="{color}" text-anchor="end" font-weight="500">{short_name}</text>\n'
         )
 
-        # Draw hits for this voice
-        for step in pattern.steps:
-            x = LABEL_WIDTH + step.step * STEP_WIDTH
-            if hit_fn(step):
-                vel = vel_fn(step)
-                # Note block with velocity-based opacity
-                opacity = 0.4 + vel * 0.6
-                svg_parts.append(
-                    f'<rect x="{x + 2}" y="{y + 2}" width="{STEP_WIDTH - 4}" height="{STEP_HEIGHT - 4}" '
-                    f'rx="3" fill="{color}" opacity="{opacity:.2f}"/>'
-                )
-            else:
-                # Empty step indicator
-                svg_parts.append(
-                    f'<rect x="{x + 6}" y="{y + STEP_HEIGHT // 2 - 2}" width="{STEP_WIDTH - 12}" height="4" '
-                    f'rx="2" fill="{dim_color}" opacity="0.3"/>'
-                )
+        # Note blocks with velocity-based opacity, or an empty step indicator
+        if step_indices:
+            hit_y = y + 2
+            empty_y = y + STEP_HEIGHT // 2 - 2
+            write("\n".join(
+                _NOTE_HIT(LABEL_WIDTH + i * STEP_WIDTH + 2, hit_y, color, 0.4 + vels[i] * 0.6)
+                if (mask >> i) & 1 else
+                _NOTE_EMPTY(LABEL_WIDTH + i * STEP_WIDTH + 6, empty_y, dim_color)
+                for i in step_indices
+            ))
+            write("\n")
 
         # Horizontal divider line
-        svg_parts.append(
+        write(
             f'<line x1="{LABEL_WIDTH}" y1="{y + STEP_HEIGHT + VOICE_GAP // 2}" '
             f'x2="{total_width}" y2="{y + STEP_HEIGHT + VOICE_GAP // 2}" '
-            f'stroke="{COLORS["grid_line"]}" stroke-width="1"/>'
+            f'stroke="{COLORS["grid_line"]}" stroke-width="1"/>\n'
         )
 
     # Velocity section
@@ -777,54 +1082,67 @@ def generate_pattern_svg(pattern: Pattern, show_velocity: bool = True) -> str:
         vel_y = grid_height + 8
 
         # Background
-        svg_parts.append(
+        write(
             f'<rect x="{LABEL_WIDTH}" y="{vel_y}" width="{grid_width}" height="{VELOCITY_HEIGHT}" '
-            f'fill="{COLORS["velocity_bg"]}" rx="2"/>'
+            f'fill="{COLORS["velocity_bg"]}" rx="2"/>\n'
         )
 
         # Label
-        svg_parts.append(
+        write(
             f'<text x="{LABEL_WIDTH - 8}" y="{vel_y + VELOCITY_HEIGHT / 2 + 4}" '
-            f'fill="{COLORS["text_dim"]}" text-anchor="end" font-size="10">VEL</text>'
+            f'fill="{COLORS["text_dim"]}" text-anchor="end" font-size="10">VEL</text>\n'
         )
 
-        # Draw velocity bars for all voices
-        bar_width = (STEP_WIDTH - 6) / 3
-        for step in pattern.steps:
-            x = LABEL_WIDTH + step.step * STEP_WIDTH + 2
-
-            for i, (_, _, color, _, hit_fn, vel_fn) in enumerate(voices):
-                if hit_fn(step):
-                    vel = vel_fn(step)
-                    bar_height = vel * (VELOCITY_HEIGHT - 4)
-                    bar_x = x + i * (bar_width + 1)
-                    svg_parts.append(
-                        f'<rect x="{bar_x}" y="{vel_y + VELOCITY_HEIGHT - 2 - bar_height}" '
-                        f'width="{bar_width}" height="{bar_height}" fill="{color}" opacity="0.8"/>'
-                    )
+        # Draw velocity bars for all voices, side by side within each step
+        bar_base = vel_y + VELOCITY_HEIGHT - 2
+        bar_scale = VELOCITY_HEIGHT - 4
+        bar_voices = [
+            (voice_idx * (_VELOCITY_BAR_WIDTH + 1), color, mask, vels)
+            for voice_idx, (_, color, _, mask, vels) in enumerate(voices)
+        ]
+        bars = [
+            _VELOCITY_BAR(
+                LABEL_WIDTH + i * STEP_WIDTH + 2 + offset,
+                bar_base - vels[i] * bar_scale,
+                vels[i] * bar_scale,
+                color,
+            )
+            for i in step_indices
+            for offset, color, mask, vels in bar_voices
+            if (mask >> i) & 1
+        ]
+        if bars:
+            write("\n".join(bars))
+            write("\n")
 
-    svg_parts.append('</svg>')
-    return '\n'.join(svg_parts)
+    write('</svg>')
+    return buf.getvalue() if out is None else None
+
+
+# Step masks for a 32-step pattern: quarter notes (every 4th step) and offbeat
+# 16ths (odd steps)
+_QUARTER_MASK_32 = 0x11111111
+_OFFBEAT_MASK_32 = 0xAAAAAAAA
 
 
 def compute_pattern_metrics(pattern: Pattern) -> dict:
     """Compute detailed metrics for a single pattern (from expressiveness evaluation)."""
-    v1_positions = [s.step for s in pattern.steps if s.v1]
-    v2_positions = [s.step for s in pattern.steps if s.v2]
+    v1_positions = _mask_steps(pattern.v1_mask)
 
     metrics = {
         "v1_hits": pattern.v1_hits,
         "v2_hits": pattern.v2_hits,
         "aux_hits": pattern.aux_hits,
-        "v1_mask": sum(1 << s.step for s in pattern.steps if s.v1),
-        "v2_mask": sum(1 << s.step for s in pattern.steps if s.v2),
-        "aux_mask": sum(1 << s.step for s in pattern.steps if s.aux),
+        # Packed once at Pattern construction (Pattern.rebuild_arrays)
+        "v1_mask": pattern.v1_mask,
+        "v2_mask": pattern.v2_mask,
+        "aux_mask": pattern.aux_mask,
     }
 
     # Rhythmic analysis
-    quarter_notes = {0, 4, 8, 12, 16, 20, 24, 28}
-    metrics["quarter_note_hits"] = len([p for p in v1_positions if p in quarter_notes])
-    metrics["offbeat_hits"] = len([p for p in v1_positions if p % 2 == 1])
+    v1_mask = pattern.v1_mask
+    metrics["quarter_note_hits"] = popcount(v1_mask & _QUARTER_MASK_32)
+    metrics["offbeat_hits"] = popcount(v1_mask & _OFFBEAT_MASK_32)
     metrics["syncopation_ratio"] = metrics["offbeat_hits"] / len(v1_positions) if v1_positions else 0.0
 
     # Gap analysis (V1)
@@ -835,7 +1153,7 @@ def compute_pattern_metrics(pattern: Pattern) -> dict:
         metrics["min_gap"] = min(gaps)
         metrics["avg_gap"] = sum(gaps) / len(gaps)
         gap_variance = sum((g - metrics["avg_gap"]) ** 2 for g in gaps) / len(gaps)
-        std_dev = gap_variance ** 0.5
+        std_dev = math.sqrt(gap_variance)
         metrics["regularity_score"] = max(0.0, 1.0 - std_dev / 8.0)
     else:
         metrics["gaps"] = []
@@ -845,8 +1163,9 @@ def compute_pattern_metrics(pattern: Pattern) -> dict:
         metrics["regularity_score"] = 0
 
     # Velocity analysis
-    v1_vels = [s.v1_vel for s in pattern.steps if s.v1 and s.v1_vel > 0]
-    v2_vels = [s.v2_vel for s in pattern.steps if s.v2 and s.v2_vel > 0]
+    v1_step_vels, v2_step_vels = pattern.v1_vels, pattern.v2_vels
+    v1_vels = [v1_step_vels[i] for i in v1_positions if v1_step_vels[i] > 0]
+    v2_vels = [v2_step_vels[i] for i in _mask_steps(pattern.v2_mask) if v2_step_vels[i] > 0]
     metrics["v1_avg_velocity"] = sum(v1_vels) / len(v1_vels) if v1_vels else 0
     metrics["v1_velocity_range"] = max(v1_vels) - min(v1_vels) if len(v1_vels) > 1 else 0
     metrics["v2_avg_velocity"] = sum(v2_vels) / len(v2_vels) if v2_vels else 0
@@ -865,9 +1184,10 @@ def compute_seed_variation(patterns: list[Pattern]) -> dict:
     aux_masks = set()
 
     for p in patterns:
-        v1_masks.add(sum(1 << s.step for s in p.steps if s.v1))
-        v2_masks.add(sum(1 << s.step for s in p.steps if s.v2))
-        aux_masks.add(sum(1 << s.step for s in p.steps if s.aux))
+        v1_mask, v2_mask, aux_mask = p.masks
+        v1_masks.add(v1_mask)
+        v2_masks.add(v2_mask)
+        aux_masks.add(aux_mask)
 
     def variation_score(unique_count: int, total: int) -> float:
         if total <= 1:
@@ -886,6 +1206,24 @@ def compute_seed_variation(patterns: list[Pattern]) -> dict:
     }
 
 
+def _variation_scores(seed_variation: dict) -> tuple[float, float, float]:
+    """(V1, V2, AUX) variation scores from compute_seed_variation output."""
+    return (
+        seed_variation.get("v1_score", 0),
+        seed_variation.get("v2_score", 0),
+        seed_variation.get("aux_score", 0),
+    )
+
+
+def _mean_hits(step_stats: dict) -> tuple[float, float, float]:
+    """(V1, V2, AUX) mean hits per pattern from compute_step_statistics output."""
+    return (
+        step_stats["v1"]["mean_hits_per_pattern"],
+        step_stats["v2"]["mean_hits_per_pattern"],
+        step_stats["aux"]["mean_hits_per_pattern"],
+    )
+
+
 def generate_expressiveness_svg(stats: dict, title: str, width: int = 600) -> str:
     """Generate SVG showing expressiveness metrics."""
     height = 120
@@ -906,10 +1244,11 @@ def generate_expressiveness_svg(stats: dict, title: str, width: int = 600) -> st
     bar_height = 16
     bar_gap = 8
 
+    v1_score, v2_score, aux_score = _variation_scores(stats)
     metrics = [
-        ("V1 Variation", stats.get("v1_score", 0), COLORS["v1"]),
-        ("V2 Variation", stats.get("v2_score", 0), COLORS["v2"]),
-        ("AUX Variation", stats.get("aux_score", 0), COLORS["aux"]),
+        ("V1 Variation", v1_score, COLORS["v1"]),
+        ("V2 Variation", v2_score, COLORS["v2"]),
+        ("AUX Variation", aux_score, COLORS["aux"]),
     ]
 
     for i, (label, value, color) in enumerate(metrics):
@@ -951,8 +1290,8 @@ def generate_expressiveness_svg(stats: dict, title: str, width: int = 600) -> st
     )
 
     # Pass/fail indicator
-    overall = (stats.get("v1_score", 0) + stats.get("v2_score", 0) + stats.get("aux_score", 0)) / 3
-    status = "PASS" if stats.get("v2_score", 0) >= 0.5 else "FAIL"
+    overall = (v1_score + v2_score + aux_score) / 3
+    status = "PASS" if v2_score >= 0.5 else "FAIL"
     status_color = "#44ff44" if status == "PASS" else "#ff4444"
     svg_parts.append(
         f'<text x="{width - 12}" y="{y}" text-anchor="end" fill="{status_color}" '
@@ -963,53 +1302,114 @@ def generate_expressiveness_svg(stats: dict, title: str, width: int = 600) -> st
     return '\n'.join(svg_parts)
 
 
-def compute_step_statistics(patterns: list[Pattern], num_steps: int = 32) -> dict:
-    """Compute per-step hit statistics across a collection of patterns."""
-    # Initialize counters
-    v1_counts = [0] * num_steps
-    v2_counts = [0] * num_steps
-    aux_counts = [0] * num_steps
-    v1_velocities = [[] for _ in range(num_steps)]
-    v2_velocities = [[] for _ in range(num_steps)]
-    aux_velocities = [[] for _ in range(num_steps)]
-
-    num_patterns = len(patterns)
-
-    for pattern in patterns:
-        for step in pattern.steps:
-            if step.step >= num_steps:
-                continue
-            if step.v1:
-                v1_counts[step.step] += 1
-                v1_velocities[step.step].append(step.v1_vel)
-            if step.v2:
-                v2_counts[step.step] += 1
-                v2_velocities[step.step].append(step.v2_vel)
-            if step.aux:
-                aux_counts[step.step] += 1
-                aux_velocities[step.step].append(step.aux_vel)
-
-    def calc_stats(counts, velocities):
-        import statistics
-        frequencies = [c / num_patterns if num_patterns > 0 else 0 for c in counts]
-        avg_vels = []
-        for vels in velocities:
-            avg_vels.append(statistics.mean(vels) if vels else 0)
+@functools.lru_cache(maxsize=4096)
+def _mask_steps(mask: int) -> tuple[int, ...]:
+    """Indices of the set bits in a hit mask, in ascending order.
+
+    Seeds and sweeps produce the same masks over and over, so the bit walk is
+    done once per distinct mask.
+    """
+    steps = []
+    while mask:
+        low = mask & -mask
+        steps.append(low.bit_length() - 1)
+        mask ^= low
+    return tuple(steps)
+
+
+class StepAccumulator:
+    """Running per-step hit counts and velocity sums for a collection of patterns.
+
+    Patterns are folded in one at a time with add(), so statistics can be
+    gathered while patterns are generated rather than in a second pass.
+    """
+
+    def __init__(self, num_steps: int = 32):
+        self.num_steps = num_steps
+        self.num_patterns = 0
+        self.v1_counts = [0] * num_steps
+        self.v2_counts = [0] * num_steps
+        self.aux_counts = [0] * num_steps
+        self.v1_vel_sums = [0.0] * num_steps
+        self.v2_vel_sums = [0.0] * num_steps
+        self.aux_vel_sums = [0.0] * num_steps
+
+    def add(self, pattern: Pattern) -> None:
+        """Fold one pattern's hits and velocities into the running totals."""
+        self.num_patterns += 1
+        # Walk only the set bits of each voice's packed hit mask, clipped to
+        # the step window, so empty steps cost nothing
+        window = (1 << self.num_steps) - 1
+        for counts, vel_sums, mask, vels in (
+            (self.v1_counts, self.v1_vel_sums, pattern.v1_mask, pattern.v1_vels),
+            (self.v2_counts, self.v2_vel_sums, pattern.v2_mask, pattern.v2_vels),
+            (self.aux_counts, self.aux_vel_sums, pattern.aux_mask, pattern.aux_vels),
+        ):
+            for i in _mask_steps(mask & window):
+                counts[i] += 1
+                vel_sums[i] += vels[i]
+
+    def extend(self, patterns: Sequence[Pattern]) -> None:
+        """Fold a batch of patterns in; same totals as add() on each in turn.
+
+        Each voice is accumulated in one flat loop over the (step, velocity)
+        hits of the whole batch rather than one call and inner loop per
+        pattern.
+        """
+        self.num_patterns += len(patterns)
+        window = (1 << self.num_steps) - 1
+        for counts, vel_sums, arrays in (
+            (self.v1_counts, self.v1_vel_sums, [(p.v1_mask, p.v1_vels) for p in patterns]),
+            (self.v2_counts, self.v2_vel_sums, [(p.v2_mask, p.v2_vels) for p in patterns]),
+            (self.aux_counts, self.aux_vel_sums, [(p.aux_mask, p.aux_vels) for p in patterns]),
+        ):
+            flat_hits = ((i, vels[i]) for mask, vels in arrays for i in _mask_steps(mask & window))
+            for i, vel in flat_hits:
+                counts[i] += 1
+                vel_sums[i] += vel
+
+    def statistics(self) -> dict:
+        """Return the per-step statistics in the compute_step_statistics format.
+
+        The returned lists are copies, so callers may modify them without
+        affecting later statistics from this accumulator.
+        """
+        num_patterns = self.num_patterns
+
+        def calc_stats(counts, vel_sums):
+            avg_vels = [total / c if c else 0 for total, c in zip(vel_sums, counts)]
+            total_hits = sum(counts)
+            return {
+                "counts": list(counts),
+                "frequencies": [c / num_patterns for c in counts] if num_patterns else [0] * len(counts),
+                "avg_velocities": avg_vels,
+                "total_hits": total_hits,
+                "mean_hits_per_pattern": total_hits / num_patterns if num_patterns else 0,
+            }
+
         return {
-            "counts": counts,
-            "frequencies": frequencies,
-            "avg_velocities": avg_vels,
-            "total_hits": sum(counts),
-            "mean_hits_per_pattern": sum(counts) / num_patterns if num_patterns > 0 else 0,
+            "num_patterns": num_patterns,
+            "num_steps": self.num_steps,
+            "v1": calc_stats(self.v1_counts, self.v1_vel_sums),
+            "v2": calc_stats(self.v2_counts, self.v2_vel_sums),
+            "aux": calc_stats(self.aux_counts, self.aux_vel_sums),
         }
 
-    return {
-        "num_patterns": num_patterns,
-        "num_steps": num_steps,
-        "v1": calc_stats(v1_counts, v1_velocities),
-        "v2": calc_stats(v2_counts, v2_velocities),
-        "aux": calc_stats(aux_counts, aux_velocities),
-    }
+
+def compute_step_statistics(patterns: list[Pattern], num_steps: int = 32) -> dict:
+    """Compute per-step hit statistics across a collection of patterns."""
+    accumulator = StepAccumulator(num_steps)
+    accumulator.extend(patterns)
+    return accumulator.statistics()
+
+
+# PentagonMetrics fields averaged by compute_pentagon_statistics, and a single
+# C-level getter returning them as a tuple
+_PENTAGON_AVG_FIELDS = (
+    "raw_syncopation", "raw_density", "raw_velocity_range",
+    "raw_voice_separation", "raw_regularity", "composite",
+)
+_pentagon_avg_values = operator.attrgetter(*_PENTAGON_AVG_FIELDS)
 
 
 def compute_pentagon_statistics(patterns: list[Pattern]) -> dict:
@@ -1017,38 +1417,39 @@ def compute_pentagon_statistics(patterns: list[Pattern]) -> dict:
     if not patterns:
         return {}
 
-    # Compute Pentagon metrics for each pattern
-    all_metrics = [compute_pentagon_metrics(p) for p in patterns]
-
-    # Aggregate by zone
-    by_zone = {"stable": [], "syncopated": [], "wild": []}
-    for m in all_metrics:
-        by_zone[m.shape_zone].append(m)
-
-    def avg_metrics(metrics_list):
-        if not metrics_list:
+    # Single pass keeping running sums of _PENTAGON_AVG_FIELDS per zone and
+    # in total
+    zone_sums = {"stable": [0.0] * 6, "syncopated": [0.0] * 6, "wild": [0.0] * 6}
+    zone_counts = dict.fromkeys(zone_sums, 0)
+    total_sums = [0.0] * 6
+    for m in compute_pentagon_metrics_batch(patterns):
+        zone_counts[m.shape_zone] += 1
+        sums = zone_sums[m.shape_zone]
+        for i, value in enumerate(_pentagon_avg_values(m)):
+            sums[i] += value
+            total_sums[i] += value
+
+    def avg_metrics(sums, n):
+        if not n:
             return None
-        n = len(metrics_list)
-        return {
-            "count": n,
-            "raw_syncopation": sum(m.raw_syncopation for m in metrics_list) / n,
-            "raw_density": sum(m.raw_density for m in metrics_list) / n,
-            "raw_velocity_range": sum(m.raw_velocity_range for m in metrics_list) / n,
-            "raw_voice_separation": sum(m.raw_voice_separation for m in metrics_list) / n,
-            "raw_regularity": sum(m.raw_regularity for m in metrics_list) / n,
-            "composite": sum(m.composite for m in metrics_list) / n,
-        }
+        averages = {"count": n}
+        averages.update(zip(_PENTAGON_AVG_FIELDS, (total / n for total in sums)))
+        return averages
 
     return {
-        "total": avg_metrics(all_metrics),
-        "stable": avg_metrics(by_zone["stable"]),
-        "syncopated": avg_metrics(by_zone["syncopated"]),
-        "wild": avg_metrics(by_zone["wild"]),
+        "total": avg_metrics(total_sums, len(patterns)),
+        "stable": avg_metrics(zone_sums["stable"], zone_counts["stable"]),
+        "syncopated": avg_metrics(zone_sums["syncopated"], zone_counts["syncopated"]),
+        "wild": avg_metrics(zone_sums["wild"], zone_counts["wild"]),
     }
 
 
+@functools.lru_cache(maxsize=None)
 def parse_target_range(target_str: str) -> tuple[float, float]:
-    """Parse target range string like '0.0-0.25' into (min, max) tuple."""
+    """Parse target range string like '0.0-0.25' into (min, max) tuple.
+
+    Cached: targets come from the small fixed set in PENTAGON_METRICS.
+    """
     try:
         parts = target_str.split("-")
         if len(parts) == 2:
@@ -1063,16 +1464,12 @@ def check_in_range(value: float, target_str: str) -> tuple[bool, float, str]:
     Check if value is in target range.
     Returns: (is_in_range, distance_from_range, status_text)
     """
-    min_val, max_val = parse_target_range(target_str)
+    return _check_bounds(value, *parse_target_range(target_str))
+
 
+def _check_bounds(value: float, min_val: float, max_val: float) -> tuple[bool, float, str]:
+    """check_in_range against an already-parsed (min, max) target."""
     if min_val <= value <= max_val:
-        # In range - calculate how centered it is (0 = edge, 1 = center)
-        range_center = (min_val + max_val) / 2
-        range_width = (max_val - min_val) / 2
-        if range_width > 0:
-            centeredness = 1.0 - abs(value - range_center) / range_width
-        else:
-            centeredness = 1.0
         return True, 0.0, f"✓ In range ({min_val:.2f}-{max_val:.2f})"
     else:
         # Out of range - calculate distance
@@ -1090,7 +1487,11 @@ def compute_alignment_score(value: float, target_str: str) -> float:
     1.0 = perfectly centered in target range
     0.0 = far outside target range
     """
-    min_val, max_val = parse_target_range(target_str)
+    return _alignment_in_bounds(value, *parse_target_range(target_str))
+
+
+def _alignment_in_bounds(value: float, min_val: float, max_val: float) -> float:
+    """compute_alignment_score against an already-parsed (min, max) target."""
     range_center = (min_val + max_val) / 2
     range_width = (max_val - min_val) / 2
 
@@ -1104,8 +1505,28 @@ def compute_alignment_score(value: float, target_str: str) -> float:
     return score
 
 
+@functools.lru_cache(maxsize=None)
+def _zone_target_ranges(zone: str) -> tuple[tuple[str, float, float], ...]:
+    """(target_str, min, max) for each pentagon axis, in PENTAGON_METRICS order.
+
+    Target strings only depend on the zone, so they are parsed once per zone
+    instead of twice per axis on every render.
+    """
+    targets = [meta["target_by_zone"].get(zone, "0.0-1.0") for meta in PENTAGON_METRICS.values()]
+    return tuple((target, *parse_target_range(target)) for target in targets)
+
+
 def generate_pentagon_radar_svg(pentagon_stats: dict, size: int = 400) -> str:
     """Generate just the radar chart SVG for Pentagon of Musicality."""
+    total_data = pentagon_stats.get("total", {})
+    raw_attrs = ["raw_syncopation", "raw_density", "raw_velocity_range", "raw_voice_separation", "raw_regularity"]
+    total_values = tuple(total_data.get(attr, 0.5) for attr in raw_attrs)
+    return _pentagon_radar_svg(total_values, total_data.get("composite", 0.5), size)
+
+
+@functools.lru_cache(maxsize=32)
+def _pentagon_radar_svg(total_values: tuple[float, ...], total_composite: float, size: int) -> str:
+    """Radar chart body; cached since the chart only depends on the averages."""
     metric_keys = ["syncopation", "density", "velocity_range", "voice_separation", "regularity"]
 
     chart_cx = size // 2
@@ -1117,13 +1538,8 @@ def generate_pentagon_radar_svg(pentagon_stats: dict, size: int = 400) -> str:
         f'style="font-family: -apple-system, BlinkMacSystemFont, sans-serif;">',
     ]
 
-    angles = [math.radians(-90 + i * 72) for i in range(5)]
     labels = [PENTAGON_METRICS[k]["short"] for k in metric_keys]
 
-    total_data = pentagon_stats.get("total", {})
-    raw_attrs = ["raw_syncopation", "raw_density", "raw_velocity_range", "raw_voice_separation", "raw_regularity"]
-    total_values = [total_data.get(attr, 0.5) for attr in raw_attrs]
-
     # Draw grid circles
     for pct in [0.25, 0.5, 0.75, 1.0]:
         svg_parts.append(
@@ -1133,30 +1549,27 @@ def generate_pentagon_radar_svg(pentagon_stats: dict, size: int = 400) -> str:
     # Draw target zone bands
     zone_colors_map = {"stable": "#44aa44", "syncopated": "#aaaa44", "wild": "#aa4444"}
     for zone, zone_color in zone_colors_map.items():
-        zone_max_points = []
-        for i, (angle, key) in enumerate(zip(angles, metric_keys)):
-            target_str = PENTAGON_METRICS[key]["target_by_zone"].get(zone, "0.0-1.0")
-            _, t_max = parse_target_range(target_str)
-            px_max = chart_cx + chart_r * t_max * math.cos(angle)
-            py_max = chart_cy + chart_r * t_max * math.sin(angle)
-            zone_max_points.append(f"{px_max},{py_max}")
+        zone_max_points = [
+            f"{chart_cx + chart_r * t_max * cos_a},{chart_cy + chart_r * t_max * sin_a}"
+            for cos_a, sin_a, (_, _, t_max) in zip(_PENT_COS, _PENT_SIN, _zone_target_ranges(zone))
+        ]
         svg_parts.append(
             f'<polygon points="{" ".join(zone_max_points)}" fill="none" '
             f'stroke="{zone_color}" stroke-width="1" stroke-dasharray="4,4" opacity="0.4"/>'
         )
 
     # Draw axis lines and labels
-    for i, (angle, label) in enumerate(zip(angles, labels)):
+    for i, (cos_a, sin_a, label) in enumerate(zip(_PENT_COS, _PENT_SIN, labels)):
         key = metric_keys[i]
         meta = PENTAGON_METRICS[key]
-        x_end = chart_cx + chart_r * math.cos(angle)
-        y_end = chart_cy + chart_r * math.sin(angle)
+        x_end = chart_cx + chart_r * cos_a
+        y_end = chart_cy + chart_r * sin_a
         svg_parts.append(
             f'<line x1="{chart_cx}" y1="{chart_cy}" x2="{x_end}" y2="{y_end}" stroke="#444444" stroke-width="1"/>'
         )
 
-        lx = chart_cx + (chart_r + 30) * math.cos(angle)
-        ly = chart_cy + (chart_r + 30) * math.sin(angle)
+        lx = chart_cx + (chart_r + 30) * cos_a
+        ly = chart_cy + (chart_r + 30) * sin_a
         tooltip = f'{meta["name"]}: {meta["why_matters"]}'
         svg_parts.append(
             f'<text x="{lx}" y="{ly + 4}" text-anchor="middle" fill="#ffffff" font-size="12" '
@@ -1164,23 +1577,19 @@ def generate_pentagon_radar_svg(pentagon_stats: dict, size: int = 400) -> str:
         )
 
     # Draw actual values polygon
-    points = []
-    for angle, val in zip(angles, total_values):
-        px = chart_cx + chart_r * val * math.cos(angle)
-        py = chart_cy + chart_r * val * math.sin(angle)
-        points.append(f"{px},{py}")
+    vertices = [
+        (chart_cx + chart_r * val * cos_a, chart_cy + chart_r * val * sin_a)
+        for cos_a, sin_a, val in zip(_PENT_COS, _PENT_SIN, total_values)
+    ]
     svg_parts.append(
-        f'<polygon points="{" ".join(points)}" fill="#4ecdc4" fill-opacity="0.3" stroke="#4ecdc4" stroke-width="2"/>'
+        f'<polygon points="{" ".join(f"{px},{py}" for px, py in vertices)}" fill="#4ecdc4" fill-opacity="0.3" stroke="#4ecdc4" stroke-width="2"/>'
     )
 
     # Draw dots at vertices
-    for angle, val in zip(angles, total_values):
-        px = chart_cx + chart_r * val * math.cos(angle)
-        py = chart_cy + chart_r * val * math.sin(angle)
+    for px, py in vertices:
         svg_parts.append(f'<circle cx="{px}" cy="{py}" r="5" fill="#4ecdc4"/>')
 
     # Composite in center
-    total_composite = total_data.get("composite", 0.5)
     svg_parts.append(
         f'<text x="{chart_cx}" y="{chart_cy + 8}" text-anchor="middle" fill="#ffffff" font-size="32" font-weight="700">'
         f'{total_composite:.0%}</text>'
@@ -1193,20 +1602,36 @@ def generate_pentagon_radar_svg(pentagon_stats: dict, size: int = 400) -> str:
     return '\n'.join(svg_parts)
 
 
-def generate_pentagon_summary_html(pentagon_stats: dict) -> str:
-    """Generate HTML section for Pentagon of Musicality with radar chart and table."""
+# Summary table value colors, indexed by (in_range << 1) | (alignment > 0.5):
+# out of range and far, out of range but close, in range
+_CELL_COLORS = ("#ff4444", "#ffaa44", "#44ff44", "#44ff44")
+
+# Overall alignment grade, indexed by how many of the 0.5/0.7 thresholds it meets
+_OVERALL_ALIGNMENT_GRADES = (("#ff4444", "POOR"), ("#ffaa44", "FAIR"), ("#44ff44", "GOOD"))
+
+
+def generate_pentagon_summary_html(pentagon_stats: dict, out: Optional[TextIO] = None) -> Optional[str]:
+    """Generate HTML section for Pentagon of Musicality with radar chart and table.
+
+    Also stores the overall alignment score in pentagon_stats. If ``out`` is
+    given, the section is written into it and None is returned; otherwise it
+    is returned as a string.
+    """
     metric_keys = ["syncopation", "density", "velocity_range", "voice_separation", "regularity"]
     raw_attrs = ["raw_syncopation", "raw_density", "raw_velocity_range", "raw_voice_separation", "raw_regularity"]
     zones = [("stable", "#44aa44", "STABLE", "0-30%"), ("syncopated", "#aaaa44", "SYNCOPATED", "30-70%"), ("wild", "#aa4444", "WILD", "70-100%")]
 
-    # Track alignment scores
-    all_alignment_scores = []
+    # Running total of alignment scores across all (metric, zone) cells
+    alignment_sum = 0.0
+    alignment_count = 0
 
     # Generate radar chart SVG
     radar_svg = generate_pentagon_radar_svg(pentagon_stats, size=380)
 
-    # Build HTML
-    html_parts = [
+    # Build HTML, one fragment per line
+    buf = io.StringIO() if out is None else out
+    write = buf.write
+    buf.writelines(part + "\n" for part in (
         '<div style="background: #1e1e1e; border-radius: 8px; padding: 20px; margin-bottom: 20px;">',
         '<h3 style="color: #ffffff; margin: 0 0 16px 0; font-size: 16px;">Pentagon of Musicality — Overview</h3>',
         '<div style="display: flex; gap: 30px; align-items: flex-start;">',
@@ -1221,25 +1646,25 @@ def generate_pentagon_summary_html(pentagon_stats: dict) -> str:
         '<thead>',
         '<tr style="border-bottom: 1px solid #333;">',
         '<th style="text-align: left; padding: 8px 12px; color: #888;">Metric</th>',
-    ]
+    ))
 
     # Zone headers
     for zone, color, label, shape_range in zones:
-        html_parts.append(
+        write(
             f'<th style="text-align: center; padding: 8px 12px;">'
             f'<span style="color: {color}; font-weight: 600;">{label}</span><br>'
-            f'<span style="color: #555; font-size: 10px;">SHAPE {shape_range}</span></th>'
+            f'<span style="color: #555; font-size: 10px;">SHAPE {shape_range}</span></th>\n'
         )
-    html_parts.append('</tr></thead><tbody>')
+    write('</tr></thead><tbody>\n')
 
     # Metric rows
     for key, attr in zip(metric_keys, raw_attrs):
         meta = PENTAGON_METRICS[key]
-        html_parts.append('<tr style="border-bottom: 1px solid #2a2a2a;">')
-        html_parts.append(
+        write('<tr style="border-bottom: 1px solid #2a2a2a;">\n')
+        write(
             f'<td style="padding: 10px 12px; max-width: 300px;">'
             f'<span style="color: {COLORS["v1"]}; font-weight: 500;">{meta["name"]}</span><br>'
-            f'<span style="color: #666; font-size: 10px;">{meta["why_matters"]}</span></td>'
+            f'<span style="color: #666; font-size: 10px;">{meta["why_matters"]}</span></td>\n'
         )
 
         for zone, zone_color, _, _ in zones:
@@ -1250,61 +1675,49 @@ def generate_pentagon_summary_html(pentagon_stats: dict) -> str:
                 val = zone_data.get(attr, 0)
                 in_range, distance, status_text = check_in_range(val, target)
                 alignment = compute_alignment_score(val, target)
-                all_alignment_scores.append(alignment)
+                alignment_sum += alignment
+                alignment_count += 1
 
-                if in_range:
-                    val_color = "#44ff44"
-                elif alignment > 0.5:
-                    val_color = "#ffaa44"
-                else:
-                    val_color = "#ff4444"
+                val_color = _CELL_COLORS[(in_range << 1) | (alignment > 0.5)]
 
-                html_parts.append(
+                write(
                     f'<td style="text-align: center; padding: 10px 12px;" title="{status_text} | Alignment: {alignment:.0%}">'
                     f'<span style="color: {val_color}; font-weight: 600; font-size: 14px;">{val:.2f}</span><br>'
-                    f'<span style="color: #555; font-size: 10px;">target: {target}</span></td>'
+                    f'<span style="color: #555; font-size: 10px;">target: {target}</span></td>\n'
                 )
             else:
-                html_parts.append('<td style="text-align: center; color: #444;">—</td>')
-        html_parts.append('</tr>')
+                write('<td style="text-align: center; color: #444;">—</td>\n')
+        write('</tr>\n')
 
     # Compliance row
-    html_parts.append('<tr style="border-top: 2px solid #333;">')
-    html_parts.append('<td style="padding: 10px 12px; color: #fff; font-weight: 600;">Zone Compliance</td>')
+    write('<tr style="border-top: 2px solid #333;">\n')
+    write('<td style="padding: 10px 12px; color: #fff; font-weight: 600;">Zone Compliance</td>\n')
     for zone, color, _, _ in zones:
         zone_data = pentagon_stats.get(zone)
         if zone_data:
             comp = zone_data.get("composite", 0)
             count = zone_data.get("count", 0)
-            html_parts.append(
+            write(
                 f'<td style="text-align: center; padding: 10px 12px;">'
                 f'<span style="color: {color}; font-weight: 600; font-size: 14px;">{comp:.0%}</span><br>'
-                f'<span style="color: #555; font-size: 10px;">n={count}</span></td>'
+                f'<span style="color: #555; font-size: 10px;">n={count}</span></td>\n'
             )
         else:
-            html_parts.append('<td style="text-align: center; color: #444;">—</td>')
-    html_parts.append('</tr>')
+            write('<td style="text-align: center; color: #444;">—</td>\n')
+    write('</tr>\n')
 
-    html_parts.append('</tbody></table>')
-    html_parts.append('</div></div>')  # Close table div and flex container
+    write('</tbody></table>\n')
+    write('</div></div>\n')  # Close table div and flex container
 
     # Alignment score section
-    overall_alignment = sum(all_alignment_scores) / len(all_alignment_scores) if all_alignment_scores else 0.0
+    overall_alignment = alignment_sum / alignment_count if alignment_count else 0.0
     pentagon_stats["overall_alignment"] = overall_alignment
 
-    if overall_alignment >= 0.7:
-        align_color = "#44ff44"
-        align_status = "GOOD"
-    elif overall_alignment >= 0.5:
-        align_color = "#ffaa44"
-        align_status = "FAIR"
-    else:
-        align_color = "#ff4444"
-        align_status = "POOR"
+    align_color, align_status = _OVERALL_ALIGNMENT_GRADES[(overall_alignment >= 0.5) + (overall_alignment >= 0.7)]
 
     total_count = pentagon_stats.get("total", {}).get("count", 0)
 
-    html_parts.append(
+    write(
         f'<div style="border-top: 2px solid #444; margin-top: 16px; padding-top: 20px; display: flex; align-items: center;">'
         f'<div style="flex: 1;">'
         f'<div style="color: #fff; font-weight: 700; font-size: 13px;">OVERALL ALIGNMENT SCORE</div>'
@@ -1315,11 +1728,19 @@ def generate_pentagon_summary_html(pentagon_stats: dict) -> str:
         f'<span style="color: {align_color}; font-size: 18px; margin-left: 12px; vertical-align: middle;">[{align_status}]</span>'
         f'</div>'
         f'<div style="flex: 1; color: #666; font-size: 11px; text-align: right;">{total_count} patterns analyzed</div>'
-        f'</div>'
+        f'</div>\n'
     )
 
-    html_parts.append('</div>')  # Close main container
-    return '\n'.join(html_parts)
+    write('</div>')  # Close main container
+    return buf.getvalue() if out is None else None
+
+
+# Per-cell SVG fragments for generate_heatmap_svg
+_HEAT_DOWNBEAT = '<rect x="{}" y="{}" width="{}" height="{}" fill="#ffffff08"/>\n'.format
+_HEAT_CELL = '<rect x="{}" y="{}" width="{}" height="{}" rx="2" fill="{}" opacity="{:.2f}"/>\n'.format
+_HEAT_PERCENT = (
+    '<text x="{}" y="{}" text-anchor="middle" fill="#000000" font-size="8" opacity="0.7">{}</text>\n'
+).format
 
 
 def generate_heatmap_svg(stats: dict, title: str, width: int = 800) -> str:
@@ -1331,19 +1752,21 @@ def generate_heatmap_svg(stats: dict, title: str, width: int = 800) -> str:
     footer_height = 40
     total_height = header_height + 3 * row_height + footer_height + 8
 
-    svg_parts = [
+    buf = io.StringIO()
+    write = buf.write
+    write(
         f'<svg width="{width}" height="{total_height}" xmlns="http://www.w3.org/2000/svg" '
-        f'style="font-family: -apple-system, BlinkMacSystemFont, sans-serif; font-size: 10px;">',
-        f'<rect width="100%" height="100%" fill="#1e1e1e" rx="4"/>',
-    ]
+        f'style="font-family: -apple-system, BlinkMacSystemFont, sans-serif; font-size: 10px;">\n'
+        f'<rect width="100%" height="100%" fill="#1e1e1e" rx="4"/>\n'
+    )
 
     # Title
-    svg_parts.append(
-        f'<text x="50" y="16" fill="#888888" font-size="11" font-weight="500">{title}</text>'
+    write(
+        f'<text x="50" y="16" fill="#888888" font-size="11" font-weight="500">{title}</text>\n'
     )
-    svg_parts.append(
+    write(
         f'<text x="{width - 8}" y="16" text-anchor="end" fill="#505050" font-size="9">'
-        f'{stats["num_patterns"]} patterns</text>'
+        f'{stats["num_patterns"]} patterns</text>\n'
     )
 
     # Voice rows
@@ -1352,69 +1775,66 @@ def generate_heatmap_svg(stats: dict, title: str, width: int = 800) -> str:
         ("V2", stats["v2"], COLORS["v2"]),
         ("AUX", stats["aux"], COLORS["aux"]),
     ]
+    show_percent = step_width >= 20
+    bg_height = row_height - 4
+    cell_width = step_width - 2
+    cell_height = row_height - 6
 
     for row_idx, (voice_name, voice_stats, color) in enumerate(voices):
         y = header_height + row_idx * row_height
+        bg_y = y + 2
+        cell_y = y + 3
+        text_y = y + row_height / 2 + 3
 
         # Voice label
-        svg_parts.append(
+        write(
             f'<text x="42" y="{y + row_height / 2 + 4}" text-anchor="end" '
-            f'fill="{color}" font-weight="500">{voice_name}</text>'
+            f'fill="{color}" font-weight="500">{voice_name}</text>\n'
         )
 
-        # Heat cells
-        for step, freq in enumerate(voice_stats["frequencies"]):
-            x = 50 + step * step_width
+        # Background for downbeats (drawn first; cells sit inside their own
+        # column so they never overlap a neighbouring background)
+        frequencies = voice_stats["frequencies"]
+        for step in range(0, len(frequencies), 4):
+            write(_HEAT_DOWNBEAT(50 + step * step_width, bg_y, step_width, bg_height))
 
-            # Background for downbeats
-            if step % 4 == 0:
-                svg_parts.append(
-                    f'<rect x="{x}" y="{y + 2}" width="{step_width}" height="{row_height - 4}" '
-                    f'fill="#ffffff08"/>'
-                )
+        # Heat cells - only steps that were hit at least once
+        for step, freq in enumerate(frequencies):
+            if freq <= 0:
+                continue
+            x = 50 + step * step_width
 
-            # Heat cell - opacity based on frequency
-            if freq > 0:
-                # Color intensity based on frequency
-                opacity = 0.2 + freq * 0.8
-                svg_parts.append(
-                    f'<rect x="{x + 1}" y="{y + 3}" width="{step_width - 2}" height="{row_height - 6}" '
-                    f'rx="2" fill="{color}" opacity="{opacity:.2f}"/>'
-                )
+            # Color intensity based on frequency
+            write(_HEAT_CELL(x + 1, cell_y, cell_width, cell_height, color, 0.2 + freq * 0.8))
 
-                # Show percentage if significant
-                if freq >= 0.1 and step_width >= 20:
-                    svg_parts.append(
-                        f'<text x="{x + step_width / 2}" y="{y + row_height / 2 + 3}" '
-                        f'text-anchor="middle" fill="#000000" font-size="8" opacity="0.7">'
-                        f'{int(freq * 100)}</text>'
-                    )
+            # Show percentage if significant
+            if freq >= 0.1 and show_percent:
+                write(_HEAT_PERCENT(x + step_width / 2, text_y, int(freq * 100)))
 
         # Stats on the right
         mean_hits = voice_stats["mean_hits_per_pattern"]
-        svg_parts.append(
+        write(
             f'<text x="{width - 8}" y="{y + row_height / 2 + 4}" text-anchor="end" '
-            f'fill="#666666" font-size="9">μ={mean_hits:.1f}</text>'
+            f'fill="#666666" font-size="9">μ={mean_hits:.1f}</text>\n'
         )
 
     # Step numbers at bottom
     footer_y = header_height + 3 * row_height + 4
-    for step in range(num_steps):
-        if step % 4 == 0:
-            x = 50 + step * step_width + step_width / 2
-            svg_parts.append(
-                f'<text x="{x}" y="{footer_y + 12}" text-anchor="middle" '
-                f'fill="#505050" font-size="9">{step + 1}</text>'
-            )
+    for step in range(0, num_steps, 4):
+        x = 50 + step * step_width + step_width / 2
+        write(
+            f'<text x="{x}" y="{footer_y + 12}" text-anchor="middle" '
+            f'fill="#505050" font-size="9">{step + 1}</text>\n'
+        )
 
     # Legend
-    svg_parts.append(
+    write(
         f'<text x="50" y="{footer_y + 32}" fill="#505050" font-size="9">'
-        f'Heat: hit frequency (0-100%) across patterns | μ = mean hits per pattern</text>'
+        f'Heat: hit frequency (0-100%) across patterns | μ = mean hits per pattern</text>\n'
     )
 
-    svg_parts.append('</svg>')
-    return '\n'.join(svg_parts)
+    write('</svg>')
+    return buf.getvalue()
 
 
 def generate_stats_summary_svg(all_stats: list[tuple[str, dict]], width: int = 800) -> str:
@@ -1449,9 +1869,7 @@ def generate_stats_summary_svg(all_stats: list[tuple[str, dict]], width: int = 8
     for row_idx, (name, stats) in enumerate(all_stats):
         y = header_height + row_idx * row_height + 18
 
-        v1_mean = stats["v1"]["mean_hits_per_pattern"]
-        v2_mean = stats["v2"]["mean_hits_per_pattern"]
-        aux_mean = stats["aux"]["mean_hits_per_pattern"]
+        v1_mean, v2_mean, aux_mean = _mean_hits(stats)
         total_mean = v1_mean + v2_mean + aux_mean
         density = total_mean / stats["num_steps"] if stats["num_steps"] > 0 else 0
 
@@ -1476,34 +1894,48 @@ def generate_stats_summary_svg(all_stats: list[tuple[str, dict]], width: int = 8
     return '\n'.join(svg_parts)
 
 
+# Row of the per-step hit frequency table: step, downbeat marker, V1/V2/AUX freq
+_STEP_FREQ_ROW = "{:4}{} |   {:5.0%}   |   {:5.0%}   |   {:5.0%}\n".format
+
+# Section rules in the text summary
+_SUMMARY_RULE_MAJOR = "=" * 72 + "\n"
+_SUMMARY_RULE_MINOR = "-" * 72 + "\n"
+
+
 def generate_summary_text(
     patterns: list[tuple[str, list[Pattern], Optional[str]]],
     statistics: list[tuple[str, dict]],
     title: str = "Pattern Visualization Summary",
     pentagon_stats: Optional[dict] = None,
-) -> str:
-    """Generate AI and human-readable text summary of pattern statistics."""
-    lines = []
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
+    """Generate AI and human-readable text summary of pattern statistics.
+
+    If ``out`` is given, the summary is streamed into it and None is returned;
+    otherwise the summary is built in memory and returned as a string.
+    """
+    buf = io.StringIO() if out is None else out
+    write = buf.write
 
     # Header
-    lines.append("=" * 72)
-    lines.append(title.upper())
-    lines.append("=" * 72)
-    lines.append("")
-    lines.append(f"Generated by: DaisySP IDM Grids pattern visualization tool")
-    lines.append(f"Total pattern sections: {len(patterns)}")
+    write(_SUMMARY_RULE_MAJOR)
+    write(title.upper() + "\n")
+    write(_SUMMARY_RULE_MAJOR)
+    write("\n")
+    write(f"Generated by: DaisySP IDM Grids pattern visualization tool\n")
+    write(f"Total pattern sections: {len(patterns)}\n")
     total_patterns = sum(len(pats) for _, pats, *_ in patterns)
-    lines.append(f"Total patterns generated: {total_patterns}")
-    lines.append("")
+    write(f"Total patterns generated: {total_patterns}\n")
+    write("\n")
 
     # Pentagon of Musicality Summary (with status indicators)
     if pentagon_stats:
-        lines.append("-" * 72)
-        lines.append("PENTAGON OF MUSICALITY — ZONE COMPLIANCE")
-        lines.append("-" * 72)
-        lines.append("")
-        lines.append("Status: ✓ = in range (green), ~ = close (yellow), ✗ = out of range (red)")
-        lines.append("")
+        write(_SUMMARY_RULE_MINOR)
+        write("PENTAGON OF MUSICALITY — ZONE COMPLIANCE\n")
+        write(_SUMMARY_RULE_MINOR)
+        write("\n")
+        write("Status: ✓ = in range (green), ~ = close (yellow), ✗ = out of range (red)\n")
+        write("\n")
 
         metric_keys = ["syncopation", "density", "velocity_range", "voice_separation", "regularity"]
         raw_attrs = ["raw_syncopation", "raw_density", "raw_velocity_range", "raw_voice_separation", "raw_regularity"]
@@ -1514,9 +1946,9 @@ def generate_summary_text(
             if not zone_data:
                 continue
 
-            lines.append(f"## {zone_label} ZONE (n={zone_data.get('count', 0)})")
-            lines.append(f"   Composite Score: {zone_data.get('composite', 0):.0%}")
-            lines.append("")
+            write(f"## {zone_label} ZONE (n={zone_data.get('count', 0)})\n")
+            write(f"   Composite Score: {zone_data.get('composite', 0):.0%}\n")
+            write("\n")
 
             for key, attr in zip(metric_keys, raw_attrs):
                 meta = PENTAGON_METRICS[key]
@@ -1533,9 +1965,9 @@ def generate_summary_text(
                 else:
                     status = "✗"  # Red - out of range
 
-                lines.append(f"   {status} {meta['name']:<18}: {val:.2f}  (target: {target})")
+                write(f"   {status} {meta['name']:<18}: {val:.2f}  (target: {target})\n")
 
-            lines.append("")
+            write("\n")
 
         # Overall alignment
         overall_alignment = pentagon_stats.get("overall_alignment", 0.0)
@@ -1546,65 +1978,65 @@ def generate_summary_text(
         else:
             align_status = "✗ POOR"
 
-        lines.append(f"   OVERALL ALIGNMENT: {overall_alignment:.0%} [{align_status}]")
-        lines.append("")
+        write(f"   OVERALL ALIGNMENT: {overall_alignment:.0%} [{align_status}]\n")
+        write("\n")
 
     # Overall Expressiveness Summary
-    lines.append("-" * 72)
-    lines.append("EXPRESSIVENESS SUMMARY")
-    lines.append("-" * 72)
-    lines.append("")
+    write(_SUMMARY_RULE_MINOR)
+    write("EXPRESSIVENESS SUMMARY\n")
+    write(_SUMMARY_RULE_MINOR)
+    write("\n")
 
     for stat_name, stat_data in statistics:
         sv = stat_data["seed_variation"]
         ss = stat_data["step_stats"]
 
-        v1_score = sv.get("v1_score", 0)
-        v2_score = sv.get("v2_score", 0)
-        aux_score = sv.get("aux_score", 0)
+        v1_score, v2_score, aux_score = _variation_scores(sv)
         overall = (v1_score + v2_score + aux_score) / 3
         status = "PASS" if v2_score >= 0.5 else "FAIL"
 
-        lines.append(f"## {stat_name}")
-        lines.append(f"   Patterns: {sv.get('total_patterns', 0)}")
-        lines.append(f"   V1 (Anchor) variation:  {v1_score:6.1%} ({sv.get('unique_v1', 0)}/{sv.get('total_patterns', 0)} unique)")
-        lines.append(f"   V2 (Shimmer) variation: {v2_score:6.1%} ({sv.get('unique_v2', 0)}/{sv.get('total_patterns', 0)} unique)")
-        lines.append(f"   AUX variation:          {aux_score:6.1%} ({sv.get('unique_aux', 0)}/{sv.get('total_patterns', 0)} unique)")
-        lines.append(f"   Overall score: {overall:.1%} [{status}]")
-        lines.append("")
-        lines.append(f"   Mean hits per pattern:")
-        lines.append(f"     V1:  {ss['v1']['mean_hits_per_pattern']:.1f}")
-        lines.append(f"     V2:  {ss['v2']['mean_hits_per_pattern']:.1f}")
-        lines.append(f"     AUX: {ss['aux']['mean_hits_per_pattern']:.1f}")
-        total_mean = ss['v1']['mean_hits_per_pattern'] + ss['v2']['mean_hits_per_pattern'] + ss['aux']['mean_hits_per_pattern']
+        write(f"## {stat_name}\n")
+        sv_total = sv.get("total_patterns", 0)
+        write(f"   Patterns: {sv_total}\n")
+        write(f"   V1 (Anchor) variation:  {v1_score:6.1%} ({sv.get('unique_v1', 0)}/{sv_total} unique)\n")
+        write(f"   V2 (Shimmer) variation: {v2_score:6.1%} ({sv.get('unique_v2', 0)}/{sv_total} unique)\n")
+        write(f"   AUX variation:          {aux_score:6.1%} ({sv.get('unique_aux', 0)}/{sv_total} unique)\n")
+        write(f"   Overall score: {overall:.1%} [{status}]\n")
+        write("\n")
+        write(f"   Mean hits per pattern:\n")
+        v1_mean, v2_mean, aux_mean = _mean_hits(ss)
+        write(f"     V1:  {v1_mean:.1f}\n")
+        write(f"     V2:  {v2_mean:.1f}\n")
+        write(f"     AUX: {aux_mean:.1f}\n")
+        total_mean = v1_mean + v2_mean + aux_mean
         density = total_mean / ss['num_steps'] if ss['num_steps'] > 0 else 0
-        lines.append(f"     Total: {total_mean:.1f} ({density:.0%} density)")
-        lines.append("")
+        write(f"     Total: {total_mean:.1f} ({density:.0%} density)\n")
+        write("\n")
 
     # Per-Section Pattern Counts
-    lines.append("-" * 72)
-    lines.append("PATTERN SECTIONS")
-    lines.append("-" * 72)
-    lines.append("")
-    lines.append(f"{'Section':<45} {'Patterns':>8}  {'Sweep Param':<12}")
-    lines.append("-" * 72)
+    write(_SUMMARY_RULE_MINOR)
+    write("PATTERN SECTIONS\n")
+    write(_SUMMARY_RULE_MINOR)
+    write("\n")
+    write(f"{'Section':<45} {'Patterns':>8}  {'Sweep Param':<12}\n")
+    write(_SUMMARY_RULE_MINOR)
 
     for entry in patterns:
         section_name = entry[0]
         section_patterns = entry[1]
         highlight = entry[2] if len(entry) > 2 else None
         sweep_param = highlight.upper() if highlight else "-"
-        lines.append(f"{section_name[:44]:<45} {len(section_patterns):>8}  {sweep_param:<12}")
+        write(f"{section_name[:44]:<45} {len(section_patterns):>8}  {sweep_param:<12}\n")
 
-    lines.append("-" * 72)
-    lines.append(f"{'TOTAL':<45} {total_patterns:>8}")
-    lines.append("")
+    write(_SUMMARY_RULE_MINOR)
+    write(f"{'TOTAL':<45} {total_patterns:>8}\n")
+    write("\n")
 
     # Detailed per-step hit frequency (condensed)
-    lines.append("-" * 72)
-    lines.append("PER-STEP HIT FREQUENCY (across all patterns with default seed)")
-    lines.append("-" * 72)
-    lines.append("")
+    write(_SUMMARY_RULE_MINOR)
+    write("PER-STEP HIT FREQUENCY (across all patterns with default seed)\n")
+    write(_SUMMARY_RULE_MINOR)
+    write("\n")
 
     # Find the "All Patterns" statistics
     all_patterns_stats = None
@@ -1615,27 +2047,27 @@ def generate_summary_text(
 
     if all_patterns_stats:
         ss = all_patterns_stats["step_stats"]
-        lines.append("Step  |  V1 freq  |  V2 freq  |  AUX freq")
-        lines.append("------|-----------|-----------|----------")
-
-        for step in range(ss["num_steps"]):
-            v1_freq = ss["v1"]["frequencies"][step]
-            v2_freq = ss["v2"]["frequencies"][step]
-            aux_freq = ss["aux"]["frequencies"][step]
-            # Only show steps with meaningful frequency
-            if v1_freq > 0.05 or v2_freq > 0.05 or aux_freq > 0.05:
-                marker = "*" if step % 4 == 0 else " "
-                lines.append(f"{step:4}{marker} |   {v1_freq:5.0%}   |   {v2_freq:5.0%}   |   {aux_freq:5.0%}")
-
-        lines.append("")
-        lines.append("(* = downbeat, only steps with >5% frequency shown)")
-        lines.append("")
+        write("Step  |  V1 freq  |  V2 freq  |  AUX freq\n")
+        write("------|-----------|-----------|----------\n")
+
+        # Stack the three frequency columns once and emit the rows for steps
+        # with meaningful frequency in a single writelines call
+        rows = zip(range(ss["num_steps"]), ss["v1"]["frequencies"], ss["v2"]["frequencies"], ss["aux"]["frequencies"])
+        buf.writelines(
+            _STEP_FREQ_ROW(step, "*" if step % 4 == 0 else " ", v1_freq, v2_freq, aux_freq)
+            for step, v1_freq, v2_freq, aux_freq in rows
+            if max(v1_freq, v2_freq, aux_freq) > 0.05
+        )
+
+        write("\n")
+        write("(* = downbeat, only steps with >5% frequency shown)\n")
+        write("\n")
 
     # Named Presets Summary
-    lines.append("-" * 72)
-    lines.append("NAMED PRESETS")
-    lines.append("-" * 72)
-    lines.append("")
+    write(_SUMMARY_RULE_MINOR)
+    write("NAMED PRESETS\n")
+    write(_SUMMARY_RULE_MINOR)
+    write("\n")
 
     for entry in patterns:
         section_name = entry[0]
@@ -1645,233 +2077,324 @@ def generate_summary_text(
         section_patterns = entry[1]
         for p in section_patterns:
             if p.name:
-                lines.append(f"## {p.name}")
+                write(f"## {p.name}\n")
                 if p.description:
-                    lines.append(f"   {p.description}")
-                lines.append(f"   SHAPE={p.shape:.2f} ENERGY={p.energy:.2f} AXIS_X={p.axis_x:.2f} AXIS_Y={p.axis_y:.2f}")
-                lines.append(f"   DRIFT={p.drift:.2f} ACCENT={p.accent:.2f}")
-                lines.append(f"   Hits: V1={p.v1_hits}, V2={p.v2_hits}, AUX={p.aux_hits}")
-                lines.append("")
+                    write(f"   {p.description}\n")
+                write(f"   SHAPE={p.shape:.2f} ENERGY={p.energy:.2f} AXIS_X={p.axis_x:.2f} AXIS_Y={p.axis_y:.2f}\n")
+                write(f"   DRIFT={p.drift:.2f} ACCENT={p.accent:.2f}\n")
+                write(f"   Hits: V1={p.v1_hits}, V2={p.v2_hits}, AUX={p.aux_hits}\n")
+                write("\n")
 
     # Footer
-    lines.append("-" * 72)
-    lines.append("END OF SUMMARY")
-    lines.append("-" * 72)
-    lines.append("")
+    write(_SUMMARY_RULE_MINOR)
+    write("END OF SUMMARY\n")
+    write(_SUMMARY_RULE_MINOR)
 
-    return "\n".join(lines)
+    return buf.getvalue() if out is None else None
 
 
-def generate_html(
-    patterns: list[tuple[str, list[Pattern], Optional[str]]],
-    title: str = "Pattern Visualization",
-    statistics: Optional[list[tuple[str, dict]]] = None,
-    pentagon_stats: Optional[dict] = None,
-) -> str:
-    """Generate complete HTML page with multiple pattern groups and statistics."""
-    html_parts = [f'''<!DOCTYPE html>
+# Per-pattern row of the HTML page, up to the pattern SVG. Voice colors are
+# baked in once at import; only the per-pattern fragments are substituted via
+# format_map. The SVG itself is streamed into the page between this and
+# _PATTERN_ROW_TAIL.
+_PATTERN_ROW_TMPL = '''            <div class="pattern-row">
+                <div class="pattern-container">{{preset_header}}
+                    <div class="controls-row" style="display: flex; gap: 12px; align-items: flex-start;">
+                        <div class="knob-panel">
+                            {{knob_panel}}
+                        </div>
+                        <div class="pentagon-chart" title="Pentagon of Musicality: Syncopation, Density, Velocity Range, Voice Separation, Regularity">
+                            {{pentagon_svg}}
+                        </div>
+                    </div>
+                    <div class="pattern-label">
+                        <div class="stats">
+                            <span class="stat">
+                                <span class="stat-dot" style="background: {V1_COLOR}"></span>
+                                V1: {{v1_hits}}
+                            </span>
+                            <span class="stat">
+                                <span class="stat-dot" style="background: {V2_COLOR}"></span>
+                                V2: {{v2_hits}}
+                            </span>
+                            <span class="stat">
+                                <span class="stat-dot" style="background: {AUX_COLOR}"></span>
+                                AUX: {{aux_hits}}
+                            </span>
+                        </div>
+                    </div>
+                    <div class="pattern-svg">
+                        '''.format(
+    V1_COLOR=COLORS["v1"], V2_COLOR=COLORS["v2"], AUX_COLOR=COLORS["aux"],
+).format_map
+_PATTERN_ROW_TAIL = '''
+                    </div>
+                </div>
+            </div>
+'''
+
+# Per-group row of the statistics section: heatmap and seed variation chart
+_STATS_ROW_TMPL = '''            <div class="stats-row">
+                <div class="stats-label">{stat_name}</div>
+                {heatmap}
+                {expr_svg}
+            </div>
+'''.format_map
+
+_SLUG_RE = re.compile(r"\W+")
+
+
+@functools.lru_cache(maxsize=128)
+def _slug(text: str) -> str:
+    """Anchor id for a section name: lowercase words joined by hyphens."""
+    return _SLUG_RE.sub("-", text.lower()).strip("-")
+
+
+# Table of contents link to a pattern section: anchor id, display name
+_TOC_ITEM_TMPL = '            <a href="#{}" class="toc-item">{}</a>\n'.format
+
+# Opening of a pattern section, up to its pattern grid
+_SECTION_OPEN_TMPL = '''
+    <section class="sweep-section" id="{section_id}">
+        <h2 class="sweep-title">{section_name}</h2>
+        <div class="pattern-grid">
+'''.format_map
+
+# Name/description header shown above preset patterns
+_PRESET_HEADER_TMPL = '''
+                    <div class="preset-header">
+                        <span class="preset-name">{}</span>{}
+                    </div>'''.format
+_PRESET_DESCRIPTION_TMPL = '<span class="preset-description">— {}</span>'.format
+
+
+# Page skeleton (head, stylesheet and legend). string.Template placeholders
+# leave the stylesheet's braces alone; COLORS never changes at runtime, so the
+# colors are substituted once at import and only ${title} is left per page.
+_PAGE_HEAD_TMPL = string.Template(string.Template('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
+    <title>${title}</title>
     <style>
-        * {{
+        * {
             box-sizing: border-box;
             margin: 0;
             padding: 0;
-        }}
-        body {{
-            background: {COLORS["bg"]};
-            color: {COLORS["text"]};
+        }
+        body {
+            background: ${bg};
+            color: ${text};
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             padding: 24px;
             line-height: 1.5;
-        }}
-        h1 {{
+        }
+        h1 {
             font-size: 24px;
             font-weight: 600;
             margin-bottom: 8px;
             color: #ffffff;
-        }}
-        .subtitle {{
-            color: {COLORS["text_dim"]};
+        }
+        .subtitle {
+            color: ${text_dim};
             margin-bottom: 32px;
-        }}
-        .sweep-section {{
+        }
+        .sweep-section {
             margin-bottom: 48px;
-        }}
-        .sweep-title {{
+        }
+        .sweep-title {
             font-size: 18px;
             font-weight: 500;
             margin-bottom: 16px;
             padding-bottom: 8px;
-            border-bottom: 1px solid {COLORS["grid_line"]};
-        }}
-        .pattern-grid {{
+            border-bottom: 1px solid ${grid_line};
+        }
+        .pattern-grid {
             display: flex;
             flex-direction: column;
             gap: 24px;
-        }}
-        .pattern-row {{
+        }
+        .pattern-row {
             display: flex;
             flex-direction: column;
             gap: 8px;
-        }}
-        .pattern-label {{
+        }
+        .pattern-label {
             display: flex;
             align-items: center;
             gap: 16px;
-        }}
-        .param-value {{
+        }
+        .param-value {
             font-size: 14px;
             font-weight: 500;
             min-width: 120px;
-        }}
-        .param-name {{
-            color: {COLORS["text_dim"]};
+        }
+        .param-name {
+            color: ${text_dim};
             font-size: 12px;
-        }}
-        .stats {{
+        }
+        .stats {
             display: flex;
             gap: 16px;
             font-size: 11px;
-            color: {COLORS["text_dim"]};
-        }}
-        .stat {{
+            color: ${text_dim};
+        }
+        .stat {
             display: flex;
             align-items: center;
             gap: 4px;
-        }}
-        .stat-dot {{
+        }
+        .stat-dot {
             width: 8px;
             height: 8px;
             border-radius: 50%;
-        }}
-        .pattern-svg {{
+        }
+        .pattern-svg {
             border-radius: 4px;
             overflow: hidden;
-        }}
-        .toc {{
-            background: {COLORS["grid_bg"]};
+        }
+        .toc {
+            background: ${grid_bg};
             padding: 16px;
             border-radius: 8px;
             margin-bottom: 32px;
-        }}
-        .toc h2 {{
+        }
+        .toc h2 {
             font-size: 14px;
             margin-bottom: 12px;
-            color: {COLORS["text_dim"]};
-        }}
-        .toc-list {{
+            color: ${text_dim};
+        }
+        .toc-list {
             display: flex;
             flex-wrap: wrap;
             gap: 8px;
-        }}
-        .toc-item {{
-            background: {COLORS["bg"]};
+        }
+        .toc-item {
+            background: ${bg};
             padding: 6px 12px;
             border-radius: 4px;
-            color: {COLORS["text"]};
+            color: ${text};
             text-decoration: none;
             font-size: 13px;
-        }}
-        .toc-item:hover {{
+        }
+        .toc-item:hover {
             background: #3d3d3d;
-        }}
-        .legend {{
-            background: {COLORS["grid_bg"]};
+        }
+        .legend {
+            background: ${grid_bg};
             padding: 16px;
             border-radius: 8px;
             margin-bottom: 32px;
             display: flex;
             gap: 24px;
             align-items: center;
-        }}
-        .legend-item {{
+        }
+        .legend-item {
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
-        .legend-box {{
+        }
+        .legend-box {
             width: 16px;
             height: 16px;
             border-radius: 3px;
-        }}
-        .knob-panel {{
+        }
+        .knob-panel {
             margin-bottom: 8px;
-        }}
-        .pattern-container {{
+        }
+        .pattern-container {
             display: flex;
             flex-direction: column;
             gap: 4px;
-        }}
-        .preset-header {{
+        }
+        .preset-header {
             margin-bottom: 4px;
-        }}
-        .preset-name {{
+        }
+        .preset-name {
             font-size: 14px;
             font-weight: 600;
             color: #ffffff;
-        }}
-        .preset-description {{
+        }
+        .preset-description {
             font-size: 12px;
-            color: {COLORS["text_dim"]};
+            color: ${text_dim};
             margin-left: 12px;
-        }}
-        .stats-section {{
-            background: {COLORS["grid_bg"]};
+        }
+        .stats-section {
+            background: ${grid_bg};
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 32px;
-        }}
-        .stats-title {{
+        }
+        .stats-title {
             font-size: 18px;
             font-weight: 500;
             margin-bottom: 16px;
             padding-bottom: 8px;
-            border-bottom: 1px solid {COLORS["grid_line"]};
-        }}
-        .stats-grid {{
+            border-bottom: 1px solid ${grid_line};
+        }
+        .stats-grid {
             display: flex;
             flex-direction: column;
             gap: 16px;
-        }}
-        .stats-row {{
+        }
+        .stats-row {
             display: flex;
             flex-direction: column;
             gap: 8px;
-        }}
-        .stats-label {{
+        }
+        .stats-label {
             font-size: 13px;
-            color: {COLORS["text"]};
+            color: ${text};
             font-weight: 500;
-        }}
+        }
     </style>
 </head>
 <body>
-    <h1>{title}</h1>
+    <h1>${title}</h1>
     <p class="subtitle">Generated from DaisySP IDM Grids firmware pattern algorithms</p>
 
     <div class="legend">
         <div class="legend-item">
-            <div class="legend-box" style="background: {COLORS['v1']}"></div>
+            <div class="legend-box" style="background: ${v1}"></div>
             <span>V1 (Anchor/Kick)</span>
         </div>
         <div class="legend-item">
-            <div class="legend-box" style="background: {COLORS['v2']}"></div>
+            <div class="legend-box" style="background: ${v2}"></div>
             <span>V2 (Shimmer/Snare)</span>
         </div>
         <div class="legend-item">
-            <div class="legend-box" style="background: {COLORS['aux']}"></div>
+            <div class="legend-box" style="background: ${aux}"></div>
             <span>AUX (Hat/Perc)</span>
         </div>
     </div>
-''']
+''').safe_substitute(COLORS))
+
+
+def generate_html(
+    patterns: list[tuple[str, list[Pattern], Optional[str]]],
+    title: str = "Pattern Visualization",
+    statistics: Optional[list[tuple[str, dict]]] = None,
+    pentagon_stats: Optional[dict] = None,
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
+    """Generate complete HTML page with multiple pattern groups and statistics.
+
+    If ``out`` is given, the page is streamed into it and None is returned;
+    otherwise the page is built in memory and returned as a string.
+    """
+    buf = io.StringIO() if out is None else out
+    write = buf.write
+    write(_PAGE_HEAD_TMPL.substitute(title=title))
+
+    # Beat grids shared by every pattern SVG on the page
+    write(pattern_grid_defs(p.length for entry in patterns for p in entry[1]))
+    write("\n")
 
     # Statistics section at TOP (if provided)
     if statistics or pentagon_stats:
-        html_parts.append('''
+        write('''
     <section class="stats-section" id="statistics">
         <h2 class="stats-title">📊 Pattern Statistics & Pentagon of Musicality</h2>
         <div class="stats-grid">
@@ -1879,11 +2402,9 @@ def generate_html(
 
         # Pentagon summary first (using HTML table layout)
         if pentagon_stats:
-            pentagon_summary = generate_pentagon_summary_html(pentagon_stats)
-            html_parts.append(f'''            <div class="stats-row">
-                {pentagon_summary}
-            </div>
-''')
+            write('            <div class="stats-row">\n                ')
+            generate_pentagon_summary_html(pentagon_stats, out=buf)
+            write('\n            </div>\n')
 
         # Existing statistics
         if statistics:
@@ -1893,62 +2414,60 @@ def generate_html(
                 # Generate expressiveness metrics
                 expr_svg = generate_expressiveness_svg(stat_data["seed_variation"], f"Seed Variation: {stat_name}")
 
-                html_parts.append(f'''            <div class="stats-row">
-                <div class="stats-label">{stat_name}</div>
-                {heatmap}
-                {expr_svg}
-            </div>
-''')
+                write(_STATS_ROW_TMPL({"stat_name": stat_name, "heatmap": heatmap, "expr_svg": expr_svg}))
 
             # Summary table
             summary_stats = [(name, data["step_stats"]) for name, data in statistics]
             summary_svg = generate_stats_summary_svg(summary_stats)
-            html_parts.append(f'''            <div class="stats-row">
+            write(f'''            <div class="stats-row">
                 <div class="stats-label">Summary Comparison</div>
                 {summary_svg}
             </div>
 ''')
 
-        html_parts.append('''        </div>
+        write('''        </div>
     </section>
 ''')
 
-    html_parts.append('''
+    # Anchor id and escaped display name of each section, computed once for
+    # both the table of contents and the section headers
+    sections = [(_slug(entry[0]), _escape_html(entry[0])) for entry in patterns]
+
+    write('''
     <div class="toc">
         <h2>Jump to Section</h2>
         <div class="toc-list">
 ''')
 
     # Table of contents
-    for entry in patterns:
-        section_name = entry[0]
-        section_id = section_name.lower().replace(" ", "-")
-        html_parts.append(f'            <a href="#{section_id}" class="toc-item">{section_name}</a>\n')
+    write("".join(_TOC_ITEM_TMPL(section_id, section_label) for section_id, section_label in sections))
 
     # Add statistics link if provided
     if statistics:
-        html_parts.append('            <a href="#statistics" class="toc-item" style="background: #2a3a2a; color: #88cc88;">📊 Statistics & Metrics</a>\n')
+        write('            <a href="#statistics" class="toc-item" style="background: #2a3a2a; color: #88cc88;">📊 Statistics & Metrics</a>\n')
 
-    html_parts.append('''        </div>
+    write('''        </div>
     </div>
 ''')
 
-    # Pattern sections
-    for entry in patterns:
-        section_name = entry[0]
+    # Pattern sections. The per-pattern renderers are bound to locals so the
+    # inner loop does not repeat global lookups for every pattern.
+    pattern_svg = generate_pattern_svg
+    knob_panel_svg = generate_knob_panel_svg
+    pentagon_metrics_for = compute_pentagon_metrics
+    pentagon_svg_for = generate_pentagon_svg
+    render_row = _PATTERN_ROW_TMPL
+    preset_header_for = _PRESET_HEADER_TMPL
+    preset_description_for = _PRESET_DESCRIPTION_TMPL
+    escape = _escape_html
+    for entry, (section_id, section_label) in zip(patterns, sections):
         section_patterns = entry[1]
         highlight_param = entry[2] if len(entry) > 2 else None
 
-        section_id = section_name.lower().replace(" ", "-")
-        html_parts.append(f'''
-    <section class="sweep-section" id="{section_id}">
-        <h2 class="sweep-title">{section_name}</h2>
-        <div class="pattern-grid">
-''')
+        write(_SECTION_OPEN_TMPL({"section_id": section_id, "section_name": section_label}))
 
         for pattern in section_patterns:
-            svg = generate_pattern_svg(pattern)
-            knob_panel = generate_knob_panel_svg(
+            knob_panel = knob_panel_svg(
                 shape=pattern.shape,
                 energy=pattern.energy,
                 axis_x=pattern.axis_x,
@@ -1960,63 +2479,154 @@ def generate_html(
             )
 
             # Compute Pentagon metrics and generate radar chart
-            pentagon_metrics = compute_pentagon_metrics(pattern)
-            pentagon_svg = generate_pentagon_svg(pentagon_metrics, size=140)
+            pentagon_metrics = pentagon_metrics_for(pattern)
+            pentagon_svg = pentagon_svg_for(pentagon_metrics, size=140)
 
             # Preset header (name and description if available)
             preset_header = ""
             if pattern.name:
-                desc_html = f'<span class="preset-description">— {pattern.description}</span>' if pattern.description else ""
-                preset_header = f'''
-                    <div class="preset-header">
-                        <span class="preset-name">{pattern.name}</span>{desc_html}
-                    </div>'''
-
-            html_parts.append(f'''            <div class="pattern-row">
-                <div class="pattern-container">{preset_header}
-                    <div class="controls-row" style="display: flex; gap: 12px; align-items: flex-start;">
-                        <div class="knob-panel">
-                            {knob_panel}
-                        </div>
-                        <div class="pentagon-chart" title="Pentagon of Musicality: Syncopation, Density, Velocity Range, Voice Separation, Regularity">
-                            {pentagon_svg}
-                        </div>
-                    </div>
-                    <div class="pattern-label">
-                        <div class="stats">
-                            <span class="stat">
-                                <span class="stat-dot" style="background: {COLORS['v1']}"></span>
-                                V1: {pattern.v1_hits}
-                            </span>
-                            <span class="stat">
-                                <span class="stat-dot" style="background: {COLORS['v2']}"></span>
-                                V2: {pattern.v2_hits}
-                            </span>
-                            <span class="stat">
-                                <span class="stat-dot" style="background: {COLORS['aux']}"></span>
-                                AUX: {pattern.aux_hits}
-                            </span>
-                        </div>
-                    </div>
-                    <div class="pattern-svg">
-                        {svg}
-                    </div>
-                </div>
-            </div>
-''')
+                preset_header = preset_header_for(
+                    escape(pattern.name), preset_description_for(escape(pattern.description)) if pattern.description else ""
+                )
 
-        html_parts.append('''        </div>
+            write(render_row({
+                "preset_header": preset_header,
+                "knob_panel": knob_panel,
+                "pentagon_svg": pentagon_svg,
+                "v1_hits": pattern.v1_hits,
+                "v2_hits": pattern.v2_hits,
+                "aux_hits": pattern.aux_hits,
+            }))
+            pattern_svg(pattern, out=buf, shared_grid=True)
+            write(_PATTERN_ROW_TAIL)
+
+        write('''        </div>
     </section>
 ''')
 
-    html_parts.append('''</body>
+    write('''</body>
 </html>
 ''')
 
-    return ''.join(html_parts)
+    return buf.getvalue() if out is None else None
+
+
+# Parameter values swept by main(). Kept at module level so they are built
+# once and can be reused when the script is imported.
+SHAPE_SWEEP = (0.0, 0.15, 0.30, 0.50, 0.70, 0.85, 1.0)
+ENERGY_SWEEP = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+UNIT_SWEEP = (0.0, 0.25, 0.5, 0.75, 1.0)  # AXIS X/Y, DRIFT and ACCENT sweeps
+MATRIX_SHAPES = (0.0, 0.5, 1.0)
+MATRIX_ENERGIES = (0.3, 0.6, 0.9)
+PAIR_SHAPES = (0.0, 0.3, 0.6, 1.0)  # SHAPE x DRIFT/AXIS/ACCENT matrices
+PAIR_VALUES = (0.0, 0.5, 1.0)
+VARIATION_SEEDS = (0xDEADBEEF, 0xCAFEBABE, 0x12345678, 0xABCD1234, 0xBEEFCAFE, 0x87654321)
+WILD_SEEDS = (0x11111111, 0x22222222, 0x33333333, 0x44444444)
+MINIMAL_ENERGIES = (0.1, 0.2, 0.3)
+MINIMAL_SEEDS = (0xAAAAAAAA, 0xBBBBBBBB)
+
+SEED_VARIATION_SECTION = "Seed Variation (same params, different patterns)"
+WILD_SECTION = "Wild Patterns (SHAPE=0.9)"
+
+# Sections generated by main(), in page order: (title, progress label,
+# highlighted knob, fixed parameters, swept parameters). Each swept entry is
+# (parameter, values); several are combined with itertools.product, first
+# entry outermost. The seed defaults to --seed unless it is fixed or swept.
+SWEEPS = (
+    # SHAPE sweep (primary interest)
+    ("SHAPE Sweep (stable to wild)", "SHAPE sweep", "shape",
+     (("energy", 0.6),), (("shape", SHAPE_SWEEP),)),
+    ("ENERGY Sweep (sparse to dense)", "ENERGY sweep", "energy",
+     (("shape", 0.3),), (("energy", ENERGY_SWEEP),)),
+    ("AXIS X Sweep (downbeat to offbeat bias)", "AXIS X sweep", "axis_x",
+     (("shape", 0.3), ("energy", 0.6)), (("axis_x", UNIT_SWEEP),)),
+    ("AXIS Y Sweep (bar start to bar end bias)", "AXIS Y sweep", "axis_y",
+     (("shape", 0.3), ("energy", 0.6)), (("axis_y", UNIT_SWEEP),)),
+    # DRIFT sweep (voice independence)
+    ("DRIFT Sweep (locked to independent)", "DRIFT sweep", "drift",
+     (("shape", 0.4), ("energy", 0.6)), (("drift", UNIT_SWEEP),)),
+    # ACCENT sweep (velocity dynamics)
+    ("ACCENT Sweep (flat to punchy)", "ACCENT sweep", "accent",
+     (("shape", 0.3), ("energy", 0.6)), (("accent", UNIT_SWEEP),)),
+    # Interesting combinations: SHAPE x ENERGY matrix (3x3)
+    ("SHAPE x ENERGY Matrix", "SHAPE x ENERGY matrix", None,
+     (), (("energy", MATRIX_ENERGIES), ("shape", MATRIX_SHAPES))),
+    # Different seeds (showing variation)
+    (SEED_VARIATION_SECTION, "Seed variation", None,
+     (("shape", 0.5), ("energy", 0.6)), (("seed", VARIATION_SEEDS),)),
+    # Wild variations (high SHAPE with different seeds)
+    (WILD_SECTION, "Wild variations", "shape",
+     (("shape", 0.9), ("energy", 0.7)), (("seed", WILD_SEEDS),)),
+    # Minimal/sparse patterns
+    ("Minimal Patterns (low energy)", "Minimal patterns", "energy",
+     (("shape", 0.2),), (("energy", MINIMAL_ENERGIES), ("seed", MINIMAL_SEEDS))),
+    # 2D sweeps of SHAPE against the other knobs
+    ("SHAPE x DRIFT Matrix", "SHAPE x DRIFT matrix", None,
+     (("energy", 0.6),), (("shape", PAIR_SHAPES), ("drift", PAIR_VALUES))),
+    ("SHAPE x AXIS X Matrix", "SHAPE x AXIS X matrix", None,
+     (("energy", 0.6),), (("shape", PAIR_SHAPES), ("axis_x", PAIR_VALUES))),
+    ("SHAPE x AXIS Y Matrix", "SHAPE x AXIS Y matrix", None,
+     (("energy", 0.6),), (("shape", PAIR_SHAPES), ("axis_y", PAIR_VALUES))),
+    ("SHAPE x ACCENT Matrix", "SHAPE x ACCENT matrix", None,
+     (("energy", 0.6),), (("shape", PAIR_SHAPES), ("accent", PAIR_VALUES))),
+)
+
+# Musical presets: (name, description, values in PRESET_PARAMS order)
+PRESET_PARAMS = ("shape", "energy", "axis_x", "axis_y", "drift", "accent")
+PRESETS: tuple[tuple[str, str, tuple[float, ...]], ...] = (
+    # Classic Four-on-Floor Techno
+    ("Four on Floor", "Classic techno kick pattern, minimal complexity", (0.0, 0.5, 0.0, 0.5, 0.0, 0.6)),
+    # House with Offbeat Hats
+    ("House Groove", "Driving house with offbeat emphasis", (0.15, 0.6, 0.6, 0.5, 0.3, 0.5)),
+    # Tribal / African-influenced
+    ("Tribal Syncopation", "Syncopated patterns, call-and-response feel", (0.4, 0.65, 0.4, 0.6, 0.5, 0.7)),
+    # Breakbeat
+    ("Breakbeat", "Broken rhythms, snare emphasis", (0.35, 0.55, 0.5, 0.3, 0.6, 0.65)),
+    # Industrial
+    ("Industrial Stomp", "Heavy, aggressive, distorted", (0.2, 0.8, 0.2, 0.4, 0.2, 0.9)),
+    # Minimal Techno
+    ("Minimal Pulse", "Sparse, hypnotic, space between notes", (0.1, 0.3, 0.3, 0.5, 0.1, 0.4)),
+    # Dub Techno
+    ("Dub Techno", "Laid back, dubby, chord hits", (0.25, 0.45, 0.4, 0.6, 0.4, 0.5)),
+    # Gabber / Hardcore
+    ("Gabber Assault", "Fast, aggressive, constant pressure", (0.3, 0.95, 0.3, 0.5, 0.1, 0.95)),
+    # IDM Complex
+    ("IDM Complexity", "Irregular patterns, algorithmic feel", (0.7, 0.6, 0.6, 0.4, 0.7, 0.6)),
+    # IDM Chaos (Aphex-style)
+    ("IDM Chaos", "Maximum unpredictability, glitchy", (1.0, 0.7, 0.5, 0.5, 0.9, 0.7)),
+    # Ambient Percussion
+    ("Ambient Scatter", "Sparse, random, textural", (0.8, 0.25, 0.7, 0.7, 0.8, 0.3)),
+    # Half-time
+    ("Half-Time Feel", "Emphasis on beats 1 and 3", (0.15, 0.4, 0.0, 0.3, 0.2, 0.6)),
+    # Polyrhythmic
+    ("Polyrhythmic", "Multiple simultaneous rhythmic layers", (0.5, 0.6, 0.5, 0.5, 0.6, 0.55)),
+    # Acid Techno
+    ("Acid Drive", "Relentless, 303-era inspired", (0.25, 0.7, 0.35, 0.5, 0.3, 0.75)),
+    # Detroit Techno
+    ("Detroit Soul", "Funky, machine-groove, swing", (0.2, 0.55, 0.45, 0.55, 0.35, 0.6)),
+    # Berlin Minimal
+    ("Berlin Loop", "Hypnotic, repetitive, subtle variation", (0.1, 0.5, 0.5, 0.5, 0.15, 0.5)),
+)
+
+
+# HTML-escaped form of text shown on the page. Preset names and descriptions
+# are known up front, so they are escaped once at import; any other text
+# (section names, custom patterns) is escaped on first use and remembered.
+_ESCAPED_TEXT = {text: html.escape(text) for name, desc, _ in PRESETS for text in (name, desc)}
+
+
+def _escape_html(text: str) -> str:
+    escaped = _ESCAPED_TEXT.get(text)
+    if escaped is None:
+        escaped = _ESCAPED_TEXT[text] = html.escape(text)
+    return escaped
 
 
 def main():
+    # Only the command line needs argparse; importing the module for its
+    # helpers skips it
+    import argparse
+
     parser = argparse.ArgumentParser(description="Generate HTML pattern visualization")
     parser.add_argument(
         "--output", "-o",
@@ -2056,232 +2666,69 @@ def main():
 
     print(f"Generating patterns using {args.pattern_viz}...")
 
-    all_patterns = []
-
-    # SHAPE sweep (primary interest)
-    print("  - SHAPE sweep...")
-    shape_patterns = []
-    for shape in [0.0, 0.15, 0.30, 0.50, 0.70, 0.85, 1.0]:
-        pattern = run_pattern_viz(args.pattern_viz, shape=shape, energy=0.6, seed=args.seed)
-        shape_patterns.append(pattern)
-    all_patterns.append(("SHAPE Sweep (stable to wild)", shape_patterns, "shape"))
-
-    # ENERGY sweep
-    print("  - ENERGY sweep...")
-    energy_patterns = []
-    for energy in [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]:
-        pattern = run_pattern_viz(args.pattern_viz, energy=energy, shape=0.3, seed=args.seed)
-        energy_patterns.append(pattern)
-    all_patterns.append(("ENERGY Sweep (sparse to dense)", energy_patterns, "energy"))
-
-    # AXIS X sweep
-    print("  - AXIS X sweep...")
-    axis_x_patterns = []
-    for axis_x in [0.0, 0.25, 0.5, 0.75, 1.0]:
-        pattern = run_pattern_viz(args.pattern_viz, axis_x=axis_x, shape=0.3, energy=0.6, seed=args.seed)
-        axis_x_patterns.append(pattern)
-    all_patterns.append(("AXIS X Sweep (downbeat to offbeat bias)", axis_x_patterns, "axis_x"))
-
-    # AXIS Y sweep
-    print("  - AXIS Y sweep...")
-    axis_y_patterns = []
-    for axis_y in [0.0, 0.25, 0.5, 0.75, 1.0]:
-        pattern = run_pattern_viz(args.pattern_viz, axis_y=axis_y, shape=0.3, energy=0.6, seed=args.seed)
-        axis_y_patterns.append(pattern)
-    all_patterns.append(("AXIS Y Sweep (bar start to bar end bias)", axis_y_patterns, "axis_y"))
-
-    # DRIFT sweep (voice independence)
-    print("  - DRIFT sweep...")
-    drift_patterns = []
-    for drift in [0.0, 0.25, 0.5, 0.75, 1.0]:
-        pattern = run_pattern_viz(args.pattern_viz, drift=drift, shape=0.4, energy=0.6, seed=args.seed)
-        drift_patterns.append(pattern)
-    all_patterns.append(("DRIFT Sweep (locked to independent)", drift_patterns, "drift"))
-
-    # ACCENT sweep (velocity dynamics)
-    print("  - ACCENT sweep...")
-    accent_patterns = []
-    for accent in [0.0, 0.25, 0.5, 0.75, 1.0]:
-        pattern = run_pattern_viz(args.pattern_viz, accent=accent, shape=0.3, energy=0.6, seed=args.seed)
-        accent_patterns.append(pattern)
-    all_patterns.append(("ACCENT Sweep (flat to punchy)", accent_patterns, "accent"))
-
-    # Interesting combinations: SHAPE x ENERGY matrix (3x3)
-    print("  - SHAPE x ENERGY matrix...")
-    matrix_patterns = []
-    for energy in [0.3, 0.6, 0.9]:
-        for shape in [0.0, 0.5, 1.0]:
-            pattern = run_pattern_viz(args.pattern_viz, shape=shape, energy=energy, seed=args.seed)
-            matrix_patterns.append(pattern)
-    all_patterns.append(("SHAPE x ENERGY Matrix", matrix_patterns, None))
-
-    # Different seeds (showing variation) - with more seeds
-    print("  - Seed variation...")
-    seed_patterns = []
-    for seed in [0xDEADBEEF, 0xCAFEBABE, 0x12345678, 0xABCD1234, 0xBEEFCAFE, 0x87654321]:
-        pattern = run_pattern_viz(args.pattern_viz, shape=0.5, energy=0.6, seed=seed)
-        seed_patterns.append(pattern)
-    all_patterns.append(("Seed Variation (same params, different patterns)", seed_patterns, None))
-
-    # Wild variations (high SHAPE with different seeds)
-    print("  - Wild variations...")
-    wild_patterns = []
-    for seed in [0x11111111, 0x22222222, 0x33333333, 0x44444444]:
-        pattern = run_pattern_viz(args.pattern_viz, shape=0.9, energy=0.7, seed=seed)
-        wild_patterns.append(pattern)
-    all_patterns.append(("Wild Patterns (SHAPE=0.9)", wild_patterns, "shape"))
+    def run_many(param_sets: Iterable[dict]) -> list[Pattern]:
+        return run_pattern_viz_many(args.pattern_viz, param_sets)
 
-    # Minimal/sparse patterns
-    print("  - Minimal patterns...")
-    minimal_patterns = []
-    for energy in [0.1, 0.2, 0.3]:
-        for seed in [0xAAAAAAAA, 0xBBBBBBBB]:
-            pattern = run_pattern_viz(args.pattern_viz, shape=0.2, energy=energy, seed=seed)
-            minimal_patterns.append(pattern)
-    all_patterns.append(("Minimal Patterns (low energy)", minimal_patterns, "energy"))
-
-    # 2D Sweep: SHAPE x DRIFT
-    print("  - SHAPE x DRIFT matrix...")
-    shape_drift_patterns = []
-    for shape in [0.0, 0.3, 0.6, 1.0]:
-        for drift in [0.0, 0.5, 1.0]:
-            pattern = run_pattern_viz(args.pattern_viz, shape=shape, drift=drift, energy=0.6, seed=args.seed)
-            shape_drift_patterns.append(pattern)
-    all_patterns.append(("SHAPE x DRIFT Matrix", shape_drift_patterns, None))
-
-    # 2D Sweep: SHAPE x AXIS X
-    print("  - SHAPE x AXIS X matrix...")
-    shape_axisx_patterns = []
-    for shape in [0.0, 0.3, 0.6, 1.0]:
-        for axis_x in [0.0, 0.5, 1.0]:
-            pattern = run_pattern_viz(args.pattern_viz, shape=shape, axis_x=axis_x, energy=0.6, seed=args.seed)
-            shape_axisx_patterns.append(pattern)
-    all_patterns.append(("SHAPE x AXIS X Matrix", shape_axisx_patterns, None))
-
-    # 2D Sweep: SHAPE x AXIS Y
-    print("  - SHAPE x AXIS Y matrix...")
-    shape_axisy_patterns = []
-    for shape in [0.0, 0.3, 0.6, 1.0]:
-        for axis_y in [0.0, 0.5, 1.0]:
-            pattern = run_pattern_viz(args.pattern_viz, shape=shape, axis_y=axis_y, energy=0.6, seed=args.seed)
-            shape_axisy_patterns.append(pattern)
-    all_patterns.append(("SHAPE x AXIS Y Matrix", shape_axisy_patterns, None))
-
-    # 2D Sweep: SHAPE x ACCENT
-    print("  - SHAPE x ACCENT matrix...")
-    shape_accent_patterns = []
-    for shape in [0.0, 0.3, 0.6, 1.0]:
-        for accent in [0.0, 0.5, 1.0]:
-            pattern = run_pattern_viz(args.pattern_viz, shape=shape, accent=accent, energy=0.6, seed=args.seed)
-            shape_accent_patterns.append(pattern)
-    all_patterns.append(("SHAPE x ACCENT Matrix", shape_accent_patterns, None))
+    all_patterns = []
+    sections_by_tag: dict[str, list[Pattern]] = {}
+    step_stats_by_tag: dict[str, StepAccumulator] = {}
+    default_seed_steps = StepAccumulator()
+
+    def add_section(tag: str, section_patterns: list[Pattern], highlight: Optional[str], first: bool = False):
+        """Register a pattern section for rendering, statistics lookup and step counts."""
+        entry = (tag, section_patterns, highlight)
+        if first:
+            all_patterns.insert(0, entry)
+        else:
+            all_patterns.append(entry)
+        sections_by_tag[tag] = section_patterns
+
+        # Fold the new patterns into the running step statistics now, so the
+        # statistics phase does not need another pass over every pattern
+        step_stats_by_tag[tag] = StepAccumulator()
+        step_stats_by_tag[tag].extend(section_patterns)
+        if "Seed" not in tag:
+            default_seed_steps.extend(section_patterns)
+
+    for title, label, highlight, fixed, swept in SWEEPS:
+        print(f"  - {label}...")
+        swept_names = [name for name, _ in swept]
+        section_patterns = run_many(
+            {"seed": args.seed, **dict(fixed), **dict(zip(swept_names, combo))}
+            for combo in itertools.product(*(values for _, values in swept))
+        )
+        add_section(title, section_patterns, highlight)
 
     # Named Preset Patterns with musical descriptions
     print("  - Named presets...")
 
-    # Define musical presets: (name, description, params)
-    presets = [
-        # Classic Four-on-Floor Techno
-        ("Four on Floor", "Classic techno kick pattern, minimal complexity", {
-            "shape": 0.0, "energy": 0.5, "axis_x": 0.0, "axis_y": 0.5, "drift": 0.0, "accent": 0.6
-        }),
-        # House with Offbeat Hats
-        ("House Groove", "Driving house with offbeat emphasis", {
-            "shape": 0.15, "energy": 0.6, "axis_x": 0.6, "axis_y": 0.5, "drift": 0.3, "accent": 0.5
-        }),
-        # Tribal / African-influenced
-        ("Tribal Syncopation", "Syncopated patterns, call-and-response feel", {
-            "shape": 0.4, "energy": 0.65, "axis_x": 0.4, "axis_y": 0.6, "drift": 0.5, "accent": 0.7
-        }),
-        # Breakbeat
-        ("Breakbeat", "Broken rhythms, snare emphasis", {
-            "shape": 0.35, "energy": 0.55, "axis_x": 0.5, "axis_y": 0.3, "drift": 0.6, "accent": 0.65
-        }),
-        # Industrial
-        ("Industrial Stomp", "Heavy, aggressive, distorted", {
-            "shape": 0.2, "energy": 0.8, "axis_x": 0.2, "axis_y": 0.4, "drift": 0.2, "accent": 0.9
-        }),
-        # Minimal Techno
-        ("Minimal Pulse", "Sparse, hypnotic, space between notes", {
-            "shape": 0.1, "energy": 0.3, "axis_x": 0.3, "axis_y": 0.5, "drift": 0.1, "accent": 0.4
-        }),
-        # Dub Techno
-        ("Dub Techno", "Laid back, dubby, chord hits", {
-            "shape": 0.25, "energy": 0.45, "axis_x": 0.4, "axis_y": 0.6, "drift": 0.4, "accent": 0.5
-        }),
-        # Gabber / Hardcore
-        ("Gabber Assault", "Fast, aggressive, constant pressure", {
-            "shape": 0.3, "energy": 0.95, "axis_x": 0.3, "axis_y": 0.5, "drift": 0.1, "accent": 0.95
-        }),
-        # IDM Complex
-        ("IDM Complexity", "Irregular patterns, algorithmic feel", {
-            "shape": 0.7, "energy": 0.6, "axis_x": 0.6, "axis_y": 0.4, "drift": 0.7, "accent": 0.6
-        }),
-        # IDM Chaos (Aphex-style)
-        ("IDM Chaos", "Maximum unpredictability, glitchy", {
-            "shape": 1.0, "energy": 0.7, "axis_x": 0.5, "axis_y": 0.5, "drift": 0.9, "accent": 0.7
-        }),
-        # Ambient Percussion
-        ("Ambient Scatter", "Sparse, random, textural", {
-            "shape": 0.8, "energy": 0.25, "axis_x": 0.7, "axis_y": 0.7, "drift": 0.8, "accent": 0.3
-        }),
-        # Half-time
-        ("Half-Time Feel", "Emphasis on beats 1 and 3", {
-            "shape": 0.15, "energy": 0.4, "axis_x": 0.0, "axis_y": 0.3, "drift": 0.2, "accent": 0.6
-        }),
-        # Polyrhythmic
-        ("Polyrhythmic", "Multiple simultaneous rhythmic layers", {
-            "shape": 0.5, "energy": 0.6, "axis_x": 0.5, "axis_y": 0.5, "drift": 0.6, "accent": 0.55
-        }),
-        # Acid Techno
-        ("Acid Drive", "Relentless, 303-era inspired", {
-            "shape": 0.25, "energy": 0.7, "axis_x": 0.35, "axis_y": 0.5, "drift": 0.3, "accent": 0.75
-        }),
-        # Detroit Techno
-        ("Detroit Soul", "Funky, machine-groove, swing", {
-            "shape": 0.2, "energy": 0.55, "axis_x": 0.45, "axis_y": 0.55, "drift": 0.35, "accent": 0.6
-        }),
-        # Berlin Minimal
-        ("Berlin Loop", "Hypnotic, repetitive, subtle variation", {
-            "shape": 0.1, "energy": 0.5, "axis_x": 0.5, "axis_y": 0.5, "drift": 0.15, "accent": 0.5
-        }),
-    ]
-
-    preset_patterns = []
-    for preset_name, desc, params in presets:
-        pattern = run_pattern_viz(
-            args.pattern_viz,
-            shape=params["shape"],
-            energy=params["energy"],
-            axis_x=params["axis_x"],
-            axis_y=params["axis_y"],
-            drift=params["drift"],
-            accent=params["accent"],
-            seed=args.seed,
-            name=preset_name,
-            description=desc,
-        )
-        preset_patterns.append(pattern)
-    all_patterns.insert(0, ("Named Presets (Musical Styles)", preset_patterns, None))
+    preset_patterns = run_many(
+        {**dict(zip(PRESET_PARAMS, values)), "seed": args.seed, "name": preset_name, "description": desc}
+        for preset_name, desc, values in PRESETS
+    )
+    add_section("Named Presets (Musical Styles)", preset_patterns, None, first=True)
 
     # Compute statistics for each pattern group
     print("Computing statistics...")
     statistics = []
 
-    # Group patterns by seed type for statistics
+    # Group patterns by seed type for statistics. Step statistics were
+    # accumulated as each section was added.
     seed_groups = [
-        ("All Patterns (Default Seed)", [p for name, pats, _ in all_patterns if "Seed" not in name for p in pats]),
-        ("Seed Variation Set", seed_patterns),
-        ("Wild Patterns (High SHAPE)", wild_patterns),
-        ("Named Presets", preset_patterns),
+        ("All Patterns (Default Seed)", list(itertools.chain.from_iterable(
+            pats for tag, pats in sections_by_tag.items() if "Seed" not in tag
+        )), default_seed_steps),
+        ("Seed Variation Set", sections_by_tag[SEED_VARIATION_SECTION], step_stats_by_tag[SEED_VARIATION_SECTION]),
+        ("Wild Patterns (High SHAPE)", sections_by_tag[WILD_SECTION], step_stats_by_tag[WILD_SECTION]),
+        ("Named Presets", preset_patterns, step_stats_by_tag["Named Presets (Musical Styles)"]),
     ]
 
-    for group_name, group_patterns in seed_groups:
+    for group_name, group_patterns, group_steps in seed_groups:
         if not group_patterns:
             continue
 
-        # Compute step-level statistics
-        step_stats = compute_step_statistics(group_patterns)
+        # Step-level statistics from the running accumulator
+        step_stats = group_steps.statistics()
 
         # Compute seed variation metrics
         seed_variation = compute_seed_variation(group_patterns)
@@ -2307,23 +2754,19 @@ def main():
           f"Composite={pentagon_stats['total']['composite']:.0%}")
     print(f"  - ALIGNMENT SCORE: {alignment:.1%} (hill-climbing metric)")
 
-    # Generate HTML
-    print("Generating HTML...")
-    html = generate_html(all_patterns, "DaisySP IDM Grids - Pattern Visualization", statistics, pentagon_stats)
-
-    # Generate text summary
-    print("Generating text summary...")
-    summary = generate_summary_text(all_patterns, statistics, "DaisySP IDM Grids - Pattern Statistics", pentagon_stats)
-
     # Ensure output directory exists
     args.output.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write HTML output
-    args.output.write_text(html)
+    # Generate HTML, streamed straight to disk
+    print("Generating HTML...")
+    with args.output.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        generate_html(all_patterns, "DaisySP IDM Grids - Pattern Visualization", statistics, pentagon_stats, out=f)
     print(f"HTML output written to: {args.output}")
 
-    # Write text summary
-    args.summary.write_text(summary)
+    # Generate text summary, streamed straight to disk
+    print("Generating text summary...")
+    with args.summary.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        generate_summary_text(all_patterns, statistics, "DaisySP IDM Grids - Pattern Statistics", pentagon_stats, out=f)
     print(f"Text summary written to: {args.summary}")
 
     return 0
@@ -9,17 +9,12 @@ namespace daisysp_idm_grids
 // Bjorklund Euclidean Algorithm
 // =============================================================================
 
-uint64_t GenerateEuclidean(int hits, int steps)
+/**
+ * Bucket-fill Euclidean pattern for 0 < hits < steps <= 64 (inputs already
+ * validated by GenerateEuclidean).
+ */
+static uint64_t ComputeEuclidean(int hits, int steps)
 {
-    // Clamp inputs to valid ranges
-    if (hits < 0) hits = 0;
-    if (hits > steps) hits = steps;
-    if (steps < 1 || steps > 64) return 0;
-
-    // Special cases
-    if (hits == 0) return 0;
-    if (hits >= steps) return (1ULL << steps) - 1;  // All steps
-
     // Bjorklund algorithm: distribute hits evenly
     // We use a simple bucket-fill approach:
     // For each step i, accumulate (hits / steps).
@@ -58,6 +53,38 @@ uint64_t GenerateEuclidean(int hits, int steps)
     return pattern;
 }
 
+// Patterns for steps <= kEuclideanCacheSteps are memoized: the input space is
+// tiny and the result is recomputed for every voice on every bar. Entries are
+// stored triangularly (row 'steps' holds hits 0..steps) as uint32_t, ~2.2KB.
+// A zero entry means "not computed yet"; every cached (0 < hits < steps)
+// pattern has at least one hit, so it can never be zero once filled.
+static constexpr int kEuclideanCacheSteps = 32;
+static uint32_t s_euclideanCache[(kEuclideanCacheSteps + 1) * (kEuclideanCacheSteps + 2) / 2];
+
+uint64_t GenerateEuclidean(int hits, int steps)
+{
+    // Clamp inputs to valid ranges
+    if (hits < 0) hits = 0;
+    if (hits > steps) hits = steps;
+    if (steps < 1 || steps > 64) return 0;
+
+    // Special cases
+    if (hits == 0) return 0;
+    if (hits >= steps) return (1ULL << steps) - 1;  // All steps
+
+    if (steps > kEuclideanCacheSteps)
+    {
+        return ComputeEuclidean(hits, steps);
+    }
+
+    uint32_t& cached = s_euclideanCache[steps * (steps + 1) / 2 + hits];
+    if (cached == 0)
+    {
+        cached = static_cast<uint32_t>(ComputeEuclidean(hits, steps));
+    }
+    return cached;
+}
+
 // =============================================================================
 // Pattern Rotation
 // =============================================================================
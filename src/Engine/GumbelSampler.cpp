@@ -66,10 +66,11 @@ void ComputeGumbelScores(const float* weights,
             continue;
         }
 
-        // Compute log(weight) + Gumbel(seed, step)
+        // Compute log(weight) + Gumbel(seed, step). HashToFloat already
+        // clamps to (epsilon, 1-epsilon), so the noise -log(-log(u)) is
+        // taken directly instead of re-clamping through UniformToGumbel().
         float uniform = HashToFloat(seed, step);
-        float gumbel = UniformToGumbel(uniform);
-        outScores[step] = std::log(weight) + gumbel;
+        outScores[step] = std::log(weight) - std::log(-std::log(uniform));
     }
 }
 
@@ -141,6 +142,47 @@ bool CheckSpacingValid(uint64_t selectedMask, int candidateStep, int minSpacing,
     return true;
 }
 
+/**
+ * Mask of steps closer than minSpacing (circular distance) to a step: the
+ * candidates CheckSpacingValid() rejects once that step is selected.
+ *
+ * GetSpacingExclusionMask() is not reused because it does not match
+ * CheckSpacingValid(): it also excludes steps at distance == minSpacing,
+ * and its single wrap mis-indexes offsets when minSpacing >= patternLength.
+ * Selection must reject exactly what CheckSpacingValid() rejects, so the
+ * neighborhood is built here with strict '<' and a full modulo.
+ */
+static uint64_t GetSpacingNeighborhood(int step, int minSpacing, int patternLength)
+{
+    uint64_t mask = 0;
+    for (int offset = 1; offset < minSpacing && offset < patternLength; ++offset)
+    {
+        mask |= 1ULL << ((step + offset) % patternLength);
+        mask |= 1ULL << ((step - offset + patternLength) % patternLength);
+    }
+    return mask;
+}
+
+/**
+ * Union of the spacing neighborhoods of every selected step
+ */
+static uint64_t GetSpacingForbiddenMask(uint64_t selectedMask, int minSpacing, int patternLength)
+{
+    uint64_t forbidden = 0;
+    if (minSpacing <= 1)
+    {
+        return forbidden;
+    }
+    // Visit only the selected steps, lowest set bit first
+    while (selectedMask != 0)
+    {
+        int step = __builtin_ctzll(selectedMask);
+        forbidden |= GetSpacingNeighborhood(step, minSpacing, patternLength);
+        selectedMask &= selectedMask - 1;
+    }
+    return forbidden;
+}
+
 int GetMinSpacingForZone(EnergyZone zone)
 {
     switch (zone)
@@ -166,31 +208,17 @@ int GetMinSpacingForZone(EnergyZone zone)
 // Selection Functions
 // =============================================================================
 
-int FindBestStep(const float* scores,
-                 uint64_t eligibilityMask,
-                 uint64_t selectedMask,
-                 int patternLength,
-                 int minSpacing)
+/**
+ * Highest-scoring step in candidateMask (the lowest step wins ties), or -1
+ */
+static int FindBestCandidate(const float* scores, uint64_t candidateMask, int patternLength)
 {
     float bestScore = kMinScore;
     int bestStep = -1;
 
     for (int step = 0; step < patternLength && step < 64; ++step)
     {
-        // Check eligibility
-        if ((eligibilityMask & (1ULL << step)) == 0)
-        {
-            continue;
-        }
-
-        // Check already selected
-        if ((selectedMask & (1ULL << step)) != 0)
-        {
-            continue;
-        }
-
-        // Check spacing constraint
-        if (!CheckSpacingValid(selectedMask, step, minSpacing, patternLength))
+        if ((candidateMask & (1ULL << step)) == 0)
         {
             continue;
         }
@@ -206,6 +234,47 @@ int FindBestStep(const float* scores,
     return bestStep;
 }
 
+/**
+ * One greedy selection pass over steps ranked by descending score: take each
+ * step that is neither selected nor forbidden until targetCount is reached,
+ * adding its spacing neighborhood to the forbidden set.
+ */
+static void SelectRankedSteps(const uint8_t* order,
+                              int orderCount,
+                              uint64_t forbiddenMask,
+                              int minSpacing,
+                              int patternLength,
+                              int targetCount,
+                              uint64_t& selectedMask,
+                              int& selectedCount)
+{
+    for (int i = 0; i < orderCount && selectedCount < targetCount; ++i)
+    {
+        int step = order[i];
+        uint64_t bit = 1ULL << step;
+        if (((selectedMask | forbiddenMask) & bit) != 0)
+        {
+            continue;
+        }
+
+        selectedMask |= bit;
+        forbiddenMask |= GetSpacingNeighborhood(step, minSpacing, patternLength);
+        selectedCount++;
+    }
+}
+
+int FindBestStep(const float* scores,
+                 uint64_t eligibilityMask,
+                 uint64_t selectedMask,
+                 int patternLength,
+                 int minSpacing)
+{
+    // Eligible, not yet selected, and clear of every selected step's spacing
+    uint64_t forbiddenMask = GetSpacingForbiddenMask(selectedMask, minSpacing, patternLength);
+    return FindBestCandidate(scores, eligibilityMask & ~selectedMask & ~forbiddenMask,
+                             patternLength);
+}
+
 uint64_t SelectHitsGumbelSimple(const float* weights,
                                  uint64_t eligibilityMask,
                                  int targetCount,
@@ -239,63 +308,55 @@ uint64_t SelectHitsGumbelTopK(const float* weights,
     float scores[kMaxSteps];
     ComputeGumbelScores(weights, seed, patternLength, scores);
 
-    // Greedily select top-K steps respecting spacing
-    uint64_t selectedMask = 0;
-    int selectedCount = 0;
-
-    // First pass: try to hit target with spacing constraints
-    while (selectedCount < targetCount)
+    // Rank the candidate steps by descending score once. Insertion sort is
+    // stable, so equal scores keep the lowest step first, as a linear argmax
+    // scan would. Ineligible steps and zero-weight steps (kMinScore) can
+    // never be picked and are left out.
+    uint8_t order[kMaxSteps];
+    int orderCount = 0;
+    for (int step = 0; step < patternLength; ++step)
     {
-        int bestStep = FindBestStep(scores, eligibilityMask, selectedMask,
-                                    patternLength, minSpacing);
-
-        if (bestStep < 0)
+        if ((eligibilityMask & (1ULL << step)) == 0 || !(scores[step] > kMinScore))
         {
-            // No more valid steps with current spacing
-            break;
+            continue;
         }
 
-        selectedMask |= (1ULL << bestStep);
-        selectedCount++;
+        int pos = orderCount++;
+        while (pos > 0 && scores[order[pos - 1]] < scores[step])
+        {
+            order[pos] = order[pos - 1];
+            --pos;
+        }
+        order[pos] = static_cast<uint8_t>(step);
     }
 
+    // Greedily select top-K steps respecting spacing. Each pass walks the
+    // ranking once, taking every step that is not yet selected and not in
+    // forbiddenMask (the steps ruled out by the pass's spacing, grown by one
+    // precomputed neighborhood per pick).
+    uint64_t selectedMask = 0;
+    int selectedCount = 0;
+
+    // First pass: try to hit target with spacing constraints
+    SelectRankedSteps(order, orderCount, 0, minSpacing, patternLength,
+                      targetCount, selectedMask, selectedCount);
+
     // Second pass: if we didn't hit target and spacing was limiting,
     // try again with relaxed spacing
     if (selectedCount < targetCount && minSpacing > 0)
     {
         int relaxedSpacing = minSpacing / 2;
-
-        while (selectedCount < targetCount)
-        {
-            int bestStep = FindBestStep(scores, eligibilityMask, selectedMask,
-                                        patternLength, relaxedSpacing);
-
-            if (bestStep < 0)
-            {
-                break;
-            }
-
-            selectedMask |= (1ULL << bestStep);
-            selectedCount++;
-        }
+        SelectRankedSteps(order, orderCount,
+                          GetSpacingForbiddenMask(selectedMask, relaxedSpacing, patternLength),
+                          relaxedSpacing, patternLength,
+                          targetCount, selectedMask, selectedCount);
     }
 
     // Final pass: no spacing constraint if still short
     if (selectedCount < targetCount)
     {
-        while (selectedCount < targetCount)
-        {
-            int bestStep = FindBestStep(scores, eligibilityMask, selectedMask,
-                                        patternLength, 0);
-
-            if (bestStep < 0)
-            {
-                break;  // No more eligible steps at all
-            }
-
-            selectedMask |= (1ULL << bestStep);
-            selectedCount++;
-        }
+        SelectRankedSteps(order, orderCount, 0, 0, patternLength,
+                          targetCount, selectedMask, selectedCount);
     }
 
     return selectedMask;
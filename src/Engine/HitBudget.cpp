@@ -85,14 +85,8 @@ int ComputeEffectiveHitCount(int euclideanK, int budgetK, float shape, float ene
 
 int CountBits(uint64_t mask)
 {
-    // Brian Kernighan's algorithm
-    int count = 0;
-    while (mask)
-    {
-        mask &= (mask - 1);
-        count++;
-    }
-    return count;
+    // Compiler builtin: hardware popcnt where available, libgcc otherwise
+    return __builtin_popcountll(mask);
 }
 
 int ClampPatternLength(int patternLength)
@@ -56,6 +56,40 @@ TEST_CASE("GenerateEuclidean handles edge cases", "[euclidean][generation]")
     REQUIRE(GenerateEuclidean(4, 65) == 0);  // Now > 64 is invalid
 }
 
+TEST_CASE("GenerateEuclidean cache returns stable results", "[euclidean][generation]")
+{
+    // Patterns up to 32 steps are memoized; repeated calls must match the
+    // first (computed) result
+    uint64_t first = GenerateEuclidean(5, 32);
+    REQUIRE(first == 0x4102081);
+    for (int i = 0; i < 3; ++i)
+    {
+        REQUIRE(GenerateEuclidean(5, 32) == first);
+    }
+
+    // Cache boundary: 32 steps is cached, 33 steps is computed directly.
+    // E(32, 33) sets bit 32, which a 32-bit cache entry could not hold.
+    REQUIRE(GenerateEuclidean(31, 32) == 0xFFFFFFFDull);
+    REQUIRE(GenerateEuclidean(31, 32) == 0xFFFFFFFDull);
+    REQUIRE(GenerateEuclidean(32, 33) == 0x1FFFFFFFDull);
+    REQUIRE(GenerateEuclidean(32, 33) == 0x1FFFFFFFDull);
+    REQUIRE(GenerateEuclidean(8, 32) == 0x11111111ull);
+    REQUIRE(GenerateEuclidean(8, 33) == 0x22222221ull);
+    REQUIRE(GenerateEuclidean(16, 64) == 0x1111111111111111ull);
+
+    // Empty and full patterns never touch the cache (a zero entry means
+    // "not computed"), so they stay correct on repeat and do not disturb
+    // the cached neighbors
+    for (int i = 0; i < 2; ++i)
+    {
+        REQUIRE(GenerateEuclidean(0, 16) == 0);
+        REQUIRE(GenerateEuclidean(1, 16) == 0x1);
+        REQUIRE(GenerateEuclidean(16, 16) == 0xFFFF);
+        REQUIRE(GenerateEuclidean(40, 32) == 0xFFFFFFFFull);  // hits clamped to steps
+        REQUIRE(GenerateEuclidean(33, 33) == 0x1FFFFFFFFull);
+    }
+}
+
 TEST_CASE("RotatePattern shifts bits correctly", "[euclidean][rotation]")
 {
     // Pattern: 00010001 (bits 0 and 4 set)
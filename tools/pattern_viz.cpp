@@ -19,11 +19,13 @@
  *   --sweep=shape    Sweep a parameter (shape, energy, axis-x, axis-y)
  *   --output=file    Output to file (default: stdout)
  *   --format=grid    Output format: grid, csv, mask
+ *   --batch          Read one set of pattern options per line from stdin
  *
  * Examples:
  *   ./build/pattern_viz --energy=0.7 --shape=0.5
  *   ./build/pattern_viz --sweep=shape --output=patterns.txt
  *   ./build/pattern_viz --format=csv > patterns.csv
+ *   printf -- '--shape=0.1\n--shape=0.9\n' | ./build/pattern_viz --batch --format=csv
  */
 
 #include <iostream>
@@ -59,10 +61,8 @@ static bool g_patternFieldConfigModified = false;
 
 static int CountHits(uint32_t mask, int length)
 {
-    int count = 0;
-    for (int i = 0; i < length; ++i)
-        if ((mask & (1U << i)) != 0) count++;
-    return count;
+    uint32_t lengthMask = (length >= 32) ? 0xFFFFFFFFu : ((1U << length) - 1);
+    return __builtin_popcount(mask & lengthMask);
 }
 
 static void PrintPatternGrid(std::ostream& out, const PatternParams& params, const PatternResult& pattern)
@@ -331,6 +331,31 @@ static const char* ParseString(const char* arg)
     return eq + 1;
 }
 
+// Per-pattern options, accepted both on the command line and on --batch lines.
+// Returns false if arg is not one of them.
+static bool ParsePatternArg(const char* arg, PatternParams& params)
+{
+    if (strncmp(arg, "--energy=", 9) == 0)
+        params.energy = ParseFloat(arg);
+    else if (strncmp(arg, "--shape=", 8) == 0)
+        params.shape = ParseFloat(arg);
+    else if (strncmp(arg, "--axis-x=", 9) == 0)
+        params.axisX = ParseFloat(arg);
+    else if (strncmp(arg, "--axis-y=", 9) == 0)
+        params.axisY = ParseFloat(arg);
+    else if (strncmp(arg, "--drift=", 8) == 0)
+        params.drift = ParseFloat(arg);
+    else if (strncmp(arg, "--accent=", 9) == 0)
+        params.accent = ParseFloat(arg);
+    else if (strncmp(arg, "--seed=", 7) == 0)
+        params.seed = ParseSeed(arg);
+    else if (strncmp(arg, "--length=", 9) == 0)
+        params.patternLength = ParseInt(arg);
+    else
+        return false;
+    return true;
+}
+
 static Genre ParseGenre(const char* arg)
 {
     const char* val = ParseString(arg);
@@ -378,6 +403,9 @@ Options:
   --sweep=param    Sweep parameter: shape, energy, axis-x, axis-y
   --output=file    Output to file (default: stdout)
   --format=grid    Output format: grid, csv, mask
+  --batch          Generate one pattern per stdin line; each line holds
+                   per-pattern options (--energy= ... --length=) applied on
+                   top of the command line. CSV output has a single header.
 
 Firmware-matching options:
   --firmware       Use all firmware defaults (recommended)
@@ -415,6 +443,7 @@ Examples:
   ./build/pattern_viz --sweep=shape --output=shape_sweep.txt
   ./build/pattern_viz --format=csv > patterns.csv
   ./build/pattern_viz --sweep=energy --format=mask
+  printf -- '--shape=0.1\n--shape=0.9\n' | ./build/pattern_viz --batch --format=csv
 
 Fill pattern examples:
   ./build/pattern_viz --energy=0.5 --fill                      # Sweep progress 0.25,0.5,0.75,1.0
@@ -439,34 +468,24 @@ int main(int argc, char* argv[])
     bool debugEuclidean = false; // Show per-channel euclidean params
     bool fillSweep = false;      // Generate fill patterns at multiple progress points
     float fillProgressValue = -1.0f;  // Specific fill progress (-1 = use default sweep)
+    bool batch = false;          // Read per-pattern options from stdin
 
     // Parse arguments
     for (int i = 1; i < argc; ++i)
     {
         const char* arg = argv[i];
 
-        if (strncmp(arg, "--energy=", 9) == 0)
-            params.energy = ParseFloat(arg);
-        else if (strncmp(arg, "--shape=", 8) == 0)
-            params.shape = ParseFloat(arg);
-        else if (strncmp(arg, "--axis-x=", 9) == 0)
-            params.axisX = ParseFloat(arg);
-        else if (strncmp(arg, "--axis-y=", 9) == 0)
-            params.axisY = ParseFloat(arg);
-        else if (strncmp(arg, "--drift=", 8) == 0)
-            params.drift = ParseFloat(arg);
-        else if (strncmp(arg, "--accent=", 9) == 0)
-            params.accent = ParseFloat(arg);
-        else if (strncmp(arg, "--seed=", 7) == 0)
-            params.seed = ParseSeed(arg);
-        else if (strncmp(arg, "--length=", 9) == 0)
-            params.patternLength = ParseInt(arg);
-        else if (strncmp(arg, "--output=", 9) == 0)
+        if (ParsePatternArg(arg, params))
+            continue;
+
+        if (strncmp(arg, "--output=", 9) == 0)
             outputFile = ParseString(arg);
         else if (strncmp(arg, "--format=", 9) == 0)
             format = ParseString(arg);
         else if (strncmp(arg, "--sweep=", 8) == 0)
             sweep = ParseString(arg);
+        else if (strcmp(arg, "--batch") == 0)
+            batch = true;
         // Firmware-matching options
         else if (strcmp(arg, "--firmware") == 0)
         {
@@ -600,6 +619,54 @@ int main(int argc, char* argv[])
         out = &fileOut;
     }
 
+    // Batch mode: one pattern per stdin line, so callers that need many
+    // patterns pay for a single process start
+    if (batch)
+    {
+        bool csvHeader = true;
+        std::string line;
+        while (std::getline(std::cin, line))
+        {
+            PatternParams lineParams = params;
+            std::istringstream tokens(line);
+            std::string token;
+            bool hasOptions = false;
+            while (tokens >> token)
+            {
+                if (!ParsePatternArg(token.c_str(), lineParams))
+                {
+                    std::cerr << "Unknown batch argument: " << token << "\n";
+                    return 1;
+                }
+                hasOptions = true;
+            }
+            if (!hasOptions)
+                continue;
+
+            // Recompute auto-euclidean for each batch line
+            if (autoEuclidean)
+            {
+                EnergyZone zone = GetEnergyZone(lineParams.energy);
+                lineParams.euclideanRatio = GetGenreEuclideanRatio(
+                    lineParams.genre, lineParams.axisX, zone, lineParams.shape);
+            }
+
+            PatternResult pattern;
+            GeneratePattern(lineParams, pattern);
+
+            if (format == "grid")
+                PrintPatternGrid(*out, lineParams, pattern);
+            else if (format == "csv")
+            {
+                PrintPatternCSV(*out, lineParams, pattern, csvHeader);
+                csvHeader = false;
+            }
+            else if (format == "mask")
+                PrintPatternMask(*out, lineParams, pattern);
+        }
+        return 0;
+    }
+
     // Generate fill patterns (JSON output)
     if (fillSweep)
     {